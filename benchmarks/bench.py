@@ -0,0 +1,305 @@
+#!/usr/bin/env python3
+"""
+Набор измерений производительности основных операций.
+
+Измеряет на синтетических тестах разного размера (generate_bank.py):
+
+    load_test              загрузка теста из JSON без кэша
+    list_available_tests   поиск файлов тестов (LIST_FILES файлов)
+    check_answer           проверка ответов: правильных, неправильных
+                           и с опечатками
+    get_random_questions   случайная выборка RANDOM_COUNT вопросов
+    sample_stratified      выборка RANDOM_COUNT вопросов по весам, долям
+                           сложности и минимумам по темам (QuestionSampler)
+    calculate_statistics   статистика по потоку ответов того же размера
+    save_test              сохранение теста в компактном виде
+
+Каждая операция выполняется несколько раз, в результат попадают минимальное
+и медианное время и время в пересчете на одну операцию. Результат можно
+сохранить как базовый (--save) и сравнивать с ним последующие запуски
+(--baseline): если минимальное время какой-либо операции выросло больше
+допустимого (--max-regression), скрипт завершается с кодом 1. Операции
+быстрее NOISE_FLOOR_S не проверяются: для них велик разброс измерений.
+
+Примеры использования:
+    python benchmarks/bench.py --sizes 10 1000 100000 --save baseline.json
+    python benchmarks/bench.py --baseline baseline.json --max-regression 0.25
+    python benchmarks/bench.py --sizes 10000000 --cases load_test save_test --repeat 1
+"""
+import argparse
+import itertools
+import json
+import os
+import platform
+import shutil
+import statistics
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from generate_bank import generate_bank  # noqa: E402
+from quizapp.engine import QuizEngine  # noqa: E402
+from quizapp.question import Question  # noqa: E402
+from quizapp.loader import (load_test, load_bank, save_test,  # noqa: E402
+                            list_available_tests, test_cache)
+from quizapp.results import calculate_statistics  # noqa: E402
+
+DEFAULT_SIZES = [10, 1000, 100000]
+MAX_SIZE = 10_000_000
+# Количество файлов для list_available_tests
+LIST_FILES = 200
+# Наибольшее количество проверяемых ответов в check_answer
+CHECK_SAMPLE = 20000
+# Размер выборки и количество выборок в get_random_questions
+RANDOM_COUNT = 20
+RANDOM_DRAWS = 200
+# Сложности, доли и темы вопросов для sample_stratified
+DIFFICULTY_SHARES = {'easy': 30, 'medium': 50, 'hard': 20}
+TAG_COUNT = 20
+# Операции быстрее этого времени не считаются замедлившимися: их разброс
+# сравним с самим временем
+NOISE_FLOOR_S = 0.001
+
+
+def bench_load_test(context):
+    path = context['path']
+
+    def run():
+        test_cache.invalidate(path)
+        load_test(path)
+    return run, 1
+
+
+def bench_list_available_tests(context):
+    directory = os.path.join(context['data_dir'], 'listing')
+    if not os.path.isdir(directory):
+        os.makedirs(os.path.join(directory, 'tests'))
+        for number in range(LIST_FILES):
+            generate_bank(os.path.join(directory, 'tests', f'test_{number}.json'), 1, seed=number)
+
+    def run():
+        previous = os.getcwd()
+        os.chdir(directory)
+        try:
+            list_available_tests()
+        finally:
+            os.chdir(previous)
+    return run, 1
+
+
+def bench_check_answer(context):
+    bank = context['bank']
+    engine = QuizEngine(bank)
+    pairs = []
+    step = max(1, len(bank) // CHECK_SAMPLE)
+    for index in range(0, len(bank), step):
+        question = bank[index]
+        answer = str(question.answer)
+        if question.correct_index is not None:
+            pairs.append((question, str(question.correct_index + 1)))
+            pairs.append((question, str((question.correct_index + 1) % len(question.options) + 1)))
+        else:
+            pairs.append((question, answer))
+            pairs.append((question, f' {answer.upper()} '))
+            # Опечатка: два последних символа переставлены
+            pairs.append((question, answer[:-2] + answer[-1:] + answer[-2:-1]))
+            pairs.append((question, 'неизвестно'))
+
+    def run():
+        for question, user_answer in pairs:
+            engine.check_answer(question, user_answer)
+    return run, len(pairs)
+
+
+def bench_get_random_questions(context):
+    engine = QuizEngine(context['bank'])
+
+    def run():
+        for seed in range(RANDOM_DRAWS):
+            engine.get_random_questions(RANDOM_COUNT, seed)
+    return run, RANDOM_DRAWS
+
+
+def bench_sample_stratified(context):
+    # Синтетический тест без метаданных: сложность, тема и вес задаются
+    # по номеру вопроса
+    difficulties = list(DIFFICULTY_SHARES)
+    questions = [Question(question.text, question.options, question.answer, question.aliases,
+                          (f'тема {index % TAG_COUNT}',), difficulties[index % len(difficulties)],
+                          1.0 + index % 3)
+                 for index, question in enumerate(context['bank'])]
+    engine = QuizEngine({'title': 'sample_stratified', 'questions': questions})
+    tags = {'тема 0': 2, 'тема 1': 2} if len(questions) >= RANDOM_COUNT else None
+
+    def run():
+        # Страты и таблицы псевдонимов строятся при прогреве measure
+        for seed in range(RANDOM_DRAWS):
+            engine.get_random_questions(RANDOM_COUNT, seed, DIFFICULTY_SHARES, tags, weighted=True)
+    return run, RANDOM_DRAWS
+
+
+def bench_calculate_statistics(context):
+    size = context['size']
+    samples = []
+    for question in itertools.islice(context['bank'], 1000):
+        kind = 'multiple_choice' if question.options is not None else 'text'
+        samples.append({'question': question.text, 'user_answer': str(question.answer),
+                        'is_correct': len(samples) % 3 != 0, 'type': kind})
+
+    def run():
+        calculate_statistics(itertools.islice(itertools.cycle(samples), size))
+    return run, size
+
+
+def bench_save_test(context):
+    bank = context['bank']
+    output = os.path.join(context['data_dir'], f"saved_{context['size']}.json")
+
+    def run():
+        save_test(bank, output, compact=True)
+    return run, 1
+
+
+CASES = {
+    'load_test': bench_load_test,
+    'list_available_tests': bench_list_available_tests,
+    'check_answer': bench_check_answer,
+    'get_random_questions': bench_get_random_questions,
+    'sample_stratified': bench_sample_stratified,
+    'calculate_statistics': bench_calculate_statistics,
+    'save_test': bench_save_test,
+}
+# Операции, время которых не зависит от размера теста
+SIZE_INDEPENDENT = {'list_available_tests'}
+
+
+def measure(run, ops, repeat):
+    """Выполняет run repeat раз после прогрева и возвращает сводку."""
+    run()
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        run()
+        times.append(time.perf_counter() - start)
+    best = min(times)
+    return {
+        'min_s': best,
+        'median_s': statistics.median(times),
+        'ops': ops,
+        'per_op_us': best / ops * 1e6
+    }
+
+
+def run_suite(sizes, cases, repeat, data_dir, seed=0):
+    """Выполняет измерения для всех размеров и операций.
+
+    Returns:
+        Словарь: ключ вида 'операция[размер]' -> сводка measure.
+    """
+    results = {}
+    for name in cases:
+        if name in SIZE_INDEPENDENT:
+            run, ops = CASES[name]({'data_dir': data_dir})
+            key = f'{name}[{LIST_FILES}]'
+            results[key] = measure(run, ops, repeat)
+            print(f"{key}: {results[key]['min_s'] * 1000:.2f} мс")
+
+    for size in sizes:
+        path = os.path.join(data_dir, f'bank_{size}_{seed}.json')
+        if not os.path.exists(path):
+            generate_bank(path, size, seed)
+        context = {'size': size, 'path': path, 'data_dir': data_dir, 'bank': load_bank(path)}
+        for name in cases:
+            if name in SIZE_INDEPENDENT:
+                continue
+            run, ops = CASES[name](context)
+            key = f'{name}[{size}]'
+            results[key] = measure(run, ops, repeat)
+            line = f"{key}: {results[key]['min_s'] * 1000:.2f} мс"
+            if ops > 1:
+                line += f" ({results[key]['per_op_us']:.2f} мкс на операцию)"
+            print(line)
+        test_cache.invalidate(path)
+    return results
+
+
+def compare(results, baseline, max_regression):
+    """Сравнивает результаты с базовыми.
+
+    Returns:
+        Список ключей операций, замедлившихся больше max_regression.
+    """
+    regressions = []
+    print(f"\n{'Операция':<36} {'база, мс':>10} {'сейчас, мс':>11} {'изменение':>10}")
+    for key, result in results.items():
+        base = baseline.get(key)
+        if base is None:
+            print(f"{key:<36} {'-':>10} {result['min_s'] * 1000:>11.2f} {'новая':>10}")
+            continue
+        change = result['min_s'] / base['min_s'] - 1 if base['min_s'] else 0.0
+        regressed = change > max_regression and result['min_s'] >= NOISE_FLOOR_S
+        print(f"{key:<36} {base['min_s'] * 1000:>10.2f} {result['min_s'] * 1000:>11.2f} "
+              f"{change:>+10.1%}{' !' if regressed else ''}")
+        if regressed:
+            regressions.append(key)
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Измерение производительности основных операций')
+    parser.add_argument('--sizes', type=int, nargs='+', default=DEFAULT_SIZES,
+                        help=f'Размеры тестов в вопросах, от 1 до {MAX_SIZE} '
+                             f'(по умолчанию: {" ".join(map(str, DEFAULT_SIZES))})')
+    parser.add_argument('--cases', nargs='+', choices=sorted(CASES), default=list(CASES),
+                        help='Измеряемые операции (по умолчанию: все)')
+    parser.add_argument('--repeat', type=int, default=5,
+                        help='Количество повторов каждой операции (по умолчанию: 5)')
+    parser.add_argument('--seed', type=int, default=0, help='Начальное значение генератора тестов')
+    parser.add_argument('--data-dir', help='Папка для синтетических тестов (по умолчанию: '
+                                           'временная папка, удаляемая после запуска)')
+    parser.add_argument('--save', metavar='FILE', help='Сохранить результат как базовый')
+    parser.add_argument('--baseline', metavar='FILE', help='Сравнить с базовым результатом')
+    parser.add_argument('--max-regression', type=float, default=0.25,
+                        help='Допустимое замедление относительно базового (по умолчанию: 0.25)')
+    args = parser.parse_args()
+
+    if any(size < 1 or size > MAX_SIZE for size in args.sizes):
+        parser.error(f"Размер теста должен быть от 1 до {MAX_SIZE}")
+
+    data_dir = args.data_dir or tempfile.mkdtemp(prefix='quiz_bench_')
+    os.makedirs(data_dir, exist_ok=True)
+    try:
+        results = run_suite(args.sizes, args.cases, args.repeat, data_dir, args.seed)
+    finally:
+        if not args.data_dir:
+            shutil.rmtree(data_dir, ignore_errors=True)
+
+    failed = False
+    if args.baseline:
+        with open(args.baseline, 'r', encoding='utf-8') as file:
+            baseline = json.load(file)
+        regressions = compare(results, baseline['results'], args.max_regression)
+        if regressions:
+            print(f"\nЗамедление больше {args.max_regression:.0%}: {', '.join(regressions)}")
+            failed = True
+
+    if args.save:
+        report = {
+            'python': platform.python_version(),
+            'machine': platform.machine(),
+            'created': time.strftime('%Y-%m-%dT%H:%M:%S'),
+            'repeat': args.repeat,
+            'results': results
+        }
+        with open(args.save, 'w', encoding='utf-8') as file:
+            json.dump(report, file, ensure_ascii=False, indent=2)
+        print(f"Результат сохранен в {args.save}")
+
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,115 @@
+#!/usr/bin/env python3
+"""
+Генератор синтетических тестов для измерения производительности.
+
+Создает тест заданного размера (от десятков до десятков миллионов
+вопросов) в формате файлов тестов проекта. Вопросы с вариантами
+ответа и текстовые вопросы перемешаны в заданной пропорции, тексты
+вопросов и ответов - на русском языке, часть текстовых ответов - числа
+и ответы с допустимыми вариантами (aliases).
+
+Вопросы записываются в файл по одному, поэтому генерация большого теста
+не требует памяти под весь тест. Одно и то же значение seed дает
+одинаковый файл.
+
+Примеры использования:
+    python benchmarks/generate_bank.py bench_1m.json --questions 1000000
+    python benchmarks/generate_bank.py small.json --questions 10 --options-share 0.5
+"""
+import argparse
+import json
+import os
+import random
+
+# Доля вопросов с вариантами ответа по умолчанию (как в тестах проекта)
+OPTIONS_SHARE = 0.6
+
+SUBJECTS = ['математика', 'физика', 'химия', 'история', 'география', 'литература',
+            'информатика', 'биология', 'экономика', 'философия']
+VERBS = ['Какой', 'Какая', 'Какое', 'Что', 'Кто', 'Где', 'Когда', 'Почему']
+ADJECTIVES = ['основной', 'важнейший', 'известный', 'первый', 'последний', 'главный',
+              'простейший', 'сложный', 'древний', 'современный', 'классический']
+NOUNS = ['закон', 'принцип', 'элемент', 'процесс', 'метод', 'термин', 'пример', 'период',
+         'ученый', 'автор', 'результат', 'предмет', 'язык', 'алгоритм', 'материк', 'орган']
+WORDS = ['энергия', 'скорость', 'кислород', 'революция', 'Волга', 'Пушкин', 'переменная',
+         'функция', 'клетка', 'рынок', 'сознание', 'уравнение', 'атом', 'империя',
+         'Байкал', 'Толстой', 'массив', 'фотосинтез', 'инфляция', 'истина', 'ёмкость',
+         'производная', 'молекула', 'реформа', 'Евразия', 'Чехов', 'рекурсия']
+ALIASES = {'Пушкин': ['А. С. Пушкин'], 'Толстой': ['Лев Толстой'],
+           'Евразия': ['материк Евразия'], 'рекурсия': ['рекурсивный вызов']}
+
+
+def generate_question(rng: random.Random, number: int, options_share: float = OPTIONS_SHARE) -> dict:
+    """Создает один случайный вопрос.
+
+    Args:
+        rng: Генератор случайных чисел.
+        number: Номер вопроса (делает тексты вопросов различными).
+        options_share: Вероятность вопроса с вариантами ответа.
+
+    Returns:
+        Словарь вопроса в формате файла теста.
+    """
+    text = (f"{rng.choice(VERBS)} {rng.choice(ADJECTIVES)} {rng.choice(NOUNS)} "
+            f"в разделе «{rng.choice(SUBJECTS)}» №{number}?")
+
+    if rng.random() < options_share:
+        options = rng.sample(WORDS, 4)
+        return {'question': text, 'options': options, 'answer': rng.choice(options)}
+
+    if rng.random() < 0.3:
+        return {'question': text, 'answer': str(rng.randint(1, 2000))}
+    answer = rng.choice(WORDS)
+    question = {'question': text, 'answer': answer}
+    if answer in ALIASES:
+        question['aliases'] = ALIASES[answer]
+    return question
+
+
+def generate_bank(file_path: str, questions: int, seed: int = 0,
+                  options_share: float = OPTIONS_SHARE) -> None:
+    """Записывает синтетический тест в файл.
+
+    Args:
+        file_path: Путь к создаваемому файлу.
+        questions: Количество вопросов.
+        seed: Начальное значение генератора случайных чисел.
+        options_share: Доля вопросов с вариантами ответа.
+
+    Note:
+        Каждый вопрос записывается отдельной строкой, поле questions
+        идет последним, как в файлах save_test.
+    """
+    rng = random.Random(seed)
+
+    directory = os.path.dirname(file_path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+
+    header = {'title': f"Синтетический тест, вопросов: {questions}",
+              'description': 'Тест для измерения производительности'}
+    with open(file_path, 'w', encoding='utf-8') as file:
+        file.write(json.dumps(header, ensure_ascii=False)[:-1] + ', "questions": [')
+        for number in range(1, questions + 1):
+            question = generate_question(rng, number, options_share)
+            file.write(('\n' if number == 1 else ',\n') + json.dumps(question, ensure_ascii=False))
+        file.write('\n]}\n')
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Генератор синтетических тестов')
+    parser.add_argument('output', help='Путь к создаваемому файлу теста')
+    parser.add_argument('--questions', type=int, default=1000,
+                        help='Количество вопросов (по умолчанию: 1000)')
+    parser.add_argument('--seed', type=int, default=0, help='Начальное значение генератора')
+    parser.add_argument('--options-share', type=float, default=OPTIONS_SHARE,
+                        help=f'Доля вопросов с вариантами ответа (по умолчанию: {OPTIONS_SHARE})')
+    args = parser.parse_args()
+
+    generate_bank(args.output, args.questions, args.seed, args.options_share)
+    print(f"Создан тест {args.output}: вопросов {args.questions}, "
+          f"{os.path.getsize(args.output) / 1024 / 1024:.1f} МБ")
+
+
+if __name__ == '__main__':
+    main()
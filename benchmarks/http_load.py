@@ -0,0 +1,169 @@
+#!/usr/bin/env python3
+"""
+Нагрузочный клиент для HTTP сервера тестирования.
+
+Открывает заданное число keep-alive соединений, и каждое соединение
+в цикле проходит тест целиком: создает сессию, запрашивает вопросы,
+отправляет ответы, получает результат и удаляет сессию. По окончании
+выводит количество запросов в секунду и задержки (p50/p95/p99).
+
+Примеры использования:
+    python main.py --serve --port 8080 &
+    python benchmarks/http_load.py --port 8080 --connections 100 --duration 10
+
+    # Запустить сервер в отдельном процессе автоматически
+    python benchmarks/http_load.py --spawn --duration 10
+"""
+import argparse
+import asyncio
+import json
+import os
+import random
+import subprocess
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+class Client:
+    """Keep-alive HTTP клиент поверх asyncio streams."""
+
+    def __init__(self, host, port):
+        self.host = host
+        self.port = port
+        self.reader = None
+        self.writer = None
+
+    async def connect(self):
+        self.reader, self.writer = await asyncio.open_connection(self.host, self.port)
+
+    async def request(self, method, path, body=None):
+        payload = json.dumps(body).encode('utf-8') if body is not None else b''
+        head = (f"{method} {path} HTTP/1.1\r\nHost: {self.host}\r\n"
+                f"Content-Type: application/json\r\nContent-Length: {len(payload)}\r\n\r\n")
+        self.writer.write(head.encode('latin-1') + payload)
+        await self.writer.drain()
+
+        status_line, _, headers = (await self.reader.readuntil(b'\r\n\r\n')).partition(b'\r\n')
+        length = 0
+        for line in headers.split(b'\r\n'):
+            name, _, value = line.partition(b':')
+            if name.strip().lower() == b'content-length':
+                length = int(value)
+        data = json.loads(await self.reader.readexactly(length)) if length else None
+        return int(status_line.split()[1]), data
+
+    def close(self):
+        if self.writer is not None:
+            self.writer.close()
+
+
+async def run_user(client, test_path, count, deadline, latencies, errors):
+    """Многократно проходит тест от имени одного пользователя до истечения времени."""
+    await client.connect()
+
+    async def timed(method, path, body=None):
+        start = time.perf_counter()
+        status, data = await client.request(method, path, body)
+        latencies.append(time.perf_counter() - start)
+        if status >= 400:
+            errors[status] = errors.get(status, 0) + 1
+        return status, data
+
+    try:
+        while time.perf_counter() < deadline:
+            body = {'test': test_path}
+            if count:
+                body['count'] = count
+            status, data = await timed('POST', '/sessions', body)
+            if status != 201:
+                continue
+            session = f"/sessions/{data['session']}"
+
+            while True:
+                _, question = await timed('GET', session + '/question')
+                if question.get('finished', True):
+                    break
+                options = question.get('options')
+                answer = str(random.randint(1, len(options))) if options else 'ответ'
+                await timed('POST', session + '/answer', {'answer': answer})
+
+            await timed('GET', session + '/result')
+            await timed('DELETE', session)
+    finally:
+        client.close()
+
+
+def percentile(sorted_values, fraction):
+    """Возвращает перцентиль отсортированного списка."""
+    if not sorted_values:
+        return 0.0
+    return sorted_values[min(len(sorted_values) - 1, int(len(sorted_values) * fraction))]
+
+
+async def run_load(args):
+    """Запускает нагрузку и печатает сводку."""
+    probe = Client(args.host, args.port)
+    await probe.connect()
+    _, tests = await probe.request('GET', '/tests')
+    probe.close()
+    if not tests:
+        print("На сервере нет тестов.")
+        return
+    test_path = args.test or tests[0]['test']
+
+    latencies = []
+    errors = {}
+    start = time.perf_counter()
+    deadline = start + args.duration
+    await asyncio.gather(*(
+        run_user(Client(args.host, args.port), test_path, args.count, deadline, latencies, errors)
+        for _ in range(args.connections)
+    ))
+    elapsed = time.perf_counter() - start
+
+    latencies.sort()
+    print(f"Тест: {test_path}")
+    print(f"Соединений: {args.connections}, длительность: {elapsed:.1f} с")
+    print(f"Запросов: {len(latencies)} ({len(latencies) / elapsed:.0f} запросов/с)")
+    print("Задержка: p50 {:.2f} мс, p95 {:.2f} мс, p99 {:.2f} мс".format(
+        percentile(latencies, 0.50) * 1000,
+        percentile(latencies, 0.95) * 1000,
+        percentile(latencies, 0.99) * 1000))
+    if errors:
+        print(f"Ошибки по статусам: {errors}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Нагрузочный клиент HTTP сервера тестирования')
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8080)
+    parser.add_argument('--connections', type=int, default=50,
+                        help='Количество одновременных соединений (по умолчанию: 50)')
+    parser.add_argument('--duration', type=float, default=10,
+                        help='Длительность нагрузки в секундах (по умолчанию: 10)')
+    parser.add_argument('--test', help='Путь к тесту (по умолчанию: первый тест сервера)')
+    parser.add_argument('--count', type=int, help='Количество случайных вопросов в сессии')
+    parser.add_argument('--spawn', action='store_true',
+                        help='Запустить сервер в отдельном процессе на время нагрузки')
+    args = parser.parse_args()
+
+    server = None
+    if args.spawn:
+        server = subprocess.Popen(
+            [sys.executable, os.path.join(ROOT, 'main.py'), '--serve',
+             '--host', args.host, '--port', str(args.port)],
+            cwd=ROOT, stdout=subprocess.DEVNULL)
+        time.sleep(1)
+
+    try:
+        asyncio.run(run_load(args))
+    finally:
+        if server is not None:
+            server.terminate()
+            server.wait()
+
+
+if __name__ == '__main__':
+    main()
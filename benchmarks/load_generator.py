@@ -0,0 +1,312 @@
+#!/usr/bin/env python3
+"""
+Генератор нагрузки: одновременное прохождение тестов множеством пользователей.
+
+Имитирует тысячи пользователей, которые одновременно проходят тест через
+QuizEngine и QuizSession без ввода с клавиатуры: вопросы выбираются
+engine.get_random_questions, ответы подставляются по сценарию с заданной
+долей правильных ответов (часть правильных текстовых ответов - с опечаткой
+или в другом регистре), а между ответами пользователь «думает» случайное
+время со средним --think-ms.
+
+Пользователи - сопрограммы asyncio, распределенные по процессам
+(ProcessPoolExecutor), по одному циклу событий в каждом процессе.
+По окончании выводятся:
+
+    - пропускная способность: завершенные прохождения и ответы в секунду;
+    - задержки p50/p95/p99 по операциям: start (выбор вопросов и создание
+      сессии), next_question, submit (проверка ответа), result (результат
+      и статистика) и loop_lag (опоздание пробуждения сопрограммы - признак
+      перегрузки процесса);
+    - потребление памяти (RSS) всеми процессами по времени.
+
+Примеры использования:
+    python benchmarks/load_generator.py --users 2000 --duration 30
+    python benchmarks/load_generator.py --test tests/math_test.json --think-ms 0 --processes 2
+    python benchmarks/load_generator.py --questions 100000 --json load.json
+"""
+import argparse
+import asyncio
+import json
+import math
+import os
+import random
+import shutil
+import sys
+import tempfile
+import time
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from generate_bank import generate_bank  # noqa: E402
+from quizapp.engine import QuizEngine  # noqa: E402
+from quizapp.loader import load_bank  # noqa: E402
+from quizapp.results import calculate_statistics  # noqa: E402
+from quizapp.session import QuizSession  # noqa: E402
+
+OPERATIONS = ('start', 'next_question', 'submit', 'result', 'loop_lag')
+# Гистограмма задержек: корзины растут в HISTOGRAM_RATIO раз от 1 мкс,
+# поэтому гистограммы процессов складываются, а погрешность перцентиля
+# не превышает 5%
+HISTOGRAM_RATIO = 1.05
+_LOG_RATIO = math.log(HISTOGRAM_RATIO)
+# Интервал записи RSS в секундах
+RSS_INTERVAL = 1.0
+
+
+def current_rss():
+    """Возвращает резидентную память процесса в байтах или None."""
+    try:
+        with open('/proc/self/statm', 'rb') as file:
+            return int(file.read().split()[1]) * os.sysconf('SC_PAGE_SIZE')
+    except (OSError, ValueError, AttributeError):
+        pass
+    try:
+        import resource
+    except ImportError:
+        return None
+    # Максимальная, а не текущая память (ru_maxrss в КБ на Linux)
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024
+
+
+class Histogram:
+    """Гистограмма задержек с логарифмическими корзинами."""
+
+    def __init__(self):
+        self.bins = Counter()
+        self.count = 0
+
+    def add(self, seconds):
+        micros = seconds * 1e6
+        self.bins[int(math.log(micros) / _LOG_RATIO) if micros > 1 else 0] += 1
+        self.count += 1
+
+    def merge(self, bins):
+        for index, count in bins.items():
+            self.bins[int(index)] += count
+            self.count += count
+
+    def percentile(self, fraction):
+        """Возвращает перцентиль в миллисекундах (верхняя граница корзины)."""
+        if not self.count:
+            return 0.0
+        rank = fraction * self.count
+        seen = 0
+        for index in sorted(self.bins):
+            seen += self.bins[index]
+            if seen >= rank:
+                return HISTOGRAM_RATIO ** (index + 1) / 1000
+        return HISTOGRAM_RATIO ** (max(self.bins) + 1) / 1000
+
+
+def scripted_answer(question, rng, accuracy):
+    """Возвращает ответ пользователя: правильный с вероятностью accuracy."""
+    if question.correct_index is not None:
+        if rng.random() < accuracy:
+            return str(question.correct_index + 1)
+        wrong = rng.randrange(len(question.options) - 1)
+        return str(wrong + 1 if wrong < question.correct_index else wrong + 2)
+
+    answer = str(question.answer)
+    if rng.random() >= accuracy:
+        return 'не знаю'
+    variant = rng.random()
+    if variant < 0.2 and len(answer) > 5:
+        # Опечатка: два соседних символа переставлены
+        position = rng.randrange(len(answer) - 1)
+        return answer[:position] + answer[position + 1] + answer[position] + answer[position + 2:]
+    if variant < 0.4:
+        return f' {answer.upper()} '
+    return answer
+
+
+async def simulate_user(engine, options, deadline, rng, histograms, counters):
+    """Многократно проходит тест до истечения времени."""
+    think = options['think_ms'] / 1000
+    loop = asyncio.get_running_loop()
+
+    async def pause():
+        delay = rng.expovariate(1 / think) if think else 0
+        start = loop.time()
+        await asyncio.sleep(delay)
+        histograms['loop_lag'].add(max(0.0, loop.time() - start - delay))
+
+    # Пользователи приходят не одновременно
+    await asyncio.sleep(rng.random() * think)
+    while time.monotonic() < deadline:
+        start = time.perf_counter()
+        questions = engine.get_random_questions(options['count'], rng.getrandbits(32))
+        session = QuizSession(questions, engine.title)
+        histograms['start'].add(time.perf_counter() - start)
+
+        while True:
+            start = time.perf_counter()
+            question = session.next_question()
+            histograms['next_question'].add(time.perf_counter() - start)
+            if question is None:
+                break
+            await pause()
+            answer = scripted_answer(question, rng, options['accuracy'])
+            start = time.perf_counter()
+            session.submit(answer)
+            histograms['submit'].add(time.perf_counter() - start)
+            counters['answers'] += 1
+
+        start = time.perf_counter()
+        _, _, user_answers = session.result()
+        calculate_statistics(user_answers)
+        histograms['result'].add(time.perf_counter() - start)
+        counters['sessions'] += 1
+        await pause()
+
+
+async def run_worker_users(engine, options, users, seed):
+    """Запускает сопрограммы пользователей одного процесса и записывает RSS."""
+    histograms = {name: Histogram() for name in OPERATIONS}
+    counters = {'sessions': 0, 'answers': 0}
+    started = time.monotonic()
+    deadline = started + options['duration']
+    rss = []
+
+    async def sample_rss():
+        while time.monotonic() < deadline:
+            rss.append((time.monotonic() - started, current_rss()))
+            await asyncio.sleep(RSS_INTERVAL)
+
+    sampler = asyncio.ensure_future(sample_rss())
+    await asyncio.gather(*(
+        simulate_user(engine, options, deadline, random.Random(seed * 1000003 + number),
+                      histograms, counters)
+        for number in range(users)
+    ))
+    sampler.cancel()
+    rss.append((time.monotonic() - started, current_rss()))
+    return {
+        'histograms': {name: dict(histogram.bins) for name, histogram in histograms.items()},
+        'counters': counters,
+        'rss': rss,
+        'elapsed': time.monotonic() - started
+    }
+
+
+def worker(test_path, options, users, seed):
+    """Точка входа процесса: загружает тест и проводит нагрузку."""
+    engine = QuizEngine(load_bank(test_path), test_path)
+    return asyncio.run(run_worker_users(engine, options, users, seed))
+
+
+async def run_load(test_path, options, users, processes):
+    """Распределяет пользователей по процессам и собирает результаты."""
+    loop = asyncio.get_running_loop()
+    shares = [users // processes + (1 if index < users % processes else 0)
+              for index in range(processes)]
+    with ProcessPoolExecutor(max_workers=processes) as pool:
+        return await asyncio.gather(*(
+            loop.run_in_executor(pool, worker, test_path, options, share, options['seed'] + index)
+            for index, share in enumerate(shares) if share
+        ))
+
+
+def summarize(reports):
+    """Объединяет отчеты процессов."""
+    histograms = {name: Histogram() for name in OPERATIONS}
+    sessions = answers = 0
+    for report in reports:
+        for name, bins in report['histograms'].items():
+            histograms[name].merge(bins)
+        sessions += report['counters']['sessions']
+        answers += report['counters']['answers']
+    elapsed = max(report['elapsed'] for report in reports)
+
+    # Для каждой секунды берется последнее известное значение RSS каждого
+    # процесса, чтобы процессы, закончившие раньше, учитывались до конца
+    timeline = []
+    for second in range(int(elapsed) + 1):
+        total = 0
+        for report in reports:
+            known = [rss for offset, rss in report['rss'] if offset < second + 1 and rss is not None]
+            total += known[-1] if known else 0
+        if total:
+            timeline.append((second, total))
+
+    return {
+        'elapsed': elapsed,
+        'sessions': sessions,
+        'answers': answers,
+        'sessions_per_second': sessions / elapsed,
+        'answers_per_second': answers / elapsed,
+        'latency_ms': {name: {
+            'count': histogram.count,
+            'p50': histogram.percentile(0.50),
+            'p95': histogram.percentile(0.95),
+            'p99': histogram.percentile(0.99)
+        } for name, histogram in histograms.items()},
+        'rss_mb': [{'second': second, 'rss': total / 1024 / 1024}
+                   for second, total in timeline]
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Генератор нагрузки на движок тестирования')
+    parser.add_argument('--test', help='Путь к тесту (по умолчанию: синтетический тест)')
+    parser.add_argument('--questions', type=int, default=10000,
+                        help='Размер синтетического теста (по умолчанию: 10000)')
+    parser.add_argument('--users', type=int, default=1000,
+                        help='Количество одновременных пользователей (по умолчанию: 1000)')
+    parser.add_argument('--processes', type=int, default=os.cpu_count() or 1,
+                        help='Количество процессов (по умолчанию: по числу ядер)')
+    parser.add_argument('--duration', type=float, default=10,
+                        help='Длительность нагрузки в секундах (по умолчанию: 10)')
+    parser.add_argument('--count', type=int, default=10,
+                        help='Количество вопросов в прохождении (по умолчанию: 10)')
+    parser.add_argument('--think-ms', type=float, default=500,
+                        help='Среднее время обдумывания ответа в мс (по умолчанию: 500)')
+    parser.add_argument('--accuracy', type=float, default=0.7,
+                        help='Доля правильных ответов (по умолчанию: 0.7)')
+    parser.add_argument('--seed', type=int, default=0, help='Начальное значение генератора')
+    parser.add_argument('--json', metavar='FILE', help='Сохранить сводку в JSON файл')
+    args = parser.parse_args()
+
+    options = {'duration': args.duration, 'count': args.count, 'think_ms': args.think_ms,
+               'accuracy': args.accuracy, 'seed': args.seed}
+    data_dir = None
+    test_path = args.test
+    if test_path is None:
+        data_dir = tempfile.mkdtemp(prefix='quiz_load_')
+        test_path = os.path.join(data_dir, 'bank.json')
+        generate_bank(test_path, args.questions, args.seed)
+
+    try:
+        reports = asyncio.run(run_load(test_path, options, args.users, max(1, args.processes)))
+    finally:
+        if data_dir is not None:
+            shutil.rmtree(data_dir, ignore_errors=True)
+
+    summary = summarize(reports)
+    print(f"Тест: {args.test or f'синтетический, вопросов {args.questions}'}")
+    print(f"Пользователей: {args.users}, процессов: {min(args.users, max(1, args.processes))}, "
+          f"длительность: {summary['elapsed']:.1f} с")
+    print(f"Прохождений: {summary['sessions']} ({summary['sessions_per_second']:.1f} в секунду)")
+    print(f"Ответов: {summary['answers']} ({summary['answers_per_second']:.0f} в секунду)")
+    print(f"\n{'Операция':<15} {'количество':>11} {'p50, мс':>9} {'p95, мс':>9} {'p99, мс':>9}")
+    for name, latency in summary['latency_ms'].items():
+        print(f"{name:<15} {latency['count']:>11} {latency['p50']:>9.3f} "
+              f"{latency['p95']:>9.3f} {latency['p99']:>9.3f}")
+    if summary['rss_mb']:
+        print("\nПамять (RSS всех процессов):")
+        for point in summary['rss_mb']:
+            print(f"  {point['second']:>4} с  {point['rss']:8.1f} МБ")
+        growth = summary['rss_mb'][-1]['rss'] - summary['rss_mb'][0]['rss']
+        print(f"Рост памяти за время нагрузки: {growth:+.1f} МБ")
+
+    if args.json:
+        with open(args.json, 'w', encoding='utf-8') as file:
+            json.dump(summary, file, ensure_ascii=False, indent=2)
+        print(f"Сводка сохранена в {args.json}")
+
+
+if __name__ == '__main__':
+    main()
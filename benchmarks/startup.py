@@ -0,0 +1,128 @@
+#!/usr/bin/env python3
+"""
+Измерение времени запуска main.py --list-tests.
+
+Многократно запускает `python -X importtime main.py --list-tests`
+в отдельном процессе и выводит время запуска (минимум и медиана), а также
+модули с наибольшим собственным временем импорта. Проверяет, что тяжелые
+модули, которые не нужны для вывода списка тестов, не импортируются.
+
+Результат можно сохранить как базовый и сравнивать с ним последующие
+запуски: при замедлении больше допустимого скрипт завершается с кодом 1.
+
+Примеры использования:
+    python benchmarks/startup.py --runs 20
+    python benchmarks/startup.py --save startup.json
+    python benchmarks/startup.py --baseline startup.json --max-regression 0.2
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Модули, которые не должны загружаться при выводе списка тестов
+FORBIDDEN_MODULES = ('asyncio', 'concurrent.futures', 'random',
+                     'quizapp.engine', 'quizapp.server', 'quizapp.grading')
+
+
+def run_once(python):
+    """Запускает main.py --list-tests один раз.
+
+    Returns:
+        Кортеж (время запуска в секундах, словарь модуль -> (собственное
+        время, суммарное время) в микросекундах).
+    """
+    start = time.perf_counter()
+    completed = subprocess.run(
+        [python, '-X', 'importtime', os.path.join(ROOT, 'main.py'), '--list-tests'],
+        cwd=ROOT, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True)
+    elapsed = time.perf_counter() - start
+    if completed.returncode != 0:
+        raise RuntimeError(f"main.py завершился с кодом {completed.returncode}:\n{completed.stderr}")
+
+    modules = {}
+    for line in completed.stderr.splitlines():
+        # import time: self [us] | cumulative | imported package
+        if not line.startswith('import time:'):
+            continue
+        fields = line[len('import time:'):].split('|')
+        if len(fields) != 3 or not fields[0].strip().isdigit():
+            continue
+        name = fields[2].strip()
+        modules[name] = (int(fields[0]), int(fields[1]))
+    return elapsed, modules
+
+
+def measure(python, runs):
+    """Выполняет runs запусков и возвращает сводку."""
+    run_once(python)  # прогрев: компиляция .pyc и файловый кэш
+    times = []
+    self_times = {}
+    modules = {}
+    for _ in range(runs):
+        elapsed, modules = run_once(python)
+        times.append(elapsed)
+        for name, (self_us, _) in modules.items():
+            self_times.setdefault(name, []).append(self_us)
+
+    top = sorted(((min(values), name) for name, values in self_times.items()), reverse=True)[:10]
+    return {
+        'runs': runs,
+        'min_ms': min(times) * 1000,
+        'median_ms': statistics.median(times) * 1000,
+        'modules': len(modules),
+        'import_ms': sum(self_us for self_us, _ in modules.values()) / 1000,
+        'top': [{'module': name, 'self_ms': self_us / 1000} for self_us, name in top],
+        'forbidden': [name for name in FORBIDDEN_MODULES if name in modules]
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Измерение времени запуска main.py --list-tests')
+    parser.add_argument('--runs', type=int, default=10,
+                        help='Количество запусков (по умолчанию: 10)')
+    parser.add_argument('--python', default=sys.executable,
+                        help='Интерпретатор Python (по умолчанию: текущий)')
+    parser.add_argument('--save', metavar='FILE', help='Сохранить результат как базовый')
+    parser.add_argument('--baseline', metavar='FILE', help='Сравнить с базовым результатом')
+    parser.add_argument('--max-regression', type=float, default=0.2,
+                        help='Допустимое замедление относительно базового (по умолчанию: 0.2)')
+    args = parser.parse_args()
+
+    result = measure(args.python, args.runs)
+    print(f"Запусков: {result['runs']}")
+    print(f"Время запуска: минимум {result['min_ms']:.1f} мс, медиана {result['median_ms']:.1f} мс")
+    print(f"Импортировано модулей: {result['modules']}, время импорта {result['import_ms']:.1f} мс")
+    print("Наибольшее собственное время импорта:")
+    for item in result['top']:
+        print(f"  {item['self_ms']:7.2f} мс  {item['module']}")
+
+    failed = False
+    if result['forbidden']:
+        print(f"Импортированы лишние модули: {', '.join(result['forbidden'])}")
+        failed = True
+
+    if args.baseline:
+        with open(args.baseline, 'r', encoding='utf-8') as file:
+            baseline = json.load(file)
+        change = result['min_ms'] / baseline['min_ms'] - 1
+        print(f"Базовое время: {baseline['min_ms']:.1f} мс, изменение {change:+.1%}")
+        if change > args.max_regression:
+            print(f"Замедление превышает допустимое ({args.max_regression:.0%})")
+            failed = True
+
+    if args.save:
+        with open(args.save, 'w', encoding='utf-8') as file:
+            json.dump(result, file, ensure_ascii=False, indent=2)
+        print(f"Результат сохранен в {args.save}")
+
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == '__main__':
+    main()
@@ -9,17 +9,21 @@
 Примеры использования:
     python main.py --list-tests
     python main.py --take-test tests/math_test.json
+    python main.py --take-random tests/math_test.json --count 10 --difficulty easy=30 medium=50 hard=20
     python main.py --mixed-tests tests/math_test.json tests/programming_test.json
+    python main.py --mixed-tests tests/math_test.json tests/programming_test.json --quotas 3 2
+    python main.py --grade tests/math_test.json --submissions answers.jsonl
+    python main.py --item-analysis tests/math_test.json
+    python main.py --serve --port 8080
+    python main.py --compile tests/
+    python main.py --dedup --output duplicates.json
+    python main.py --validate --output -
+    python main.py --search квадратный корень
+    python main.py --take-random tests/math_test.json --profile
+    printf '2\\n4\\n' | python main.py --take-test tests/math_test.json --render jsonl
+    python main.py --grade tests/math_test.json --submissions answers.jsonl --cprofile grade.prof
 """
-import argparse
 import sys
-from quizapp.commands import (
-    list_tests,
-    take_test,
-    take_random_test,
-    create_test,
-    show_statistics
-)
 
 
 def main():
@@ -30,7 +34,62 @@ def main():
 
       Raises:
           SystemExit: Завершает программу с кодом 1 в случае ошибки.
+
+      Note:
+          Команда --list-tests без других аргументов выполняется без
+          построения парсера аргументов: ее часто вызывают из скриптов,
+          и время запуска для нее важнее всего.
+
+          Модули пакета импортируются после проверки этого случая, поэтому
+          быстрая команда загружает только то, что нужно list_tests.
+
+          С --profile (или QUIZ_PROFILE=1) после выполнения команды в stderr
+          печатается время ее этапов, с --cprofile команда выполняется
+          под cProfile (см. quizapp.instrument).
       """
+    if sys.argv[1:] == ['--list-tests']:
+        from quizapp.commands import list_tests
+        from quizapp.render import echo
+        try:
+            list_tests()
+        except Exception as e:
+            echo(f"Ошибка: {e}")
+            sys.exit(1)
+        return
+
+    import argparse
+    from quizapp import instrument
+    from quizapp.matching import AnswerMatcher, set_default_matcher
+    from quizapp.render import RENDERERS, create_renderer, set_default_renderer, echo
+    from quizapp.commands import (
+        list_tests,
+        take_test,
+        take_random_test,
+        take_mixed_test,
+        create_test,
+        show_statistics,
+        grade_submissions,
+        run_server,
+        compile_tests,
+        show_attempt_statistics,
+        show_item_analysis,
+        find_duplicate_questions,
+        validate_tests,
+        search_tests
+    )
+
+    def pairs(convert):
+        """Возвращает разборщик аргументов вида ИМЯ=ЧИСЛО."""
+        def parse(text):
+            name, separator, value = text.rpartition('=')
+            try:
+                if not separator or not name:
+                    raise ValueError(text)
+                return name, convert(value)
+            except ValueError:
+                raise argparse.ArgumentTypeError(f"ожидается ИМЯ=ЧИСЛО, получено: {text}")
+        return parse
+
     parser = argparse.ArgumentParser(
         description='Система тестирования (Quiz)',
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -44,7 +103,19 @@ def main():
 Примеры использования:
     python main.py --list-tests
     python main.py --take-test tests/math_test.json
+    python main.py --take-random tests/math_test.json --count 10 --difficulty easy=30 medium=50 hard=20
     python main.py --mixed-tests tests/math_test.json tests/programming_test.json
+    python main.py --mixed-tests tests/math_test.json tests/programming_test.json --quotas 3 2
+    python main.py --grade tests/math_test.json --submissions answers.jsonl
+    python main.py --item-analysis tests/math_test.json
+    python main.py --serve --port 8080
+    python main.py --compile tests/
+    python main.py --dedup --output duplicates.json
+    python main.py --validate --output -
+    python main.py --search квадратный корень
+    python main.py --take-random tests/math_test.json --profile
+    printf '2\\n4\\n' | python main.py --take-test tests/math_test.json --render jsonl
+    python main.py --grade tests/math_test.json --submissions answers.jsonl --cprofile grade.prof
 """
 
     )
@@ -55,11 +126,33 @@ def main():
     parser.add_argument('--take-test', type=str,
                         help='Пройти указанный тест')
 
+    parser.add_argument('--stream', action='store_true',
+                        help='Читать вопросы теста потоком (для очень больших тестов)')
+
     parser.add_argument('--take-random', type=str,
                         help='Пройти тест со случайными вопросами')
 
-    parser.add_argument('--count', type=int, default=5,
-                        help='Количество случайных вопросов (по умолчанию: 5)')
+    parser.add_argument('--mixed-tests', type=str, nargs='+', metavar='TEST',
+                        help='Пройти тест из вопросов нескольких тестов')
+
+    parser.add_argument('--count', type=int,
+                        help='Количество случайных вопросов (по умолчанию: 5 для --take-random, '
+                             'все вопросы для --mixed-tests) или результатов --search (по умолчанию: 10)')
+
+    parser.add_argument('--quotas', type=int, nargs='+', metavar='N',
+                        help='Количество вопросов из каждого теста для --mixed-tests')
+
+    parser.add_argument('--difficulty', type=pairs(float), nargs='+', metavar='NAME=SHARE',
+                        help='Доли сложностей для --take-random, например: easy=30 medium=50 hard=20')
+
+    parser.add_argument('--tags', type=pairs(int), nargs='+', metavar='TAG=N',
+                        help='Не менее N вопросов по каждой теме для --take-random')
+
+    parser.add_argument('--weighted', action='store_true',
+                        help='Выбирать вопросы для --take-random с вероятностью по весу (поле weight)')
+
+    parser.add_argument('--seed', type=int,
+                        help='Начальное значение генератора для воспроизводимого набора вопросов')
 
     parser.add_argument('--create-test', action='store_true',
                         help='Создать новый тест')
@@ -67,24 +160,122 @@ def main():
     parser.add_argument('--stats', type=str,
                         help='Показать статистику теста')
 
+    parser.add_argument('--attempt-stats', type=str, nargs='?', const='', metavar='TEST',
+                        help='Показать статистику по журналу попыток (всех или одного теста)')
+
+    parser.add_argument('--item-analysis', type=str, metavar='TEST',
+                        help='Показать анализ вопросов теста по журналу попыток (требует NumPy)')
+
+    parser.add_argument('--user', type=str,
+                        help='Имя пользователя для фильтрации журнала попыток')
+
+    parser.add_argument('--grade', type=str,
+                        help='Проверить листы ответов для указанного теста')
+
+    parser.add_argument('--submissions', type=str,
+                        help='JSONL файл с листами ответов (для --grade)')
+
+    parser.add_argument('--output', type=str,
+                        help='Файл для результатов (JSONL для --grade, JSON отчет для --dedup '
+                             'и --validate; "-" для вывода отчета --validate в консоль)')
+
+    parser.add_argument('--max-typos', type=int, metavar='N',
+                        help='Допустимое количество опечаток в текстовых ответах '
+                             '(по умолчанию: 0 - без опечаток)')
+
+    parser.add_argument('--workers', type=int,
+                        help='Количество процессов для проверки (по умолчанию: по числу ядер)')
+
+    parser.add_argument('--dedup', type=str, nargs='*', metavar='PATH',
+                        help='Найти повторяющиеся вопросы (по умолчанию во всех тестах)')
+
+    parser.add_argument('--validate', type=str, nargs='*', metavar='PATH',
+                        help='Проверить тесты по полной схеме (по умолчанию все тесты)')
+
+    parser.add_argument('--search', type=str, nargs='+', metavar='WORD',
+                        help='Найти вопросы во всех тестах по словам')
+
+    parser.add_argument('--serve', action='store_true',
+                        help='Запустить HTTP сервер тестирования')
+
+    parser.add_argument('--host', type=str, default='127.0.0.1',
+                        help='Адрес HTTP сервера (по умолчанию: 127.0.0.1)')
+
+    parser.add_argument('--port', type=int, default=8080,
+                        help='Порт HTTP сервера (по умолчанию: 8080)')
+
+    parser.add_argument('--compile', type=str, nargs='+', metavar='PATH',
+                        help='Скомпилировать тесты (файлы или папки) в двоичный формат')
+
+    parser.add_argument('--render', type=str, choices=sorted(RENDERERS), default='terminal',
+                        help='Формат вывода: terminal - текст, jsonl - JSON объект на событие, '
+                             'null - без вывода (по умолчанию: terminal)')
+
+    parser.add_argument('--profile', action='store_true',
+                        help='Напечатать время выполнения этапов команды '
+                             '(то же, что QUIZ_PROFILE=1)')
+
+    parser.add_argument('--profile-memory', action='store_true',
+                        help='Дополнительно учитывать выделение памяти по этапам '
+                             '(tracemalloc, то же, что QUIZ_PROFILE=memory)')
+
+    parser.add_argument('--cprofile', type=str, metavar='FILE',
+                        help='Выполнить команду под cProfile и сохранить профиль в файл')
+
     args = parser.parse_args()
+    if args.max_typos is not None:
+        set_default_matcher(AnswerMatcher(max_typos=args.max_typos))
+    if args.render != 'terminal':
+        set_default_renderer(create_renderer(args.render))
+    if args.profile or args.profile_memory:
+        instrument.enable(memory=args.profile_memory)
 
-    try:
+    def run_command():
         if args.list_tests:
             list_tests()
         elif args.take_test:
-            take_test(args.take_test)
+            take_test(args.take_test, args.stream)
         elif args.take_random:
-            take_random_test(args.take_random, args.count)
+            take_random_test(args.take_random, args.count if args.count is not None else 5, args.seed,
+                             dict(args.difficulty or ()), dict(args.tags or ()), args.weighted)
+        elif args.mixed_tests:
+            take_mixed_test(args.mixed_tests, args.count, args.quotas, args.seed)
         elif args.create_test:
             create_test()
         elif args.stats:
             show_statistics(args.stats)
+        elif args.attempt_stats is not None:
+            show_attempt_statistics(args.attempt_stats or None, args.user)
+        elif args.item_analysis:
+            show_item_analysis(args.item_analysis, args.user)
+        elif args.grade:
+            if not args.submissions:
+                parser.error('для --grade требуется --submissions')
+            if not grade_submissions(args.grade, args.submissions, args.output, args.workers):
+                sys.exit(1)
+        elif args.compile:
+            compile_tests(args.compile)
+        elif args.dedup is not None:
+            find_duplicate_questions(args.dedup, args.output)
+        elif args.validate is not None:
+            if not validate_tests(args.validate, args.output, args.workers):
+                sys.exit(1)
+        elif args.search:
+            search_tests(' '.join(args.search), args.count if args.count is not None else 10)
+        elif args.serve:
+            run_server(args.host, args.port)
         else:
             parser.print_help()
 
+    try:
+        with instrument.span('command'):
+            if args.cprofile:
+                instrument.profile_call(run_command, args.cprofile)
+            else:
+                run_command()
+
     except Exception as e:
-        print(f"Ошибка: {e}")
+        echo(f"Ошибка: {e}")
         sys.exit(1)
 
 
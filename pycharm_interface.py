@@ -12,6 +12,8 @@ from quizapp.commands import (
     create_test,
     show_statistics
 )
+from quizapp.catalog import TestCatalog
+from quizapp.render import flush_output
 
 
 def clear_screen():
@@ -19,6 +21,14 @@ def clear_screen():
     os.system('cls' if os.name == 'nt' else 'clear')
 
 
+def pause(prompt="\nНажмите Enter для продолжения..."):
+    """Вывод накопленного текста команд и ожидание Enter"""
+    # Команды выводят текст через буферизованный рендерер, поэтому
+    # перед вводом его нужно вывести, иначе он появится после выхода
+    flush_output()
+    input(prompt)
+
+
 def print_header():
     """Вывод заголовка"""
     print("=" * 50)
@@ -75,15 +85,11 @@ def select_test_file():
         return None
 
     print("\nДоступные тесты:")
-    for i, test_path in enumerate(tests, 1):
-        try:
-            from quizapp.loader import load_test
-            test_data = load_test(test_path)
-            title = test_data.get('title', 'Без названия')
-            questions_count = len(test_data.get('questions', []))
-            print(f"{i}. {title} ({questions_count} вопросов)")
-        except Exception as e:
+    for i, (test_path, info) in enumerate(TestCatalog().refresh(tests), 1):
+        if isinstance(info, Exception):
             print(f"{i}. ❌ Ошибка загрузки: {os.path.basename(test_path)}")
+        else:
+            print(f"{i}. {info['title']} ({info['questions_count']} вопросов)")
 
     print(f"{len(tests) + 1}. ↩️ Назад")
 
@@ -129,7 +135,7 @@ def handle_list_tests():
     print("📋 СПИСОК ДОСТУПНЫХ ТЕСТОВ")
     print("-" * 40)
     list_tests()
-    input("\nНажмите Enter для продолжения...")
+    pause()
 
 
 def handle_take_test():
@@ -144,9 +150,10 @@ def handle_take_test():
         try:
             take_test(test_file)
         except Exception as e:
+            flush_output()
             print(f"❌ Ошибка при прохождении теста: {e}")
 
-    input("\nНажмите Enter для продолжения...")
+    pause()
 
 
 def handle_take_random_test():
@@ -163,9 +170,10 @@ def handle_take_random_test():
             try:
                 take_random_test(test_file, count)
             except Exception as e:
+                flush_output()
                 print(f"❌ Ошибка при прохождении теста: {e}")
 
-    input("\nНажмите Enter для продолжения...")
+    pause()
 
 
 def handle_create_test():
@@ -178,9 +186,10 @@ def handle_create_test():
     try:
         create_test()
     except Exception as e:
+        flush_output()
         print(f"❌ Ошибка при создании теста: {e}")
 
-    input("\nНажмите Enter для продолжения...")
+    pause()
 
 
 def handle_show_statistics():
@@ -195,9 +204,10 @@ def handle_show_statistics():
         try:
             show_statistics(test_file)
         except Exception as e:
+            flush_output()
             print(f"❌ Ошибка при загрузке статистики: {e}")
 
-    input("\nНажмите Enter для продолжения...")
+    pause()
 
 
 def main():
@@ -228,7 +238,7 @@ def main():
         print("Программа завершена. До свидания! 👋")
     except Exception as e:
         print(f"❌ Произошла непредвиденная ошибка: {e}")
-        input("Нажмите Enter для выхода...")
+        pause("Нажмите Enter для выхода...")
 
 
 if __name__ == '__main__':
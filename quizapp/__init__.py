@@ -5,44 +5,171 @@
 и прохождения тестов через консольный интерфейс.
 
 Модули:
-    loader: Загрузка и сохранение тестов из JSON файлов
+    loader: Загрузка и сохранение тестов из JSON файлов, кэш загруженных тестов
     engine: Основная логика тестирования
     results: Вывод результатов и статистики
     commands: Обработчики команд для CLI
+    question: Компактное представление вопросов (Question, QuestionBank)
+    catalog: Каталог сведений о тестах с инкрементальным обновлением
+    grading: Пакетная проверка листов ответов
+    session: Состояние прохождения теста без ввода-вывода
+    server: HTTP сервер тестирования на asyncio
+    attempts: Журнал попыток только на добавление с потоковым чтением
+    compiled: Скомпилированный двоичный формат тестов с доступом через mmap
+    analysis: Анализ вопросов по журналу попыток (требует NumPy)
+    dedup: Поиск повторяющихся вопросов (MinHash/LSH)
+    matching: Сравнение текстовых ответов с нормализацией и допуском опечаток
+    validation: Параллельная проверка файлов тестов по полной схеме
+    instrument: Измерение времени этапов, счетчики и профилирование команд
+    render: Вывод через рендереры (терминал, JSON Lines, без вывода)
+    sampling: Выборка вопросов по весам, сложности и темам (alias method)
+    search: Полнотекстовый поиск вопросов по инвертированному индексу
 
 Основные классы:
     QuizEngine: Движок для проведения тестирования
     TestLoader: Класс для работы с файлами тестов
+    TestCatalog: Каталог сведений о тестах
+    Question: Вопрос теста в компактном представлении
+    QuestionBank: Набор вопросов теста
+    QuizSession: Сессия прохождения теста без ввода-вывода
 
 Основные функции:
     take_quiz: Проведение тестирования
     create_test: Создание нового теста
     list_tests: Показать доступные тесты
+    grade_batch: Пакетная проверка листов ответов
+    compile_test: Компиляция теста в двоичный формат
+
+Модули пакета загружаются при первом обращении к их именам, поэтому
+``import quizapp`` выполняется быстро.
 """
 
+import importlib
+
 __version__ = '1.0.0'
 __author__ = 'Quiz System'
 
-from .loader import load_test, save_test, list_available_tests
-from .engine import QuizEngine, take_quiz, take_random_quiz
-from .results import display_results, calculate_statistics
-from .commands import (
-    list_tests, take_test, take_random_test,
-    create_test, show_statistics
-)
+# Имена пакета и модули, в которых они определены. Модули импортируются
+# при первом обращении к имени (см. __getattr__), поэтому импорт пакета
+# не загружает asyncio, multiprocessing и другие тяжелые зависимости
+_EXPORTS = {
+    'load_test': 'loader',
+    'load_test_stream': 'loader',
+    'load_bank': 'loader',
+    'load_banks': 'loader',
+    'save_test': 'loader',
+    'append_question': 'loader',
+    'list_available_tests': 'loader',
+    'Question': 'question',
+    'QuestionBank': 'question',
+    'AnswerMatcher': 'matching',
+    'normalize_answer': 'matching',
+    'set_default_matcher': 'matching',
+    'Renderer': 'render',
+    'create_renderer': 'render',
+    'set_default_renderer': 'render',
+    'QuizSession': 'session',
+    'QuizEngine': 'engine',
+    'take_quiz': 'engine',
+    'take_random_quiz': 'engine',
+    'take_mixed_quiz': 'engine',
+    'QuestionSampler': 'sampling',
+    'display_results': 'results',
+    'calculate_statistics': 'results',
+    'ScoreSketch': 'results',
+    'StatisticsAccumulator': 'results',
+    'accumulate_attempts': 'results',
+    'grade_batch': 'grading',
+    'compile_test': 'compiled',
+    'AttemptLog': 'attempts',
+    'iter_attempts': 'attempts',
+    'item_analysis': 'analysis',
+    'find_duplicates': 'dedup',
+    'validate_files': 'validation',
+    'SearchIndex': 'search',
+    'search_questions': 'search',
+    'TestCatalog': 'catalog',
+    'get_test_info': 'catalog',
+    'list_tests': 'commands',
+    'take_test': 'commands',
+    'take_random_test': 'commands',
+    'take_mixed_test': 'commands',
+    'create_test': 'commands',
+    'show_statistics': 'commands',
+    'grade_submissions': 'commands',
+    'compile_tests': 'commands',
+    'show_attempt_statistics': 'commands',
+    'show_item_analysis': 'commands',
+    'find_duplicate_questions': 'commands',
+    'validate_tests': 'commands',
+    'search_tests': 'commands'
+}
+
+
+def __getattr__(name):
+    module_name = _EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    module = importlib.import_module(f'.{module_name}', __name__)
+    value = getattr(module, name)
+    # Следующие обращения не проходят через __getattr__
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_EXPORTS))
+
 
 __all__ = [
     'load_test',
+    'load_test_stream',
+    'load_bank',
+    'load_banks',
     'save_test',
+    'append_question',
     'list_available_tests',
+    'Question',
+    'QuestionBank',
+    'AnswerMatcher',
+    'normalize_answer',
+    'set_default_matcher',
+    'Renderer',
+    'create_renderer',
+    'set_default_renderer',
+    'QuizSession',
     'QuizEngine',
     'take_quiz',
     'take_random_quiz',
+    'take_mixed_quiz',
+    'QuestionSampler',
     'display_results',
     'calculate_statistics',
+    'ScoreSketch',
+    'StatisticsAccumulator',
+    'accumulate_attempts',
+    'grade_batch',
+    'compile_test',
+    'AttemptLog',
+    'iter_attempts',
+    'item_analysis',
+    'find_duplicates',
+    'validate_files',
+    'SearchIndex',
+    'search_questions',
+    'TestCatalog',
+    'get_test_info',
     'list_tests',
     'take_test',
     'take_random_test',
+    'take_mixed_test',
     'create_test',
-    'show_statistics'
+    'show_statistics',
+    'grade_submissions',
+    'compile_tests',
+    'show_attempt_statistics',
+    'show_item_analysis',
+    'find_duplicate_questions',
+    'validate_tests',
+    'search_tests'
 ]
\ No newline at end of file
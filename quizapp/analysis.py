@@ -0,0 +1,250 @@
+"""
+Модуль анализа вопросов по журналу попыток.
+
+Для каждого вопроса теста вычисляются классические показатели
+тестологии:
+
+    - p-value (трудность): доля правильных ответов на вопрос;
+    - дискриминативность: точечно-бисериальная корреляция правильности
+      ответа на вопрос с результатом попытки по остальным вопросам;
+    - частота выбора каждого варианта ответа (анализ дистракторов).
+
+Ответы из журнала складываются в матрицу «попытки × вопросы». Попытки
+обычно содержат лишь часть вопросов теста, поэтому матрица хранится
+в координатном виде (номер попытки, номер вопроса, правильность, выбранный
+вариант), а показатели вычисляются векторными операциями NumPy
+(np.bincount) без циклов Python по ответам.
+
+Модулю требуется NumPy (pip install numpy); остальная часть пакета
+работает без него.
+"""
+from array import array
+from typing import Dict, List, Any, Iterable, Optional
+
+from .loader import load_bank
+from .attempts import iter_attempts
+
+# Порог дискриминативности, ниже которого вопрос считается проблемным
+LOW_DISCRIMINATION = 0.2
+
+
+def _import_numpy():
+    """Импортирует NumPy с понятным сообщением, если он не установлен."""
+    try:
+        import numpy
+    except ImportError:
+        raise ImportError("Для анализа вопросов требуется NumPy: pip install numpy")
+    return numpy
+
+
+class ResponseMatrix:
+    """Разреженная матрица ответов «попытки × вопросы».
+
+    Attributes:
+        rows: Номер попытки для каждого ответа (numpy.ndarray).
+        columns: Номер вопроса теста для каждого ответа.
+        correct: Правильность каждого ответа (0 или 1).
+        choices: Номер выбранного варианта (с нуля) или -1.
+        attempts_count (int): Количество попыток.
+        questions_count (int): Количество вопросов теста.
+        skipped (int): Количество записей журнала, не найденных в тесте.
+
+    Example:
+        >>> matrix = ResponseMatrix.from_attempts(bank, iter_attempts(test=path))
+        >>> print(matrix.attempts_count, len(matrix.rows))
+    """
+
+    def __init__(self, rows, columns, correct, choices,
+                 attempts_count: int, questions_count: int, skipped: int = 0):
+        """Создает матрицу из массивов координат."""
+        self.rows = rows
+        self.columns = columns
+        self.correct = correct
+        self.choices = choices
+        self.attempts_count = attempts_count
+        self.questions_count = questions_count
+        self.skipped = skipped
+
+    @classmethod
+    def from_attempts(cls, bank: Any, records: Iterable[Dict[str, Any]]) -> 'ResponseMatrix':
+        """Строит матрицу по записям журнала попыток.
+
+        Args:
+            bank: Загруженный тест (QuestionBank).
+            records: Записи журнала для этого теста.
+
+        Returns:
+            ResponseMatrix.
+
+        Note:
+            Вопросы сопоставляются по тексту. Записи о вопросах, которых
+            нет в текущей версии теста, пропускаются и учитываются в skipped.
+        """
+        np = _import_numpy()
+
+        columns_by_text = {}
+        for index, question in enumerate(bank):
+            columns_by_text.setdefault(question.text, index)
+
+        rows_by_attempt = {}
+        rows, columns = array('l'), array('l')
+        correct, choices = array('b'), array('l')
+        skipped = 0
+        for record in records:
+            column = columns_by_text.get(record.get('question'))
+            if column is None:
+                skipped += 1
+                continue
+            row = rows_by_attempt.setdefault(record.get('attempt'), len(rows_by_attempt))
+            rows.append(row)
+            columns.append(column)
+            correct.append(1 if record.get('is_correct') else 0)
+            choice = record.get('choice')
+            choices.append(choice if choice is not None else -1)
+
+        return cls(np.asarray(rows, dtype=np.int64), np.asarray(columns, dtype=np.int64),
+                   np.asarray(correct, dtype=np.float64), np.asarray(choices, dtype=np.int64),
+                   len(rows_by_attempt), len(bank), skipped)
+
+
+def analyze_items(bank: Any, matrix: ResponseMatrix) -> Dict[str, Any]:
+    """Вычисляет показатели вопросов по матрице ответов.
+
+    Args:
+        bank: Загруженный тест (QuestionBank).
+        matrix: Матрица ответов на вопросы этого теста.
+
+    Returns:
+        Словарь с полями attempts, responses, skipped и items - списком
+        по вопросам теста. Элемент items содержит:
+        - question: Текст вопроса
+        - responses: Количество ответов
+        - p_value: Доля правильных ответов (None, если ответов нет)
+        - discrimination: Точечно-бисериальная корреляция с результатом
+          по остальным вопросам попытки (None, если ее нельзя вычислить)
+        - options: Для вопросов с вариантами - список словарей option,
+          count, share и is_correct
+
+    Note:
+        Результат попытки считается как доля правильных ответов на
+        остальные вопросы попытки, поэтому попытки со случайным набором
+        вопросов разной длины сравнимы между собой.
+    """
+    np = _import_numpy()
+    n_questions = matrix.questions_count
+    rows, columns, correct = matrix.rows, matrix.columns, matrix.correct
+
+    # Результат попытки без текущего вопроса
+    attempt_correct = np.bincount(rows, weights=correct, minlength=matrix.attempts_count)
+    attempt_answered = np.bincount(rows, minlength=matrix.attempts_count).astype(np.float64)
+    rest_answered = attempt_answered[rows] - 1
+    has_rest = rest_answered > 0
+    rest_score = np.divide(attempt_correct[rows] - correct, rest_answered,
+                           out=np.zeros_like(correct), where=has_rest)
+
+    # Суммы по вопросам для трудности и корреляции (только ответы,
+    # у которых в попытке есть другие вопросы)
+    responses = np.bincount(columns, minlength=n_questions)
+    right = np.bincount(columns, weights=correct, minlength=n_questions)
+    weight = has_rest.astype(np.float64)
+    n = np.bincount(columns, weights=weight, minlength=n_questions)
+    sum_x = np.bincount(columns, weights=correct * weight, minlength=n_questions)
+    sum_y = np.bincount(columns, weights=rest_score * weight, minlength=n_questions)
+    sum_y2 = np.bincount(columns, weights=rest_score * rest_score * weight, minlength=n_questions)
+    sum_xy = np.bincount(columns, weights=correct * rest_score * weight, minlength=n_questions)
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        p_values = right / responses
+        mean_x = sum_x / n
+        mean_y = sum_y / n
+        covariance = sum_xy / n - mean_x * mean_y
+        variance_x = mean_x * (1 - mean_x)
+        variance_y = sum_y2 / n - mean_y * mean_y
+        discrimination = covariance / np.sqrt(variance_x * variance_y)
+    discrimination[~np.isfinite(discrimination)] = np.nan
+
+    # Частоты выбора вариантов: плоский индекс (вопрос, вариант)
+    widths = [len(question.options) if question.options is not None else 0 for question in bank]
+    max_options = max(widths, default=0)
+    option_counts = None
+    if max_options:
+        # Варианты вне диапазона (тест изменился после записи) не учитываются
+        chosen = (matrix.choices >= 0) & (matrix.choices < np.asarray(widths)[columns])
+        option_counts = np.bincount(columns[chosen] * max_options + matrix.choices[chosen],
+                                    minlength=n_questions * max_options)
+        option_counts = option_counts.reshape(n_questions, max_options)
+
+    items = []
+    for index, question in enumerate(bank):
+        item = {
+            'question': question.text,
+            'responses': int(responses[index]),
+            'p_value': float(p_values[index]) if responses[index] else None,
+            'discrimination': (float(discrimination[index])
+                               if not np.isnan(discrimination[index]) else None)
+        }
+        if question.options is not None:
+            counts = option_counts[index, :widths[index]]
+            total = int(counts.sum())
+            item['options'] = [{
+                'option': option,
+                'count': int(count),
+                'share': int(count) / total if total else 0.0,
+                'is_correct': (option_index == question.correct_index
+                               if question.correct_index is not None
+                               else question.check(str(option_index + 1)))
+            } for option_index, (option, count) in enumerate(zip(question.options, counts))]
+        items.append(item)
+
+    return {
+        'attempts': matrix.attempts_count,
+        'responses': int(responses.sum()),
+        'skipped': matrix.skipped,
+        'items': items
+    }
+
+
+def item_analysis(test_file: str, user: Optional[str] = None,
+                  directory: Optional[str] = None) -> Dict[str, Any]:
+    """Выполняет анализ вопросов теста по журналу попыток.
+
+    Args:
+        test_file: Путь к файлу теста.
+        user: Имя пользователя. Если None, учитываются все пользователи.
+        directory: Папка журнала попыток (по умолчанию QUIZ_ATTEMPT_LOG).
+
+    Returns:
+        Результат analyze_items.
+
+    Raises:
+        ImportError: Если NumPy не установлен.
+    """
+    _import_numpy()
+    bank = load_bank(test_file)
+    matrix = ResponseMatrix.from_attempts(bank, iter_attempts(directory, test=test_file, user=user))
+    return analyze_items(bank, matrix)
+
+
+def problem_items(analysis: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """Возвращает вопросы с признаками проблем.
+
+    Проблемными считаются вопросы с низкой или отрицательной
+    дискриминативностью и вопросы, неправильный вариант которых
+    выбирают чаще правильного.
+
+    Args:
+        analysis: Результат analyze_items.
+
+    Returns:
+        Список элементов items.
+    """
+    problems = []
+    for item in analysis['items']:
+        discrimination = item['discrimination']
+        weak = discrimination is not None and discrimination < LOW_DISCRIMINATION
+        options = item.get('options') or []
+        correct_count = max((option['count'] for option in options if option['is_correct']), default=0)
+        misleading = any(option['count'] > correct_count for option in options if not option['is_correct'])
+        if weak or misleading:
+            problems.append(item)
+    return problems
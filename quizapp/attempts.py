@@ -0,0 +1,234 @@
+"""
+Модуль журнала попыток.
+
+Каждый ответ пользователя записывается в журнал только на добавление:
+папку с сегментами в формате JSON Lines. Каждый процесс пишет в свой
+сегмент, а записи накапливаются в памяти и сбрасываются на диск пачками,
+поэтому журналирование не замедляет прохождение теста.
+
+Записи читаются потоком (iter_attempts) с фильтрами по тесту,
+пользователю и времени, поэтому статистику можно считать по миллионам
+попыток при постоянном расходе памяти:
+
+    >>> calculate_statistics(iter_attempts(test='tests/math_test.json'))
+
+Папка журнала задается переменной окружения QUIZ_ATTEMPT_LOG
+(по умолчанию 'attempts'); пустое значение отключает журнал.
+"""
+import atexit
+import getpass
+import json
+import os
+import time
+import uuid
+from typing import Dict, List, Any, Iterator, Optional
+
+ATTEMPTS_DIR = 'attempts'
+SEGMENT_PREFIX = 'attempts-'
+SEGMENT_EXTENSION = '.jsonl'
+
+# Количество записей, после которого буфер сбрасывается на диск
+LOG_BATCH_SIZE = 256
+# Размер сегмента, после которого начинается новый сегмент
+MAX_SEGMENT_BYTES = 64 * 1024 * 1024
+
+_default_log = None
+
+
+def new_attempt_id() -> str:
+    """Возвращает идентификатор новой попытки прохождения теста."""
+    return uuid.uuid4().hex
+
+
+def current_user() -> str:
+    """Возвращает имя пользователя для журнала.
+
+    Returns:
+        Значение переменной окружения QUIZ_USER или имя пользователя ОС.
+    """
+    user = os.environ.get('QUIZ_USER')
+    if user:
+        return user
+    try:
+        return getpass.getuser()
+    except Exception:
+        return 'unknown'
+
+
+class AttemptLog:
+    """Журнал ответов с пакетной записью в сегменты JSON Lines.
+
+    Attributes:
+        directory (str): Папка журнала.
+        batch_size (int): Размер пачки записей.
+        max_segment_bytes (int): Максимальный размер сегмента.
+
+    Example:
+        >>> with AttemptLog('attempts') as log:
+        ...     log.record('tests/math_test.json', 'ivan', attempt_id,
+        ...                question, '2', True)
+    """
+
+    def __init__(self, directory: str = ATTEMPTS_DIR, batch_size: int = LOG_BATCH_SIZE,
+                 max_segment_bytes: int = MAX_SEGMENT_BYTES):
+        """Создает журнал.
+
+        Args:
+            directory: Папка журнала (создается при первой записи).
+            batch_size: Количество записей, после которого буфер
+                сбрасывается на диск.
+            max_segment_bytes: Размер сегмента, после которого
+                начинается новый сегмент.
+        """
+        self.directory = directory
+        self.batch_size = batch_size
+        self.max_segment_bytes = max_segment_bytes
+        self._buffer = []
+        self._segment = None
+        self._segment_number = 0
+
+    def record(self, test: str, user: str, attempt_id: str, question: Any,
+               user_answer: str, is_correct: bool) -> None:
+        """Добавляет ответ в журнал.
+
+        Args:
+            test: Путь к файлу теста.
+            user: Имя пользователя.
+            attempt_id: Идентификатор попытки (см. new_attempt_id).
+            question: Вопрос (Question).
+            user_answer: Ответ пользователя.
+            is_correct: Правильность ответа.
+        """
+        choice = None
+        if question.options is not None:
+            try:
+                choice = int(user_answer.strip()) - 1
+                if not 0 <= choice < len(question.options):
+                    choice = None
+            except ValueError:
+                pass
+
+        self._buffer.append(json.dumps({
+            'ts': time.time(),
+            'attempt': attempt_id,
+            'test': os.path.abspath(test),
+            'user': user,
+            'question': question.text,
+            'type': 'multiple_choice' if question.options is not None else 'text',
+            'choice': choice,
+            'user_answer': user_answer,
+            'correct_answer': question.answer,
+            'is_correct': is_correct
+        }, ensure_ascii=False))
+
+        if len(self._buffer) >= self.batch_size:
+            self.flush()
+
+    def flush(self) -> None:
+        """Записывает накопленные записи в текущий сегмент одной операцией."""
+        if not self._buffer:
+            return
+
+        data = ('\n'.join(self._buffer) + '\n').encode('utf-8')
+        self._buffer = []
+
+        if self._segment is None or (os.path.exists(self._segment) and
+                                     os.path.getsize(self._segment) >= self.max_segment_bytes):
+            os.makedirs(self.directory, exist_ok=True)
+            self._segment_number += 1
+            self._segment = os.path.join(self.directory, '{}{}-{}-{}{}'.format(
+                SEGMENT_PREFIX, time.strftime('%Y%m%d-%H%M%S'), os.getpid(),
+                self._segment_number, SEGMENT_EXTENSION))
+
+        with open(self._segment, 'ab') as file:
+            file.write(data)
+
+    def close(self) -> None:
+        """Сбрасывает буфер на диск."""
+        self.flush()
+
+    def __enter__(self) -> 'AttemptLog':
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+
+
+def get_attempt_log() -> Optional[AttemptLog]:
+    """Возвращает общий журнал попыток процесса.
+
+    Returns:
+        AttemptLog или None, если журнал отключен (QUIZ_ATTEMPT_LOG='').
+
+    Note:
+        Буфер журнала автоматически сбрасывается при завершении процесса.
+    """
+    global _default_log
+    directory = os.environ.get('QUIZ_ATTEMPT_LOG', ATTEMPTS_DIR)
+    if not directory:
+        return None
+    if _default_log is None or _default_log.directory != directory:
+        if _default_log is not None:
+            _default_log.close()
+        else:
+            atexit.register(lambda: _default_log and _default_log.close())
+        _default_log = AttemptLog(directory)
+    return _default_log
+
+
+def list_segments(directory: str = ATTEMPTS_DIR) -> List[str]:
+    """Возвращает сегменты журнала в порядке создания.
+
+    Args:
+        directory: Папка журнала.
+
+    Returns:
+        Список путей к файлам сегментов.
+    """
+    try:
+        names = os.listdir(directory)
+    except FileNotFoundError:
+        return []
+    return [os.path.join(directory, name) for name in sorted(names)
+            if name.startswith(SEGMENT_PREFIX) and name.endswith(SEGMENT_EXTENSION)]
+
+
+def iter_attempts(directory: str = None, test: Optional[str] = None,
+                  user: Optional[str] = None, since: Optional[float] = None,
+                  until: Optional[float] = None) -> Iterator[Dict[str, Any]]:
+    """Последовательно читает записи журнала с фильтрацией.
+
+    Args:
+        directory: Папка журнала. По умолчанию QUIZ_ATTEMPT_LOG или 'attempts'.
+        test: Путь к файлу теста.
+        user: Имя пользователя.
+        since: Начало периода (время Unix, включительно).
+        until: Конец периода (время Unix, не включительно).
+
+    Yields:
+        Записи журнала (словари) в порядке записи внутри сегмента.
+
+    Note:
+        В памяти одновременно находится одна запись. Поврежденные строки
+        (например, недописанные при сбое) пропускаются.
+    """
+    if directory is None:
+        directory = os.environ.get('QUIZ_ATTEMPT_LOG') or ATTEMPTS_DIR
+    test = os.path.abspath(test) if test else None
+
+    for segment in list_segments(directory):
+        with open(segment, 'r', encoding='utf-8') as file:
+            for line in file:
+                try:
+                    record = json.loads(line)
+                except ValueError:
+                    continue
+                if test is not None and record.get('test') != test:
+                    continue
+                if user is not None and record.get('user') != user:
+                    continue
+                if since is not None and record.get('ts', 0) < since:
+                    continue
+                if until is not None and record.get('ts', 0) >= until:
+                    continue
+                yield record
@@ -0,0 +1,198 @@
+"""
+Модуль каталога тестов.
+
+Каталог хранит краткие сведения о каждом файле теста (название, описание,
+количество вопросов и распределение по типам вопросов) в служебном файле,
+чтобы команды вроде --list-tests и --stats не разбирали JSON файлы тестов
+при каждом запуске.
+
+Записи каталога привязаны к пути, времени изменения и размеру файла.
+Каталог обновляется инкрементально: повторно разбираются только те файлы,
+которые изменились с момента последнего обновления.
+"""
+import json
+import os
+from typing import Dict, List, Any, Optional, Tuple
+
+from .loader import TestLoader, list_available_tests
+
+CACHE_DIR = '.quizcache'
+CATALOG_FILE = os.path.join(CACHE_DIR, 'catalog.json')
+CATALOG_VERSION = 1
+
+
+def summarize_test(test_data: Dict[str, Any]) -> Dict[str, Any]:
+    """Формирует краткие сведения о тесте для каталога.
+
+    Args:
+        test_data: Данные теста, загруженные из JSON файла.
+
+    Returns:
+        Словарь с названием, описанием, количеством вопросов
+        и распределением вопросов по типам.
+    """
+    questions = test_data.get('questions', [])
+    multiple_choice = sum(1 for question in questions if 'options' in question)
+
+    return {
+        'title': test_data.get('title', 'Без названия'),
+        'description': test_data.get('description', ''),
+        'questions_count': len(questions),
+        'question_types': {
+            'multiple_choice': multiple_choice,
+            'text': len(questions) - multiple_choice
+        }
+    }
+
+
+class TestCatalog:
+    """Каталог сведений о тестах с инкрементальным обновлением.
+
+    Attributes:
+        catalog_path (str): Путь к служебному файлу каталога.
+        entries (Dict[str, Dict]): Записи каталога по абсолютному пути теста.
+
+    Example:
+        >>> catalog = TestCatalog()
+        >>> info = catalog.get('tests/math_test.json')
+        >>> print(info['questions_count'])
+        5
+    """
+
+    def __init__(self, catalog_path: str = CATALOG_FILE):
+        """Инициализирует каталог и читает сохраненные записи.
+
+        Args:
+            catalog_path: Путь к служебному файлу каталога.
+        """
+        self.catalog_path = catalog_path
+        self.entries = {}
+        self._dirty = False
+        self._load()
+
+    def _load(self) -> None:
+        """Читает записи каталога из служебного файла.
+
+        Note:
+            Поврежденный или устаревший файл каталога игнорируется,
+            каталог в этом случае будет построен заново.
+        """
+        try:
+            with open(self.catalog_path, 'r', encoding='utf-8') as file:
+                data = json.load(file)
+        except (OSError, ValueError):
+            return
+
+        if isinstance(data, dict) and data.get('version') == CATALOG_VERSION:
+            self.entries = data.get('entries', {})
+
+    def save(self) -> None:
+        """Сохраняет каталог, если в нем есть изменения.
+
+        Note:
+            Файл записывается во временный файл и затем атомарно
+            переименовывается. Ошибки записи не считаются фатальными:
+            каталог лишь ускоряет работу и будет построен при следующем запуске.
+        """
+        if not self._dirty:
+            return
+
+        temp_path = self.catalog_path + '.tmp'
+        try:
+            os.makedirs(os.path.dirname(self.catalog_path) or '.', exist_ok=True)
+            with open(temp_path, 'w', encoding='utf-8') as file:
+                json.dump({'version': CATALOG_VERSION, 'entries': self.entries},
+                          file, ensure_ascii=False)
+            os.replace(temp_path, self.catalog_path)
+            self._dirty = False
+        except OSError:
+            pass
+
+    def get(self, file_path: str) -> Dict[str, Any]:
+        """Возвращает сведения о тесте, при необходимости обновляя запись.
+
+        Args:
+            file_path: Путь к файлу теста.
+
+        Returns:
+            Словарь со сведениями о тесте (см. summarize_test).
+
+        Raises:
+            FileNotFoundError: Если файл не найден.
+            ValueError: Если файл теста не удалось загрузить. Ошибка также
+                запоминается в каталоге до следующего изменения файла.
+        """
+        key = os.path.abspath(file_path)
+        try:
+            stat = os.stat(file_path)
+        except FileNotFoundError:
+            if self.entries.pop(key, None) is not None:
+                self._dirty = True
+            raise FileNotFoundError(f"Файл теста не найден: {file_path}")
+
+        entry = self.entries.get(key)
+        if (entry is None or entry['mtime_ns'] != stat.st_mtime_ns
+                or entry['size'] != stat.st_size):
+            entry = {'mtime_ns': stat.st_mtime_ns, 'size': stat.st_size}
+            try:
+                entry.update(summarize_test(TestLoader.load_test(file_path)))
+            except Exception as e:
+                entry['error'] = str(e)
+            self.entries[key] = entry
+            self._dirty = True
+
+        if 'error' in entry:
+            raise ValueError(entry['error'])
+
+        return entry
+
+    def refresh(self, test_paths: Optional[List[str]] = None) -> List[Tuple[str, Any]]:
+        """Обновляет каталог для списка тестов.
+
+        Args:
+            test_paths: Пути к файлам тестов. Если None, используются все
+                тесты, найденные list_available_tests; записи об исчезнувших
+                файлах при этом удаляются.
+
+        Returns:
+            Список пар (путь, сведения о тесте). Для файлов, которые не
+            удалось загрузить, вместо сведений возвращается исключение.
+        """
+        prune = test_paths is None
+        if test_paths is None:
+            test_paths = list_available_tests()
+
+        results = []
+        for test_path in test_paths:
+            try:
+                results.append((test_path, self.get(test_path)))
+            except Exception as e:
+                results.append((test_path, e))
+
+        if prune:
+            known = {os.path.abspath(test_path) for test_path in test_paths}
+            for key in [key for key in self.entries if key not in known]:
+                del self.entries[key]
+                self._dirty = True
+
+        self.save()
+        return results
+
+
+def get_test_info(file_path: str) -> Dict[str, Any]:
+    """Возвращает сведения о тесте из каталога.
+
+    Args:
+        file_path: Путь к файлу теста.
+
+    Returns:
+        Словарь со сведениями о тесте.
+
+    See Also:
+        TestCatalog.get: Реализация метода класса.
+    """
+    catalog = TestCatalog()
+    try:
+        return catalog.get(file_path)
+    finally:
+        catalog.save()
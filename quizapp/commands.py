@@ -3,19 +3,29 @@
 
 Этот модуль содержит функции, которые вызываются из main.py
 для обработки различных команд пользователя.
+
+Модули, нужные только отдельным командам (движок тестирования, сервер,
+пакетная проверка, анализ), импортируются внутри этих команд, чтобы
+быстрые команды вроде --list-tests не тратили время на их загрузку.
 """
+import json
+import math
 import os
+import time
+from typing import Dict, List
 
 from .loader import TestLoader, list_available_tests
-from .engine import take_quiz, take_random_quiz
-from .results import display_results
+from .catalog import TestCatalog, get_test_info
+from .results import display_results, accumulate_attempts
+from .render import echo, ask, flush_output
 
 
 def list_tests():
     """Показывает список доступных тестов с их описанием.
 
        Выводит форматированный список всех найденных тестов с информацией
-       о количестве вопросов и названии теста.
+       о количестве вопросов и названии теста. Сведения берутся из каталога
+       тестов, поэтому повторно разбираются только изменившиеся файлы.
 
        Example:
            >>> list_tests()
@@ -26,57 +36,90 @@ def list_tests():
     tests = list_available_tests()
 
     if not tests:
-        print("Тесты не найдены.")
-        print("Создайте тест с помощью команды: python main.py --create-test")
+        echo("Тесты не найдены.")
+        echo("Создайте тест с помощью команды: python main.py --create-test")
         return
 
-    print("Доступные тесты:")
-    for i, test_path in enumerate(tests, 1):
-        try:
-            test_data = TestLoader.load_test(test_path)
-            title = test_data.get('title', 'Без названия')
-            questions_count = len(test_data.get('questions', []))
-            print(f"{i}. {title} ({questions_count} вопросов) - {test_path}")
-        except Exception as e:
-            print(f"{i}. Ошибка загрузки: {test_path} ({e})")
+    echo("Доступные тесты:")
+    for i, (test_path, info) in enumerate(TestCatalog().refresh(), 1):
+        if isinstance(info, Exception):
+            echo(f"{i}. Ошибка загрузки: {test_path} ({info})")
+        else:
+            echo(f"{i}. {info['title']} ({info['questions_count']} вопросов) - {test_path}")
 
 
-def take_test(test_file: str):
+def take_test(test_file: str, stream: bool = False):
     """Запускает прохождение указанного теста.
 
         Args:
             test_file: Путь к файлу теста.
+            stream: Читать вопросы потоком, не загружая весь тест в память.
 
         Raises:
             Exception: Если произошла ошибка при прохождении теста.
         """
+    from .engine import take_quiz
+
     if not os.path.exists(test_file):
-        print(f"Файл теста не найден: {test_file}")
+        echo(f"Файл теста не найден: {test_file}")
         return
 
     try:
-        score, total, user_answers = take_quiz(test_file)
+        score, total, user_answers = take_quiz(test_file, stream)
         display_results(score, total, user_answers)
     except Exception as e:
-        print(f"Ошибка при прохождении теста: {e}")
+        echo(f"Ошибка при прохождении теста: {e}")
 
 
-def take_random_test(test_file: str, count: int):
+def take_random_test(test_file: str, count: int, seed: int = None,
+                     difficulty: Dict[str, float] = None, tags: Dict[str, int] = None,
+                     weighted: bool = False):
     """Запускает прохождение теста со случайными вопросами.
 
      Args:
          test_file: Путь к файлу теста.
          count: Количество случайных вопросов.
+         seed: Начальное значение генератора для воспроизводимого варианта.
+         difficulty: Доли сложностей, например {'easy': 30, 'medium': 50, 'hard': 20}.
+         tags: Наименьшее количество вопросов по темам.
+         weighted: Выбирать вопросы с вероятностью по весу.
      """
+    from .engine import take_random_quiz
+
     if not os.path.exists(test_file):
-        print(f"Файл теста не найден: {test_file}")
+        echo(f"Файл теста не найден: {test_file}")
+        return
+
+    try:
+        score, total, user_answers = take_random_quiz(test_file, count, seed, difficulty, tags, weighted)
+        display_results(score, total, user_answers)
+    except Exception as e:
+        echo(f"Ошибка при прохождении теста: {e}")
+
+
+def take_mixed_test(test_files: List[str], count: int = None,
+                    quotas: List[int] = None, seed: int = None):
+    """Запускает прохождение теста из вопросов нескольких тестов.
+
+     Args:
+         test_files: Пути к файлам тестов.
+         count: Количество случайных вопросов из всех тестов вместе.
+             Если None и квоты не заданы, задаются все вопросы.
+         quotas: Количество случайных вопросов из каждого теста.
+         seed: Начальное значение генератора для воспроизводимого варианта.
+     """
+    from .engine import take_mixed_quiz
+
+    missing = [test_file for test_file in test_files if not os.path.exists(test_file)]
+    if missing:
+        echo(f"Файлы тестов не найдены: {', '.join(missing)}")
         return
 
     try:
-        score, total, user_answers = take_random_quiz(test_file, count)
+        score, total, user_answers = take_mixed_quiz(test_files, count, quotas, seed)
         display_results(score, total, user_answers)
     except Exception as e:
-        print(f"Ошибка при прохождении теста: {e}")
+        echo(f"Ошибка при прохождении теста: {e}")
 
 
 def create_test():
@@ -88,54 +131,54 @@ def create_test():
         Note:
             Поддерживает создание вопросов с вариантами ответов и текстовых вопросов.
         """
-    print("Создание нового теста")
-    print("=" * 30)
+    echo("Создание нового теста")
+    echo("=" * 30)
 
-    title = input("Введите название теста: ").strip()
+    title = ask("Введите название теста: ").strip()
     if not title:
-        print("Название теста не может быть пустым.")
+        echo("Название теста не может быть пустым.")
         return
 
     questions = []
 
     while True:
-        print(f"\n--- Вопрос {len(questions) + 1} ---")
-        question_text = input("Введите текст вопроса: ").strip()
+        echo(f"\n--- Вопрос {len(questions) + 1} ---")
+        question_text = ask("Введите текст вопроса: ").strip()
 
         if not question_text:
-            print("Текст вопроса не может быть пустым.")
+            echo("Текст вопроса не может быть пустым.")
             continue
 
-        question_type = input("Тип вопроса (1 - с вариантами, 2 - текстовый): ").strip()
+        question_type = ask("Тип вопроса (1 - с вариантами, 2 - текстовый): ").strip()
 
         if question_type == '1':
             # Вопрос с вариантами ответов
             options = []
-            print("Введите варианты ответов (пустая строка для завершения):")
+            echo("Введите варианты ответов (пустая строка для завершения):")
 
             while True:
-                option = input(f"Вариант {len(options) + 1}: ").strip()
+                option = ask(f"Вариант {len(options) + 1}: ").strip()
                 if not option:
                     if len(options) < 2:
-                        print("Нужно как минимум 2 варианта ответа.")
+                        echo("Нужно как минимум 2 варианта ответа.")
                         continue
                     break
                 options.append(option)
 
-            print("Варианты ответов:")
+            echo("Варианты ответов:")
             for i, option in enumerate(options, 1):
-                print(f"{i}. {option}")
+                echo(f"{i}. {option}")
 
-            correct_option = input("Номер правильного варианта: ").strip()
+            correct_option = ask("Номер правильного варианта: ").strip()
             try:
                 correct_index = int(correct_option) - 1
                 if 0 <= correct_index < len(options):
                     correct_answer = options[correct_index]
                 else:
-                    print("Неверный номер варианта.")
+                    echo("Неверный номер варианта.")
                     continue
             except ValueError:
-                print("Введите число.")
+                echo("Введите число.")
                 continue
 
             questions.append({
@@ -146,28 +189,33 @@ def create_test():
 
         else:
             # Текстовый вопрос
-            correct_answer = input("Правильный ответ: ").strip()
+            correct_answer = ask("Правильный ответ: ").strip()
             if not correct_answer:
-                print("Правильный ответ не может быть пустым.")
+                echo("Правильный ответ не может быть пустым.")
                 continue
 
-            questions.append({
+            question_data = {
                 'question': question_text,
                 'answer': correct_answer
-            })
-
-        add_more = input("Добавить еще вопрос? (y/n): ").strip().lower()
+            }
+            aliases = ask("Другие допустимые ответы через ';' (необязательно): ").strip()
+            aliases = [alias.strip() for alias in aliases.split(';') if alias.strip()]
+            if aliases:
+                question_data['aliases'] = aliases
+            questions.append(question_data)
+
+        add_more = ask("Добавить еще вопрос? (y/n): ").strip().lower()
         if add_more != 'y':
             break
 
     test_data = {
         'title': title,
-        'description': input("Описание теста (необязательно): ").strip(),
+        'description': ask("Описание теста (необязательно): ").strip(),
         'questions': questions
     }
 
     # Сохранение теста
-    file_name = input("Имя файла для сохранения (например: my_test.json): ").strip()
+    file_name = ask("Имя файла для сохранения (например: my_test.json): ").strip()
     if not file_name.endswith('.json'):
         file_name += '.json'
 
@@ -177,9 +225,9 @@ def create_test():
 
     try:
         TestLoader.save_test(test_data, file_name)
-        print(f"Тест успешно сохранен в файл: {file_name}")
+        echo(f"Тест успешно сохранен в файл: {file_name}")
     except Exception as e:
-        print(f"Ошибка при сохранении теста: {e}")
+        echo(f"Ошибка при сохранении теста: {e}")
 
 
 def show_statistics(test_file: str):
@@ -189,32 +237,350 @@ def show_statistics(test_file: str):
           test_file: Путь к файлу теста.
 
       Выводит информацию о тесте: название, описание, количество вопросов,
-      распределение по типам вопросов.
+      распределение по типам вопросов. Сведения берутся из каталога тестов.
       """
     if not os.path.exists(test_file):
-        print(f"Файл теста не найден: {test_file}")
+        echo(f"Файл теста не найден: {test_file}")
         return
 
     try:
-        test_data = TestLoader.load_test(test_file)
-        questions_count = len(test_data.get('questions', []))
+        info = get_test_info(test_file)
 
-        print(f"Статистика теста: {test_data.get('title', 'Без названия')}")
-        print(f"Количество вопросов: {questions_count}")
-        print(f"Описание: {test_data.get('description', 'Не указано')}")
+        echo(f"Статистика теста: {info['title']}")
+        echo(f"Количество вопросов: {info['questions_count']}")
+        echo(f"Описание: {info['description'] or 'Не указано'}")
+        echo(f"Вопросы с вариантами ответов: {info['question_types']['multiple_choice']}")
+        echo(f"Текстовые вопросы: {info['question_types']['text']}")
 
-        # Анализ типов вопросов
-        multiple_choice = 0
-        text_questions = 0
-
-        for question in test_data.get('questions', []):
-            if 'options' in question:
-                multiple_choice += 1
-            else:
-                text_questions += 1
+    except Exception as e:
+        echo(f"Ошибка при загрузке статистики: {e}")
 
-        print(f"Вопросы с вариантами ответов: {multiple_choice}")
-        print(f"Текстовые вопросы: {text_questions}")
 
+def _read_submissions(submissions_file: str):
+    """Лениво читает листы ответов из JSONL файла, пропуская некорректные строки."""
+    with open(submissions_file, 'r', encoding='utf-8') as file:
+        for line_number, line in enumerate(file, 1):
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                submission = json.loads(line)
+            except json.JSONDecodeError as e:
+                echo(f"Строка {line_number} пропущена: некорректный JSON ({e})")
+                continue
+            if not isinstance(submission, dict) or not isinstance(submission.get('answers'), list):
+                echo(f"Строка {line_number} пропущена: лист ответов должен быть объектом "
+                     f"со списком answers")
+                continue
+            yield submission
+
+
+def grade_submissions(test_file: str, submissions_file: str,
+                      output_file: str = None, workers: int = None) -> bool:
+    """Проверяет листы ответов из JSONL файла без интерактивного ввода.
+
+    Args:
+        test_file: Путь к файлу теста.
+        submissions_file: JSONL файл с листами ответов (по одному на строку).
+        output_file: JSONL файл для результатов. По умолчанию рядом с файлом
+            листов ответов с суффиксом _results.
+        workers: Количество процессов для проверки (по умолчанию - по числу ядер).
+
+    Returns:
+        True, если проверка выполнена; False, если файл не найден или
+        проверка прервана ошибкой.
+
+    Note:
+        Некорректные строки файла листов ответов пропускаются с сообщением.
+        Результаты записываются по мере проверки, поэтому файл листов ответов
+        может быть сколь угодно большим.
+    """
+    from .grading import grade_batch
+
+    for path in (test_file, submissions_file):
+        if not os.path.exists(path):
+            echo(f"Файл не найден: {path}")
+            return False
+
+    if output_file is None:
+        base, _ = os.path.splitext(submissions_file)
+        output_file = f"{base}_results.jsonl"
+
+    count = 0
+    total_score = 0
+    start = time.perf_counter()
+    try:
+        with open(output_file, 'w', encoding='utf-8') as output:
+            for result in grade_batch(test_file, _read_submissions(submissions_file), workers):
+                output.write(json.dumps(result, ensure_ascii=False) + '\n')
+                count += 1
+                total_score += result['percentage']
     except Exception as e:
-        print(f"Ошибка при загрузке статистики: {e}")
\ No newline at end of file
+        echo(f"Ошибка при проверке ответов: {e}")
+        return False
+    elapsed = time.perf_counter() - start
+
+    echo(f"Проверено листов ответов: {count}")
+    if count:
+        echo(f"Средний результат: {total_score / count:.1f}%")
+    echo(f"Время: {elapsed:.2f} с ({count / elapsed if elapsed > 0 else 0:.0f} листов/с)")
+    echo(f"Результаты сохранены в файл: {output_file}")
+    return True
+
+
+def run_server(host: str = '127.0.0.1', port: int = 8080):
+    """Запускает HTTP сервер для прохождения тестов.
+
+    Args:
+        host: Адрес для прослушивания.
+        port: Порт для прослушивания.
+
+    See Also:
+        quizapp.server: Описание точек доступа сервера.
+    """
+    from .server import serve
+
+    serve(host, port)
+
+
+def _expand_test_paths(paths: list) -> List[str]:
+    """Раскрывает папки в списке путей в JSON файлы тестов."""
+    test_files = []
+    for path in paths:
+        if os.path.isdir(path):
+            test_files.extend(sorted(
+                os.path.join(path, name) for name in os.listdir(path) if name.endswith('.json')))
+        else:
+            test_files.append(path)
+    return test_files
+
+
+def compile_tests(paths: list):
+    """Компилирует тесты в двоичный формат для быстрого запуска.
+
+    Args:
+        paths: Пути к JSON файлам тестов или к папкам с ними.
+
+    Note:
+        Скомпилированный файл .qbin создается рядом с исходным и
+        используется автоматически, пока исходный файл не изменится.
+    """
+    from .compiled import compile_test
+
+    test_files = _expand_test_paths(paths)
+    if not test_files:
+        echo("Тесты не найдены.")
+        return
+
+    for test_file in test_files:
+        try:
+            result = compile_test(test_file)
+            echo(f"{test_file} -> {result['output_path']} ({result['questions_count']} вопросов)")
+        except Exception as e:
+            echo(f"Ошибка компиляции {test_file}: {e}")
+
+
+def show_attempt_statistics(test_file: str = None, user: str = None):
+    """Показывает статистику по журналу попыток.
+
+    Args:
+        test_file: Путь к файлу теста. Если None, учитываются все тесты.
+        user: Имя пользователя. Если None, учитываются все пользователи.
+
+    Note:
+        Журнал читается потоком: записи не хранятся в памяти, остаются
+        только два счетчика на попытку (см. accumulate_attempts).
+    """
+    from .attempts import iter_attempts
+
+    stats = accumulate_attempts(iter_attempts(test=test_file, user=user)).to_dict()
+    if not stats:
+        echo("В журнале попыток нет подходящих записей.")
+        return
+
+    echo(f"Статистика попыток: {test_file or 'все тесты'}"
+         f"{f' (пользователь {user})' if user else ''}")
+    echo(f"Ответов: {stats['total_questions']}")
+    echo(f"Правильных ответов: {stats['correct_answers']} ({stats['percentage']:.1f}%)")
+    names = {'multiple_choice': 'С вариантами ответов', 'text': 'Текстовые'}
+    for q_type, type_stats in stats['question_types'].items():
+        echo(f"{names.get(q_type, q_type)}: {type_stats['correct']}/{type_stats['total']}")
+    if 'attempts' in stats:
+        percentiles = stats['score_percentiles']
+        echo(f"Попыток: {stats['attempts']}, средний результат: {stats['score_mean']:.1f}% "
+             f"(стандартное отклонение {math.sqrt(stats['score_variance']):.1f})")
+        echo(f"Результаты: медиана {percentiles['p50']:.1f}%, p90 {percentiles['p90']:.1f}%, "
+             f"p99 {percentiles['p99']:.1f}%")
+
+
+def show_item_analysis(test_file: str, user: str = None):
+    """Показывает статистику теста и анализ его вопросов по журналу попыток.
+
+    Args:
+        test_file: Путь к файлу теста.
+        user: Имя пользователя. Если None, учитываются все пользователи.
+
+    Дополняет сведения show_statistics показателями каждого вопроса:
+    долей правильных ответов (трудность), дискриминативностью
+    и частотой выбора вариантов ответа. Требует NumPy.
+    """
+    from .analysis import item_analysis, problem_items
+
+    if not os.path.exists(test_file):
+        echo(f"Файл теста не найден: {test_file}")
+        return
+
+    show_statistics(test_file)
+    analysis = item_analysis(test_file, user)
+    echo(f"\nПопыток: {analysis['attempts']}, ответов: {analysis['responses']}")
+    if analysis['skipped']:
+        echo(f"Пропущено ответов на вопросы, которых нет в тесте: {analysis['skipped']}")
+    if not analysis['responses']:
+        echo("В журнале попыток нет ответов на вопросы этого теста.")
+        return
+
+    def number(value):
+        return f"{value:.2f}" if value is not None else "—"
+
+    for index, item in enumerate(analysis['items'], 1):
+        echo(f"\n{index}. {item['question']}")
+        echo(f"   Ответов: {item['responses']}, трудность (p): {number(item['p_value'])}, "
+             f"дискриминативность: {number(item['discrimination'])}")
+        for option in item.get('options', []):
+            mark = ' ✓' if option['is_correct'] else ''
+            echo(f"     {option['option']}: {option['count']} ({option['share'] * 100:.1f}%){mark}")
+
+    problems = problem_items(analysis)
+    if problems:
+        echo("\nВопросы, требующие проверки:")
+        for item in problems:
+            echo(f"- {item['question']}")
+
+
+def find_duplicate_questions(paths: list = None, output_file: str = None):
+    """Ищет повторяющиеся вопросы и варианты ответа в тестах.
+
+    Args:
+        paths: Пути к файлам тестов или папкам с ними. Если не заданы,
+            проверяются все тесты, найденные list_available_tests.
+        output_file: Путь к JSON файлу для полного отчета.
+    """
+    from .dedup import find_duplicates
+
+    test_files = _expand_test_paths(paths) if paths else list_available_tests()
+    if not test_files:
+        echo("Тесты не найдены.")
+        return
+
+    report = find_duplicates(test_files)
+    echo(f"Проверено вопросов: {report['questions']} в {report['files']} файлах")
+
+    def print_groups(title, groups):
+        echo(f"\n{title}: {len(groups)}")
+        for number, group in enumerate(groups, 1):
+            echo(f"{number}.")
+            for item in group:
+                echo(f"   {item['test']} #{item['index'] + 1}: {item['question']}")
+
+    print_groups("Точные повторы", report['exact'])
+    print_groups("Почти повторы", report['near'])
+    if report['evicted']:
+        echo(f"Корзины LSH переполнялись ({report['evicted']} раз): часть почти повторов "
+             f"могла быть не найдена")
+
+    echo(f"\nВопросы с повторяющимися вариантами ответа: {len(report['duplicate_options'])}")
+    for item in report['duplicate_options']:
+        echo(f"   {item['test']} #{item['index'] + 1}: {item['question']} "
+             f"(повторяются: {', '.join(item['options'])})")
+
+    for error in report['errors']:
+        echo(f"Ошибка чтения {error['test']}: {error['error']}")
+
+    if output_file:
+        with open(output_file, 'w', encoding='utf-8') as file:
+            json.dump(report, file, ensure_ascii=False, indent=2)
+        echo(f"\nОтчет сохранен: {output_file}")
+
+
+def validate_tests(paths: list = None, output_file: str = None, workers: int = None) -> bool:
+    """Проверяет файлы тестов по полной схеме.
+
+    Args:
+        paths: Пути к файлам тестов или папкам с ними. Если не заданы,
+            проверяются все тесты, найденные list_available_tests.
+        output_file: Путь к JSON файлу для отчета; '-' - вывести отчет
+            в стандартный вывод вместо текстовой сводки.
+        workers: Количество процессов (по умолчанию по числу ядер).
+
+    Returns:
+        True, если все тесты корректны.
+    """
+    from .validation import validate_files
+
+    test_files = _expand_test_paths(paths) if paths else list_available_tests()
+    report = validate_files(test_files, workers)
+
+    if output_file == '-':
+        # Отчет для программ выводится как есть, без рендерера
+        flush_output()
+        print(json.dumps(report, ensure_ascii=False, indent=2))
+        return report['invalid'] == 0
+
+    for result in report['results']:
+        if result['valid'] and not result['warnings']:
+            continue
+        echo(f"{'✓' if result['valid'] else '✗'} {result['test']}")
+        for kind, entries in (('Ошибка', result['errors']), ('Предупреждение', result['warnings'])):
+            for entry in entries:
+                where = f"вопрос {entry['question']}: " if entry['question'] is not None else ""
+                echo(f"   {kind}: {where}{entry['message']}")
+
+    echo(f"Проверено файлов: {report['files']}, корректных: {report['valid']}, "
+         f"с ошибками: {report['invalid']}")
+
+    if output_file:
+        with open(output_file, 'w', encoding='utf-8') as file:
+            json.dump(report, file, ensure_ascii=False, indent=2)
+        echo(f"Отчет сохранен: {output_file}")
+    return report['invalid'] == 0
+
+
+def search_tests(query: str, limit: int = 10):
+    """Ищет вопросы во всех тестах по словам запроса.
+
+    Перед поиском индекс обновляется: разбираются только новые
+    и изменившиеся файлы тестов.
+
+    Args:
+        query: Текст запроса.
+        limit: Наибольшее количество результатов.
+
+    Example:
+        >>> search_tests('квадратный корень')
+        1. Чему равен квадратный корень из 16?
+           tests/math_test.json, вопрос 2 (Математический тест)
+    """
+    from .search import SearchIndex
+
+    start = time.perf_counter()
+    with SearchIndex() as index:
+        stats = index.update()
+        updated = time.perf_counter()
+        results = index.search(query, limit)
+    finished = time.perf_counter()
+
+    if stats['indexed'] or stats['removed']:
+        echo(f"Индекс обновлен: файлов переиндексировано {stats['indexed']}, "
+             f"удалено {stats['removed']} ({(updated - start) * 1000:.1f} мс)")
+    if stats['errors']:
+        echo(f"Не удалось прочитать файлов: {stats['errors']}")
+
+    if not results:
+        echo(f"По запросу «{query}» ничего не найдено.")
+        return
+
+    echo(f"Найдено вопросов: {len(results)} (поиск {(finished - updated) * 1000:.1f} мс)")
+    for number, result in enumerate(results, 1):
+        echo(f"{number}. {result['question']}")
+        title = f" ({result['title']})" if result['title'] else ""
+        echo(f"   {result['test']}, вопрос {result['index'] + 1}{title}")
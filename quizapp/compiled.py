@@ -0,0 +1,226 @@
+"""
+Модуль скомпилированного двоичного формата тестов.
+
+Тест из JSON файла компилируется в файл с расширением .qbin, который
+открывается через mmap. Запуск теста после этого не требует разбора всего
+файла: читается только заголовок, а вопрос с номером i декодируется из
+своей записи по таблице смещений. Несколько процессов, открывших один
+и тот же файл, разделяют страницы в кэше операционной системы.
+
+Структура файла (все числа little-endian):
+    Заголовок     '<4sHIQQ': сигнатура QZB1, версия формата, длина
+                  метаданных, количество вопросов, смещение таблицы
+    Метаданные    JSON: title, description и сведения об исходном файле
+                  (source_size, source_mtime_ns)
+    Записи        Вопросы в компактном JSON (UTF-8), одна запись на вопрос
+    Таблица       count + 1 смещений uint64: начало каждой записи и конец
+                  последней записи
+"""
+import json
+import mmap
+import os
+import struct
+import sys
+from array import array
+from collections.abc import Sequence
+from typing import Dict, Any, Optional
+
+from .question import Question, QuestionBank
+
+COMPILED_EXTENSION = '.qbin'
+FORMAT_MAGIC = b'QZB1'
+FORMAT_VERSION = 1
+
+_HEADER = struct.Struct('<4sHIQQ')
+_OFFSET = struct.Struct('<Q')
+_OFFSET_PAIR = struct.Struct('<QQ')
+
+
+def compiled_path(file_path: str) -> str:
+    """Возвращает путь к скомпилированному файлу для JSON файла теста.
+
+    Args:
+        file_path: Путь к JSON файлу теста.
+
+    Returns:
+        Путь к файлу .qbin рядом с исходным файлом.
+    """
+    return os.path.splitext(file_path)[0] + COMPILED_EXTENSION
+
+
+class MappedQuestions(Sequence):
+    """Последовательность вопросов, читаемых из скомпилированного файла.
+
+    Вопросы не хранятся в памяти процесса: при обращении по номеру
+    декодируется только соответствующая запись отображенного файла.
+
+    Attributes:
+        file_path (str): Путь к скомпилированному файлу.
+        metadata (Dict[str, Any]): Метаданные из заголовка файла.
+
+    Example:
+        >>> questions = MappedQuestions('tests/math_test.qbin')
+        >>> print(len(questions), questions[3].text)
+    """
+
+    def __init__(self, file_path: str):
+        """Открывает скомпилированный файл и читает заголовок.
+
+        Args:
+            file_path: Путь к файлу .qbin.
+
+        Raises:
+            FileNotFoundError: Если файл не найден.
+            ValueError: Если файл поврежден или имеет другую версию формата.
+        """
+        self.file_path = file_path
+        with open(file_path, 'rb') as file:
+            self._mmap = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+
+        try:
+            magic, version, metadata_size, count, index_offset = _HEADER.unpack_from(self._mmap, 0)
+        except struct.error:
+            raise ValueError(f"Поврежденный файл теста: {file_path}")
+        if magic != FORMAT_MAGIC or version != FORMAT_VERSION:
+            raise ValueError(f"Неподдерживаемый формат файла теста: {file_path}")
+        if index_offset + (count + 1) * _OFFSET.size > len(self._mmap):
+            raise ValueError(f"Поврежденный файл теста: {file_path}")
+
+        self.metadata = json.loads(self._mmap[_HEADER.size:_HEADER.size + metadata_size])
+        self._count = count
+        self._index_offset = index_offset
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(self._count))]
+        if index < 0:
+            index += self._count
+        if not 0 <= index < self._count:
+            raise IndexError("Номер вопроса вне диапазона")
+
+        start, end = _OFFSET_PAIR.unpack_from(self._mmap, self._index_offset + index * _OFFSET.size)
+        return Question.from_dict(json.loads(self._mmap[start:end]))
+
+    def __reduce__(self):
+        # При передаче в другой процесс файл отображается заново,
+        # а не копируется вместе с содержимым
+        return (MappedQuestions, (self.file_path,))
+
+    def close(self) -> None:
+        """Закрывает отображение файла."""
+        self._mmap.close()
+
+
+def open_compiled(file_path: str) -> QuestionBank:
+    """Открывает скомпилированный тест.
+
+    Args:
+        file_path: Путь к файлу .qbin.
+
+    Returns:
+        QuestionBank, вопросы которого читаются из файла по требованию.
+    """
+    questions = MappedQuestions(file_path)
+    return QuestionBank(questions.metadata.get('title', 'Без названия'),
+                        questions.metadata.get('description', ''), questions)
+
+
+def find_compiled(file_path: str) -> Optional[str]:
+    """Ищет актуальный скомпилированный файл для JSON файла теста.
+
+    Args:
+        file_path: Путь к JSON файлу теста.
+
+    Returns:
+        Путь к файлу .qbin, если он создан из текущей версии JSON файла
+        (совпадают размер и время изменения), иначе None.
+    """
+    binary_path = compiled_path(file_path)
+    try:
+        stat = os.stat(file_path)
+        with open(binary_path, 'rb') as file:
+            header = file.read(_HEADER.size)
+            magic, version, metadata_size, _, _ = _HEADER.unpack(header)
+            if magic != FORMAT_MAGIC or version != FORMAT_VERSION:
+                return None
+            metadata = json.loads(file.read(metadata_size))
+    except (OSError, ValueError, struct.error):
+        return None
+
+    if (metadata.get('source_size') == stat.st_size
+            and metadata.get('source_mtime_ns') == stat.st_mtime_ns):
+        return binary_path
+    return None
+
+
+def compile_test(file_path: str, output_path: Optional[str] = None) -> Dict[str, Any]:
+    """Компилирует JSON файл теста в двоичный формат.
+
+    Args:
+        file_path: Путь к JSON файлу теста.
+        output_path: Путь к файлу результата. По умолчанию файл .qbin
+            рядом с исходным файлом.
+
+    Returns:
+        Словарь со сведениями о результате: output_path и questions_count.
+
+    Raises:
+        FileNotFoundError: Если файл не найден.
+        ValueError: Если тест некорректен.
+
+    Note:
+        Вопросы читаются потоком, поэтому компиляция не загружает весь
+        тест в память. Результат сначала пишется во временный файл
+        и затем атомарно переименовывается.
+    """
+    # Импорт здесь, чтобы не создавать циклическую зависимость с loader
+    from .loader import TestStream
+
+    if output_path is None:
+        output_path = compiled_path(file_path)
+
+    stat = os.stat(file_path)
+    stream = TestStream(file_path)
+    metadata = json.dumps({
+        'title': stream.title,
+        'description': stream.header.get('description', ''),
+        'source_size': stat.st_size,
+        'source_mtime_ns': stat.st_mtime_ns
+    }, ensure_ascii=False).encode('utf-8')
+
+    offsets = array('Q')
+    temp_path = output_path + '.tmp'
+    try:
+        with open(temp_path, 'wb') as file:
+            file.write(_HEADER.pack(FORMAT_MAGIC, FORMAT_VERSION, len(metadata), 0, 0))
+            file.write(metadata)
+            position = _HEADER.size + len(metadata)
+
+            for question in stream:
+                record = json.dumps(question.to_dict(), ensure_ascii=False,
+                                    separators=(',', ':')).encode('utf-8')
+                offsets.append(position)
+                file.write(record)
+                position += len(record)
+            offsets.append(position)
+
+            # Таблица смещений выравнивается на 8 байт
+            padding = -position % _OFFSET.size
+            file.write(b'\0' * padding)
+            index_offset = position + padding
+            if sys.byteorder != 'little':
+                offsets.byteswap()
+            offsets.tofile(file)
+
+            file.seek(0)
+            file.write(_HEADER.pack(FORMAT_MAGIC, FORMAT_VERSION, len(metadata),
+                                    len(offsets) - 1, index_offset))
+        os.replace(temp_path, output_path)
+    finally:
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+
+    return {'output_path': output_path, 'questions_count': len(offsets) - 1}
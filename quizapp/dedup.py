@@ -0,0 +1,287 @@
+"""
+Модуль поиска повторяющихся вопросов.
+
+Ищет во всех тестах:
+
+    - точные повторы: вопросы, совпадающие после нормализации текста
+      (регистр, пробелы, знаки препинания, ё/е);
+    - почти повторы: вопросы с небольшими отличиями формулировки;
+    - повторяющиеся варианты ответа внутри одного вопроса.
+
+Для точных повторов используется хэш нормализованного текста. Почти
+повторы ищутся без попарного сравнения всех вопросов: для каждого вопроса
+вычисляется подпись MinHash по символьным n-граммам (вариант с одной
+перестановкой и заполнением пустых корзин), а кандидаты отбираются через
+LSH - совпадение одной из полос подписи. N-граммы хэшируются CRC32, а не
+встроенным hash, поэтому результат не зависит от PYTHONHASHSEED.
+
+Время работы и память растут линейно с количеством вопросов. Тексты
+вопросов не хранятся, но на каждый вопрос в памяти остаются подпись
+(SIGNATURE_SIZE чисел по 4 байта), запись в словаре точных повторов
+и записи в LSH_BANDS словарях корзин - всего около 0.8 КБ на вопрос
+(Python 3.11, tracemalloc), то есть около 0.8 ГБ на миллион вопросов.
+Корзина LSH хранит не более MAX_BUCKET_COMPARISONS последних вопросов,
+чтобы частые n-граммы не делали поиск квадратичным; вытесненный вопрос
+сравнивается с новыми только по другим полосам, поэтому при
+переполнении часть почти повторов может быть пропущена (поле evicted
+результата).
+
+Вопросы читаются потоком (TestStream), тексты найденных повторов
+дочитываются вторым проходом только для вошедших в группы вопросов.
+"""
+import hashlib
+import re
+import unicodedata
+import zlib
+from array import array
+from bisect import bisect_left
+from collections import Counter
+from typing import Dict, List, Any, Iterator, Optional, Tuple
+
+from .loader import TestStream, list_available_tests
+
+# Размер символьной n-граммы
+SHINGLE_SIZE = 4
+# Количество корзин подписи MinHash и разбиение подписи на полосы LSH
+SIGNATURE_SIZE = 32
+LSH_BANDS = 8
+# Минимальная оценка сходства (доля совпавших корзин) для почти повтора
+NEAR_DUPLICATE_THRESHOLD = 0.7
+# Сколько последних вопросов хранит корзина LSH (с ними сравнивается
+# новый вопрос); более старые вопросы корзины вытесняются
+MAX_BUCKET_COMPARISONS = 8
+
+_EMPTY_BIN = 0xFFFFFFFF
+_PUNCTUATION = re.compile(r'[^\w\s]+')
+_SPACES = re.compile(r'\s+')
+
+
+def normalize_text(text: str) -> str:
+    """Нормализует текст для сравнения.
+
+    Args:
+        text: Исходный текст.
+
+    Returns:
+        Текст в нормальной форме NFKC без учета регистра, с заменой ё на е,
+        без знаков препинания и с одиночными пробелами.
+    """
+    text = unicodedata.normalize('NFKC', text).casefold().replace('ё', 'е')
+    return _SPACES.sub(' ', _PUNCTUATION.sub(' ', text)).strip()
+
+
+def text_digest(normalized: str) -> int:
+    """Возвращает 64-битный хэш нормализованного текста."""
+    return int.from_bytes(hashlib.blake2b(normalized.encode('utf-8'), digest_size=8).digest(), 'little')
+
+
+def minhash_signature(normalized: str, size: int = SIGNATURE_SIZE) -> Optional[array]:
+    """Вычисляет подпись MinHash текста.
+
+    Args:
+        normalized: Нормализованный текст.
+        size: Количество корзин подписи.
+
+    Returns:
+        Подпись (array('I') длины size) или None для пустого текста.
+
+    Note:
+        Каждая n-грамма хэшируется один раз: младшие разряды хэша выбирают
+        корзину, а в корзине остается минимум старших разрядов. Пустые
+        корзины заполняются значением ближайшей непустой корзины справа
+        со сдвигом, чтобы подписи коротких текстов оставались сравнимыми.
+    """
+    if not normalized:
+        return None
+    # Встроенный hash строк зависит от PYTHONHASHSEED, поэтому используется
+    # CRC32: подписи и результат поиска одинаковы при каждом запуске
+    values = {zlib.crc32(normalized[i:i + SHINGLE_SIZE].encode('utf-8'))
+              for i in range(max(len(normalized) - SHINGLE_SIZE + 1, 1))}
+
+    signature = array('I', [_EMPTY_BIN]) * size
+    for value in values:
+        bin_index, rank = value % size, value // size
+        if rank < signature[bin_index]:
+            signature[bin_index] = rank
+
+    filled = [index for index in range(size) if signature[index] != _EMPTY_BIN]
+    if len(filled) < size:
+        for index in range(size):
+            if signature[index] == _EMPTY_BIN:
+                neighbor = filled[bisect_left(filled, index) % len(filled)]
+                distance = (neighbor - index) % size
+                signature[index] = signature[neighbor] + distance * 7919
+    return signature
+
+
+def estimate_similarity(first: array, second: array) -> float:
+    """Оценивает сходство Жаккара двух текстов по их подписям."""
+    return sum(a == b for a, b in zip(first, second)) / len(first)
+
+
+class _DisjointSets:
+    """Система непересекающихся множеств над номерами вопросов."""
+
+    def __init__(self):
+        self.parent = array('l')
+
+    def add(self) -> int:
+        self.parent.append(len(self.parent))
+        return len(self.parent) - 1
+
+    def find(self, item: int) -> int:
+        parent = self.parent
+        while parent[item] != item:
+            parent[item] = parent[parent[item]]
+            item = parent[item]
+        return item
+
+    def union(self, first: int, second: int) -> None:
+        first, second = self.find(first), self.find(second)
+        if first != second:
+            self.parent[max(first, second)] = min(first, second)
+
+
+def _iter_questions(test_files: List[str], errors: List[Dict[str, str]]) -> Iterator[Tuple[int, int, Dict]]:
+    """Потоком возвращает (номер файла, номер вопроса, данные вопроса)."""
+    for file_index, test_file in enumerate(test_files):
+        try:
+            for question_index, data in enumerate(TestStream(test_file).iter_dicts()):
+                yield file_index, question_index, data
+        except (OSError, ValueError) as e:
+            if errors is not None:
+                errors.append({'test': test_file, 'error': str(e)})
+
+
+def find_duplicates(test_files: Optional[List[str]] = None,
+                    threshold: float = NEAR_DUPLICATE_THRESHOLD) -> Dict[str, Any]:
+    """Ищет повторяющиеся вопросы и варианты ответа.
+
+    Args:
+        test_files: Пути к файлам тестов. По умолчанию все тесты,
+            найденные list_available_tests.
+        threshold: Минимальная оценка сходства для почти повторов.
+
+    Returns:
+        Словарь с полями:
+        - files: Количество просмотренных файлов
+        - questions: Количество просмотренных вопросов
+        - exact: Группы точных повторов
+        - near: Группы почти повторов (вопросы с разным нормализованным текстом)
+        - duplicate_options: Вопросы с повторяющимися вариантами ответа
+        - evicted: Сколько раз вопрос вытеснялся из переполненной корзины
+          LSH (если не 0, часть почти повторов могла быть не найдена)
+        - errors: Файлы, которые не удалось прочитать
+        Группа - список словарей test, index (номер вопроса с нуля) и question.
+    """
+    if test_files is None:
+        test_files = list_available_tests()
+
+    errors = []
+    files, positions = array('l'), array('l')
+    digests = array('Q')
+    signatures = array('I')
+    sets = _DisjointSets()
+    first_by_digest = {}
+    buckets = [dict() for _ in range(LSH_BANDS)]
+    rows = SIGNATURE_SIZE // LSH_BANDS
+    evicted = 0
+    duplicate_options = []
+
+    for file_index, question_index, data in _iter_questions(test_files, errors):
+        text = data.get('question')
+        options = data.get('options')
+        if isinstance(options, list):
+            # Знаки препинания в вариантах значимы ('=' и '==')
+            counts = Counter(' '.join(str(option).casefold().split()) for option in options)
+            repeated = [option for option, count in counts.items() if count > 1]
+            if repeated:
+                duplicate_options.append({
+                    'test': test_files[file_index], 'index': question_index,
+                    'question': text, 'options': repeated
+                })
+        if not isinstance(text, str):
+            continue
+
+        normalized = normalize_text(text)
+        signature = minhash_signature(normalized)
+        if signature is None:
+            continue
+
+        item = sets.add()
+        files.append(file_index)
+        positions.append(question_index)
+        digest = text_digest(normalized)
+        digests.append(digest)
+        signatures.extend(signature)
+
+        first = first_by_digest.setdefault(digest, item)
+        if first != item:
+            sets.union(first, item)
+            continue
+
+        for band, bucket in enumerate(buckets):
+            key = hash(tuple(signature[band * rows:(band + 1) * rows]))
+            # Большинство корзин содержит один вопрос: он хранится числом,
+            # а список создается только для второго вопроса
+            members = bucket.get(key)
+            if members is None:
+                bucket[key] = item
+                continue
+            if not isinstance(members, list):
+                members = bucket[key] = [members]
+            for other in members:
+                if sets.find(other) == sets.find(item):
+                    continue
+                other_signature = signatures[other * SIGNATURE_SIZE:(other + 1) * SIGNATURE_SIZE]
+                if estimate_similarity(signature, other_signature) >= threshold:
+                    sets.union(other, item)
+            if len(members) == MAX_BUCKET_COMPARISONS:
+                # Переполненная корзина хранит только последние вопросы:
+                # вытесненный вопрос больше не сравнивается с новыми по этой
+                # полосе, и пара может быть найдена только по другой полосе
+                del members[0]
+                evicted += 1
+            members.append(item)
+
+    # Корень множества - его наименьший номер, поэтому он встречается первым
+    groups = {}
+    for item in range(len(files)):
+        root = sets.find(item)
+        if root != item:
+            groups.setdefault(root, [root]).append(item)
+    clusters = [members for members in groups.values() if len(members) > 1]
+
+    wanted = {(files[item], positions[item]) for members in clusters for item in members}
+    texts = {}
+    if wanted:
+        for file_index, question_index, data in _iter_questions(test_files, None):
+            if (file_index, question_index) in wanted:
+                texts[file_index, question_index] = data.get('question')
+
+    # Внутри группы вопросы с одинаковым хэшем текста - точные повторы,
+    # а группа с разными текстами - почти повторы
+    exact, near = [], []
+    for members in clusters:
+        by_digest = {}
+        for item in members:
+            by_digest.setdefault(digests[item], []).append(item)
+        for same in by_digest.values():
+            if len(same) > 1:
+                exact.append(same)
+        if len(by_digest) > 1:
+            near.append([same[0] for same in by_digest.values()])
+
+    def describe(group):
+        return [{'test': test_files[files[item]], 'index': positions[item],
+                 'question': texts.get((files[item], positions[item]))} for item in group]
+
+    return {
+        'files': len(test_files),
+        'questions': len(files),
+        'exact': [describe(group) for group in exact],
+        'near': [describe(group) for group in near],
+        'duplicate_options': duplicate_options,
+        'evicted': evicted,
+        'errors': errors
+    }
@@ -4,9 +4,17 @@
 Содержит основную логику проведения тестирования, включая
 отображение вопросов, проверку ответов и подсчет результатов.
 """
-import random
-from typing import Dict, List, Any, Tuple
-from .loader import load_test
+import math
+import sys
+from bisect import bisect_right
+from itertools import accumulate, islice
+from typing import Dict, List, Any, Tuple, Iterable, Union, Optional, Sequence
+from . import instrument, render
+from .loader import load_bank, load_banks, load_test_stream, TestStream, test_cache
+from .compiled import COMPILED_EXTENSION, find_compiled
+from .question import Question, QuestionBank, as_question
+from .session import QuizSession
+from .attempts import AttemptLog, get_attempt_log, new_attempt_id, current_user
 
 
 class QuizEngine:
@@ -15,96 +23,167 @@ class QuizEngine:
      Attributes:
          test_data (Dict[str, Any]): Данные загруженного теста.
          title (str): Название теста.
-         questions (List[Dict]): Список вопросов теста.
+         questions (List[Question]): Список вопросов теста. При потоковой
+             загрузке - объект TestStream, возвращающий вопросы по одному.
          current_question (int): Текущий номер вопроса.
          score (int): Количество правильных ответов.
-         total_questions (int): Общее количество вопросов.
+         total_questions (int): Общее количество вопросов (None, если тест
+             читается потоком и количество заранее неизвестно).
          user_answers (List[Dict]): История ответов пользователя.
+         test_path (Optional[str]): Путь к файлу теста (для журнала попыток).
+         attempt_log (Optional[AttemptLog]): Журнал попыток, в который
+             записываются ответы.
+         question_sources (Optional[Sequence[str]]): Пути к файлам тестов
+             для каждого вопроса take_quiz (для смешанного теста).
+         renderer (Optional[Renderer]): Рендерер для вывода вопросов
+             и запроса ответов. Если None, используется
+             render.default_renderer.
+         sampler (QuestionSampler): Выборка по весам, сложности и темам
+             (создается при первом обращении).
 
      Example:
          >>> engine = QuizEngine(test_data)
          >>> score, total, answers = engine.take_quiz()
      """
-    def __init__(self, test_data: Dict[str, Any]):
+    def __init__(self, test_data: Union[Dict[str, Any], QuestionBank, TestStream],
+                 test_path: Optional[str] = None, attempt_log: Optional[AttemptLog] = None,
+                 question_sources: Optional[Sequence[str]] = None,
+                 renderer: Optional[render.Renderer] = None):
         """Инициализирует движок тестирования.
 
              Args:
-                 test_data: Данные теста, загруженные из JSON файла.
+                 test_data: Данные теста: QuestionBank, словарь, загруженный
+                     из JSON файла (вопросы будут преобразованы в Question),
+                     или TestStream для последовательного прохождения теста
+                     без загрузки всех вопросов в память.
+                 test_path: Путь к файлу теста для журнала попыток.
+                 attempt_log: Журнал попыток. Если None, ответы не журналируются.
+                 question_sources: Пути к файлам тестов, из которых взяты
+                     вопросы (по порядку прохождения). Используются журналом
+                     попыток вместо test_path.
+                 renderer: Рендерер вывода (по умолчанию render.default_renderer).
              """
         self.test_data = test_data
-        self.title = test_data.get('title', 'Без названия')
-        self.questions = test_data.get('questions', [])
+        if isinstance(test_data, TestStream):
+            self.title = test_data.title
+            self.questions = test_data
+            self.total_questions = None
+        else:
+            if not isinstance(test_data, QuestionBank):
+                test_data = QuestionBank.from_dict(test_data)
+            self.title = test_data.title
+            self.questions = test_data.questions
+            self.total_questions = len(self.questions)
         self.current_question = 0
         self.score = 0
-        self.total_questions = len(self.questions)
         self.user_answers = []
+        self.test_path = test_path
+        self.attempt_log = attempt_log
+        self.question_sources = question_sources
+        self.renderer = renderer
+        self._sampler = None
 
-    def get_random_questions(self, count: int) -> List[Dict[str, Any]]:
+    @property
+    def sampler(self) -> 'QuestionSampler':
+        """Выборка вопросов теста по весам, сложности и темам.
+
+        Страты строятся при первом обращении и используются всеми
+        следующими выборками этого движка.
+
+        Raises:
+            ValueError: Если тест читается потоком.
+        """
+        if self._sampler is None:
+            if self.total_questions is None:
+                raise ValueError("Выборка по весам, сложности и темам недоступна "
+                                 "при потоковом чтении теста")
+            from .sampling import QuestionSampler
+            self._sampler = QuestionSampler(self.questions)
+        return self._sampler
+
+    @instrument.timed('engine.random_questions')
+    def get_random_questions(self, count: int, seed: Optional[int] = None,
+                             difficulty: Optional[Dict[str, float]] = None,
+                             tags: Optional[Dict[str, int]] = None,
+                             weighted: bool = False) -> List[Question]:
         """Выбирает случайные вопросы из теста.
 
                 Args:
                     count: Количество вопросов для выбора.
+                    seed: Начальное значение генератора случайных чисел для
+                        воспроизводимой выборки. Если None, выборка случайна.
+                    difficulty: Доли сложностей в выборке, например
+                        {'easy': 30, 'medium': 50, 'hard': 20}.
+                    tags: Наименьшее количество вопросов по темам.
+                    weighted: Выбирать вопросы с вероятностью по весу.
 
                 Returns:
                     Список случайных вопросов.
 
+                Raises:
+                    ValueError: Если заданы difficulty, tags или weighted,
+                        а тест читается потоком, или условия выборки
+                        невыполнимы (см. QuestionSampler.sample).
+
                 Note:
                     Если запрошено больше вопросов чем есть в тесте,
-                    возвращаются все доступные вопросы.
+                    возвращаются все доступные вопросы. Выбираются номера
+                    вопросов, поэтому для скомпилированного теста читаются
+                    только выбранные записи. Для потокового теста
+                    используется выборка с резервуаром (sample_questions).
+                    Выборка по весам, сложности и темам выполняется через
+                    sampler (quizapp.sampling).
                 """
+        import random
+
+        rng = random.Random(seed)
+        if difficulty or tags or weighted:
+            return self.sampler.sample(count, rng, difficulty, tags, weighted)
+        if self.total_questions is None:
+            return sample_questions(self.questions, count, rng)
+
         if count > len(self.questions):
             count = len(self.questions)
 
-        return random.sample(self.questions, count)
+        return [self.questions[i] for i in rng.sample(range(len(self.questions)), count)]
 
-    def display_question(self, question: Dict[str, Any]) -> None:
+    def display_question(self, question: Question) -> None:
         """Отображает вопрос и варианты ответов.
 
               Args:
-                  question: Данные вопроса для отображения.
+                  question: Вопрос для отображения.
               """
-        print(f"\n{question['question']}")
+        (self.renderer or render.default_renderer).question(question)
 
-        if 'options' in question:
-            for i, option in enumerate(question['options'], 1):
-                print(f"{i}. {option}")
-
-    def check_answer(self, question: Dict[str, Any], user_answer: str) -> bool:
+    def check_answer(self, question: Question, user_answer: str) -> bool:
         """Проверяет ответ пользователя.
 
               Args:
-                  question: Данные вопроса.
+                  question: Вопрос теста.
                   user_answer: Ответ, введенный пользователем.
 
               Returns:
                   True если ответ правильный, иначе False.
 
               Note:
-                  Для вопросов с вариантами ответов проверяет номер выбранного варианта.
-                  Для текстовых вопросов сравнивает строки в нижнем регистре.
+                  Ключ ответа компилируется при загрузке вопроса, поэтому
+                  проверка не нормализует правильный ответ повторно
+                  (см. Question.check).
               """
-        correct_answer = question.get('answer', '').lower().strip()
-        user_answer = user_answer.lower().strip()
-
-        # Для вопросов с вариантами ответов
-        if 'options' in question:
-            try:
-                option_index = int(user_answer) - 1
-                if 0 <= option_index < len(question['options']):
-                    selected_option = question['options'][option_index].lower()
-                    return selected_option.startswith(correct_answer)
-            except ValueError:
-                pass
-
-        # Для текстовых вопросов
-        return user_answer == correct_answer
-
-    def take_quiz(self, questions: List[Dict[str, Any]] = None) -> Tuple[int, int, List[Dict]]:
+        # Метод вызывается на каждый ответ, поэтому вместо декоратора
+        # instrument.timed флаг проверяется на месте
+        if instrument.enabled:
+            with instrument.span('engine.check_answer'):
+                return question.check(user_answer)
+        return question.check(user_answer)
+
+    def take_quiz(self, questions: Iterable[Question] = None) -> Tuple[int, int, List[Dict]]:
         """Проводит тестирование.
 
             Args:
-                questions: Список вопросов для тестирования. Если None,
-                    используются все вопросы теста.
+                questions: Вопросы для тестирования: список или итератор
+                    (например, TestStream). Вопросы-словари преобразуются
+                    в Question. Если None, используются все вопросы теста.
 
             Returns:
                 Кортеж (количество правильных ответов, общее количество вопросов,
@@ -112,78 +191,285 @@ class QuizEngine:
 
             Note:
                 История ответов содержит информацию о каждом вопросе, ответе
-                пользователя и правильности ответа.
+                пользователя и правильности ответа. Состояние прохождения
+                хранится в QuizSession; метод только выполняет ввод-вывод
+                через рендерер (см. quizapp.render).
+                Если задан журнал попыток, ответы добавляются в его буфер,
+                а на диск он сбрасывается после завершения теста.
             """
         if questions is None:
             questions = self.questions
 
+        # Состояние прохождения хранит сессия, здесь только ввод-вывод
+        session = QuizSession(questions, self.title)
+        attempt_id = new_attempt_id()
+        user = current_user()
         self.score = 0
         self.user_answers = []
+        renderer = self.renderer or render.default_renderer
+
+        renderer.quiz_started(self.title, session.total)
 
-        print(f"\n=== Тест: {self.title} ===")
-        print(f"Количество вопросов: {len(questions)}")
+        while True:
+            question = session.next_question()
+            if question is None:
+                break
 
-        for i, question in enumerate(questions, 1):
-            print(f"\n--- Вопрос {i} из {len(questions)} ---")
-            self.display_question(question)
+            self.current_question = session.position
+            with instrument.span('engine.display'):
+                renderer.question(question, session.position, session.total)
 
             while True:
                 try:
-                    user_input = input("Ваш ответ: ").strip()
+                    # Время ожидания ответа отделено от времени работы программы
+                    with instrument.span('engine.input'):
+                        user_input = renderer.ask("Ваш ответ: ").strip()
                     if user_input:
                         break
-                    print("Пожалуйста, введите ответ.")
+                    renderer.line("Пожалуйста, введите ответ.")
                 except KeyboardInterrupt:
-                    print("\n\nТестирование прервано.")
-                    return self.score, len(questions), self.user_answers
-
-            is_correct = self.check_answer(question, user_input)
+                    renderer.interrupted()
+                    if self.attempt_log is not None:
+                        self.attempt_log.flush()
+                    self.score, total, self.user_answers = session.result()
+                    return self.score, total, self.user_answers
 
-            if is_correct:
-                self.score += 1
-                print("✓ Правильно!")
-            else:
-                correct_answer = question.get('answer', 'Не указан')
-                print(f"✗ Неправильно. Правильный ответ: {correct_answer}")
+            with instrument.span('engine.check_answer'):
+                is_correct = session.submit(user_input)
+            if self.attempt_log is not None:
+                # Запись только добавляется в буфер журнала
+                test = (self.question_sources[session.position - 1] if self.question_sources
+                        else self.test_path or self.title)
+                self.attempt_log.record(test, user, attempt_id, question, user_input, is_correct)
 
-            # Сохраняем историю ответов
-            self.user_answers.append({
-                'question': question['question'],
-                'user_answer': user_input,
-                'correct_answer': question.get('answer', ''),
-                'is_correct': is_correct
-            })
+            renderer.answer_result(question, is_correct)
 
-        return self.score, len(questions), self.user_answers
+        if self.attempt_log is not None:
+            self.attempt_log.flush()
+        self.score, total, self.user_answers = session.result()
+        return self.score, total, self.user_answers
 
 
-def take_quiz(test_file: str) -> Tuple[int, int, List[Dict]]:
+def take_quiz(test_file: str, stream: bool = False) -> Tuple[int, int, List[Dict]]:
     """Проводит тестирование.
 
     Args:
         test_file: Путь к файлу теста.
+        stream: Читать вопросы потоком по одному, не загружая весь тест
+            в память. Подходит для очень больших тестов.
 
     Returns:
         Кортеж (количество правильных ответов, общее количество вопросов,
         история ответов).
     """
-    test_data = load_test(test_file)
-    engine = QuizEngine(test_data)
+    test_data = load_test_stream(test_file) if stream else load_bank(test_file)
+    engine = QuizEngine(test_data, test_file, get_attempt_log())
     return engine.take_quiz()
 
 
-def take_random_quiz(test_file: str, question_count: int = 5) -> Tuple[int, int, List[Dict]]:
+def select_mixed_questions(banks: List[QuestionBank], count: Optional[int] = None,
+                           quotas: Optional[List[int]] = None,
+                           rng: Optional['random.Random'] = None) -> Tuple[List[Question], List[int]]:
+    """Выбирает вопросы для смешанного теста из нескольких наборов.
+
+    Args:
+        banks: Наборы вопросов.
+        count: Количество вопросов из объединенного набора. Если None
+            и квоты не заданы, берутся все вопросы всех наборов по порядку.
+        quotas: Количество вопросов из каждого набора (в порядке banks).
+            Если квота больше размера набора, берется весь набор.
+        rng: Генератор случайных чисел. Если None, используется новый.
+
+    Returns:
+        Кортеж (вопросы, номера наборов, из которых взят каждый вопрос).
+
+    Raises:
+        ValueError: Если количество квот не совпадает с количеством наборов.
+
+    Note:
+        Вопросы наборов не копируются в общий список: выбираются номера
+        в объединенной нумерации, и читаются только выбранные вопросы.
+    """
+    if rng is None:
+        import random
+        rng = random.Random()
+
+    if quotas is not None:
+        if len(quotas) != len(banks):
+            raise ValueError("Количество квот должно совпадать с количеством тестов")
+        picked = [(bank_index, question_index)
+                  for bank_index, (bank, quota) in enumerate(zip(banks, quotas))
+                  for question_index in rng.sample(range(len(bank)), min(max(quota, 0), len(bank)))]
+        rng.shuffle(picked)
+    else:
+        # Граница каждого набора в объединенной нумерации вопросов
+        bounds = list(accumulate(len(bank) for bank in banks))
+        total = bounds[-1] if bounds else 0
+        if count is None:
+            numbers = range(total)
+        else:
+            numbers = rng.sample(range(total), min(count, total))
+        picked = []
+        for number in numbers:
+            bank_index = bisect_right(bounds, number)
+            start = bounds[bank_index - 1] if bank_index else 0
+            picked.append((bank_index, number - start))
+
+    questions = [banks[bank_index][question_index] for bank_index, question_index in picked]
+    return questions, [bank_index for bank_index, _ in picked]
+
+
+def take_mixed_quiz(test_files: List[str], question_count: Optional[int] = None,
+                    quotas: Optional[List[int]] = None,
+                    seed: Optional[int] = None) -> Tuple[int, int, List[Dict]]:
+    """Проводит тестирование по вопросам нескольких тестов.
+
+    Args:
+        test_files: Пути к файлам тестов.
+        question_count: Количество случайных вопросов из объединенного
+            набора. Если None и квоты не заданы, задаются все вопросы.
+        quotas: Количество случайных вопросов из каждого теста.
+        seed: Начальное значение генератора для воспроизводимого варианта.
+
+    Returns:
+        Кортеж (количество правильных ответов, общее количество вопросов,
+        история ответов).
+
+    Note:
+        Тесты загружаются одновременно в пуле потоков (load_banks).
+        Ответы записываются в журнал попыток под путем того теста,
+        из которого взят вопрос.
+    """
+    import random
+
+    banks = load_banks(test_files)
+    questions, origins = select_mixed_questions(banks, question_count, quotas, random.Random(seed))
+    title = "Смешанный тест: " + ", ".join(bank.title for bank in banks)
+    engine = QuizEngine(QuestionBank(title, '', questions), None, get_attempt_log(),
+                        [test_files[origin] for origin in origins])
+    return engine.take_quiz()
+
+
+@instrument.timed('engine.sample_stream')
+def sample_questions(questions: Iterable[Any], count: int,
+                     rng: Optional['random.Random'] = None) -> List[Question]:
+    """Выбирает случайные вопросы из потока за один проход.
+
+    Args:
+        questions: Вопросы (Question или словари), например из TestStream.
+        count: Количество вопросов для выбора.
+        rng: Генератор случайных чисел. Если None, используется новый.
+
+    Returns:
+        Список случайных вопросов в случайном порядке.
+
+    Note:
+        Используется выборка с резервуаром (алгоритм L): в памяти находится
+        не более count вопросов, а пропускаемые элементы не требуют вызова
+        генератора случайных чисел. В Question преобразуются только
+        выбранные вопросы.
+    """
+    if rng is None:
+        import random
+        rng = random.Random()
+    if count <= 0:
+        return []
+
+    iterator = iter(questions)
+    reservoir = list(islice(iterator, count))
+
+    if len(reservoir) == count:
+        weight = math.exp(math.log(rng.random() or sys.float_info.min) / count)
+        while weight < 1.0:
+            skip = int(math.log(rng.random() or sys.float_info.min) / math.log1p(-weight))
+            item = next(islice(iterator, skip, None), None)
+            if item is None:
+                break
+            reservoir[rng.randrange(count)] = item
+            weight *= math.exp(math.log(rng.random() or sys.float_info.min) / count)
+
+    rng.shuffle(reservoir)
+    return [as_question(question) for question in reservoir]
+
+
+def sample_stream(stream: TestStream, count: int,
+                  rng: Optional['random.Random'] = None) -> List[Question]:
+    """Выбирает случайные вопросы потокового теста по номерам.
+
+    Args:
+        stream: Тест, читаемый потоком.
+        count: Количество вопросов для выбора.
+        rng: Генератор случайных чисел. Если None, используется новый.
+
+    Returns:
+        Список случайных вопросов в порядке выбора.
+
+    Note:
+        Номера выбираются так же, как в QuizEngine.get_random_questions
+        (rng.sample по номерам всех вопросов), поэтому при одном seed
+        вариант теста не зависит от того, читается тест потоком, взят из
+        кэша или открыт из скомпилированного файла. Файл читается дважды:
+        сначала подсчитываются вопросы, затем выбираются нужные; в памяти
+        находится не более count вопросов.
+    """
+    if rng is None:
+        import random
+        rng = random.Random()
+    total = sum(1 for _ in stream.iter_dicts())
+    indexes = rng.sample(range(total), min(max(count, 0), total))
+    positions = {index: position for position, index in enumerate(indexes)}
+
+    selected = [None] * len(indexes)
+    for index, data in enumerate(stream.iter_dicts()):
+        position = positions.get(index)
+        if position is not None:
+            selected[position] = Question.from_dict(data)
+    return selected
+
+
+def take_random_quiz(test_file: str, question_count: int = 5,
+                     seed: Optional[int] = None,
+                     difficulty: Optional[Dict[str, float]] = None,
+                     tags: Optional[Dict[str, int]] = None,
+                     weighted: bool = False) -> Tuple[int, int, List[Dict]]:
     """Проводит тестирование со случайными вопросами.
 
         Args:
             test_file: Путь к файлу теста.
             question_count: Количество случайных вопросов.
+            seed: Начальное значение генератора для воспроизводимого
+                варианта теста.
+            difficulty: Доли сложностей, например {'easy': 30, 'medium': 50,
+                'hard': 20}.
+            tags: Наименьшее количество вопросов по темам.
+            weighted: Выбирать вопросы с вероятностью по весу (поле weight).
 
         Returns:
             Кортеж (количество правильных ответов, общее количество вопросов,
             история ответов).
+
+        Note:
+            Если тест уже загружен в кэш или для него есть скомпилированный
+            файл (см. quizapp.compiled), вопросы выбираются по номерам и
+            читаются только выбранные записи.
+            Иначе JSON файл читается потоком (sample_stream), и в памяти
+            одновременно хранится не более question_count вопросов. Номера
+            в обоих случаях выбираются одинаково, поэтому один seed дает
+            один вариант теста.
+            Для выборки по сложности, темам и весам тест загружается
+            целиком (см. quizapp.sampling).
         """
-    test_data = load_test(test_file)
-    engine = QuizEngine(test_data)
-    random_questions = engine.get_random_questions(question_count)
+    bank = test_cache.cached('bank', test_file)
+    stratified = bool(difficulty or tags or weighted)
+    if (bank is not None or stratified or test_file.endswith(COMPILED_EXTENSION)
+            or find_compiled(test_file)):
+        engine = QuizEngine(bank if bank is not None else load_bank(test_file), test_file,
+                            get_attempt_log())
+        random_questions = engine.get_random_questions(question_count, seed, difficulty, tags, weighted)
+    else:
+        import random
+
+        stream = load_test_stream(test_file)
+        engine = QuizEngine(stream, test_file, get_attempt_log())
+        random_questions = sample_stream(stream, question_count, random.Random(seed))
     return engine.take_quiz(random_questions)
\ No newline at end of file
@@ -0,0 +1,132 @@
+"""
+Модуль пакетной проверки ответов.
+
+Позволяет проверять заранее собранные листы ответов (например, выгрузки
+из LMS) без интерактивного ввода. Проверка распределяется по процессам:
+скомпилированный тест передается каждому процессу один раз при запуске,
+а листы ответов отправляются пачками.
+
+Формат листа ответов:
+    {"id": "student-1", "answers": ["2", "4", "7", "5", "3.14"]}
+
+Ответы перечисляются в порядке вопросов теста; недостающие ответы
+считаются неправильными.
+"""
+import os
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
+from typing import Dict, List, Any, Iterable, Iterator, Optional, Union
+
+from . import instrument, matching
+from .loader import load_bank
+from .matching import AnswerMatcher
+from .question import QuestionBank
+
+# Количество листов ответов, отправляемых процессу за один раз
+GRADING_CHUNK_SIZE = 256
+
+# Тест и правило сравнения ответов, переданные процессу-обработчику при запуске
+_worker_bank = None
+_worker_matcher = None
+
+
+def grade_submission(bank: QuestionBank, submission: Dict[str, Any],
+                     matcher: Optional[AnswerMatcher] = None) -> Dict[str, Any]:
+    """Проверяет один лист ответов.
+
+    Args:
+        bank: Скомпилированный тест.
+        submission: Лист ответов с полями id и answers.
+        matcher: Правило сравнения текстовых ответов. По умолчанию
+            matching.default_matcher.
+
+    Returns:
+        Словарь с полями id, score, total, percentage и correct
+        (список признаков правильности по каждому вопросу).
+    """
+    answers = submission.get('answers', [])
+    correct = []
+    for i, question in enumerate(bank.questions):
+        answer = answers[i] if i < len(answers) else None
+        correct.append(answer is not None and question.check(str(answer), matcher))
+
+    score = sum(correct)
+    total = len(bank.questions)
+    return {
+        'id': submission.get('id'),
+        'score': score,
+        'total': total,
+        'percentage': (score / total) * 100 if total > 0 else 0,
+        'correct': correct
+    }
+
+
+def _init_worker(bank: QuestionBank, matcher: AnswerMatcher) -> None:
+    """Сохраняет тест в процессе-обработчике (вызывается один раз на процесс)."""
+    global _worker_bank, _worker_matcher
+    _worker_bank = bank
+    _worker_matcher = matcher
+
+
+def _grade_chunk(submissions: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """Проверяет пачку листов ответов в процессе-обработчике."""
+    return [grade_submission(_worker_bank, submission, _worker_matcher) for submission in submissions]
+
+
+def grade_batch(test: Union[str, QuestionBank],
+                submissions: Iterable[Dict[str, Any]],
+                workers: Optional[int] = None,
+                chunk_size: int = GRADING_CHUNK_SIZE,
+                matcher: Optional[AnswerMatcher] = None) -> Iterator[Dict[str, Any]]:
+    """Проверяет листы ответов, распределяя работу по процессам.
+
+    Args:
+        test: Путь к файлу теста или уже загруженный QuestionBank.
+        submissions: Листы ответов; могут читаться лениво из файла.
+        workers: Количество процессов. None - по числу ядер процессора,
+            1 - проверка в текущем процессе без пула.
+        chunk_size: Количество листов ответов в одной пачке.
+        matcher: Правило сравнения текстовых ответов. По умолчанию
+            matching.default_matcher; передается каждому процессу явно.
+
+    Yields:
+        Результаты проверки (см. grade_submission) в порядке листов ответов.
+
+    Note:
+        Одновременно в обработке находится не более двух пачек на процесс,
+        поэтому память не растет с количеством листов ответов.
+
+    Example:
+        >>> for result in grade_batch('tests/math_test.json', submissions):
+        ...     print(result['id'], result['score'])
+    """
+    bank = test if isinstance(test, QuestionBank) else load_bank(test)
+    if matcher is None:
+        matcher = matching.default_matcher
+    if workers is None:
+        workers = os.cpu_count() or 1
+
+    submissions = iter(submissions)
+    if workers <= 1:
+        for submission in submissions:
+            instrument.count('grading.submissions')
+            yield grade_submission(bank, submission, matcher)
+        return
+
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                             initargs=(bank, matcher)) as executor:
+        pending = deque()
+        while True:
+            while len(pending) < workers * 2:
+                chunk = list(islice(submissions, chunk_size))
+                if not chunk:
+                    break
+                pending.append(executor.submit(_grade_chunk, chunk))
+
+            if not pending:
+                break
+
+            results = pending.popleft().result()
+            instrument.count('grading.submissions', len(results))
+            yield from results
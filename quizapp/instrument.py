@@ -0,0 +1,365 @@
+"""
+Модуль измерения производительности (инструментирование).
+
+Позволяет узнать, на что ушло время выполнения команды: разбор JSON при
+загрузке теста, выбор случайных вопросов, проверку ответов или вывод
+результатов. Предоставляет:
+
+    - span(name) - контекстный менеджер, измеряющий время этапа;
+    - timed(name) - декоратор, измеряющий время каждого вызова функции;
+    - count(name) - счетчик событий;
+    - observe(name, value) - гистограмма значений (размеры, количества).
+
+По умолчанию измерения выключены и почти ничего не стоят: span возвращает
+общий пустой контекстный менеджер, а обертка timed, count и observe
+только проверяют флаг enabled. Измерения включаются переменной окружения
+QUIZ_PROFILE (1 - время этапов, memory - еще и память) или флагами
+--profile и --profile-memory в main.py. Сводка печатается в stderr при
+завершении процесса.
+
+Для подробного профиля одной команды есть profile_call (cProfile) и режим
+memory (tracemalloc): для каждого этапа учитывается прирост памяти,
+а в сводку добавляются строки кода, выделившие больше всего памяти.
+
+Example:
+    >>> from quizapp import instrument
+    >>> instrument.enable()
+    >>> with instrument.span('import.parse'):
+    ...     parse(data)
+    >>> instrument.report()
+"""
+import atexit
+import functools
+import math
+import os
+import sys
+import threading
+import time
+from typing import Dict, Any, Callable, Optional, TextIO
+
+PROFILE_ENV = 'QUIZ_PROFILE'
+# Корзины гистограмм растут в HISTOGRAM_RATIO раз: погрешность
+# перцентилей не больше 10%
+HISTOGRAM_RATIO = 1.1
+# Количество строк кода с наибольшим выделением памяти в сводке
+MEMORY_TOP = 10
+
+# Флаг проверяется на каждом измеряемом вызове, поэтому это простая
+# переменная модуля
+enabled = False
+_memory = False
+_registered = False
+_lock = threading.Lock()
+_spans = {}
+_counters = {}
+_histograms = {}
+_LOG_RATIO = math.log(HISTOGRAM_RATIO)
+
+
+class Histogram:
+    """Гистограмма положительных значений с логарифмическими корзинами.
+
+    Attributes:
+        count (int): Количество значений.
+        total (float): Сумма значений.
+        minimum (float): Наименьшее значение.
+        maximum (float): Наибольшее значение.
+    """
+    __slots__ = ('count', 'total', 'minimum', 'maximum', '_bins')
+
+    def __init__(self):
+        self.count = 0
+        self.total = 0.0
+        self.minimum = math.inf
+        self.maximum = 0.0
+        self._bins = {}
+
+    def add(self, value: float) -> None:
+        """Добавляет значение."""
+        self.count += 1
+        self.total += value
+        if value < self.minimum:
+            self.minimum = value
+        if value > self.maximum:
+            self.maximum = value
+        index = int(math.log(value) / _LOG_RATIO) if value > 1 else 0
+        self._bins[index] = self._bins.get(index, 0) + 1
+
+    def quantile(self, fraction: float) -> float:
+        """Возвращает приблизительный квантиль (верхнюю границу корзины)."""
+        if not self.count:
+            return 0.0
+        rank = fraction * self.count
+        seen = 0
+        for index in sorted(self._bins):
+            seen += self._bins[index]
+            if seen >= rank:
+                return min(HISTOGRAM_RATIO ** (index + 1), self.maximum)
+        return self.maximum
+
+    def to_dict(self) -> Dict[str, float]:
+        """Возвращает сводку: count, mean, min, p50, p95, max."""
+        if not self.count:
+            return {'count': 0}
+        return {
+            'count': self.count,
+            'mean': self.total / self.count,
+            'min': self.minimum,
+            'p50': self.quantile(0.50),
+            'p95': self.quantile(0.95),
+            'max': self.maximum
+        }
+
+
+class _SpanStats:
+    """Накопленные измерения одного этапа."""
+    __slots__ = ('durations', 'allocated')
+
+    def __init__(self):
+        # Длительности в микросекундах
+        self.durations = Histogram()
+        self.allocated = 0
+
+
+class _Span:
+    """Измерение одного выполнения этапа."""
+    __slots__ = ('name', 'start', 'memory')
+
+    def __init__(self, name: str):
+        self.name = name
+
+    def __enter__(self) -> '_Span':
+        self.memory = _traced_memory() if _memory else 0
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        duration = (time.perf_counter() - self.start) * 1e6
+        allocated = _traced_memory() - self.memory if _memory else 0
+        with _lock:
+            stats = _spans.get(self.name)
+            if stats is None:
+                stats = _spans[self.name] = _SpanStats()
+            stats.durations.add(duration)
+            stats.allocated += allocated
+
+
+class _NullSpan:
+    """Пустой контекстный менеджер для выключенных измерений."""
+    __slots__ = ()
+
+    def __enter__(self) -> '_NullSpan':
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        pass
+
+
+_NULL_SPAN = _NullSpan()
+
+
+def _traced_memory() -> int:
+    import tracemalloc
+    return tracemalloc.get_traced_memory()[0]
+
+
+def span(name: str):
+    """Возвращает контекстный менеджер, измеряющий время этапа.
+
+    Args:
+        name: Имя этапа, например 'loader.parse_json'.
+
+    Example:
+        >>> with span('engine.sample'):
+        ...     questions = rng.sample(bank, 10)
+    """
+    return _Span(name) if enabled else _NULL_SPAN
+
+
+def timed(name: str) -> Callable:
+    """Декоратор, измеряющий время каждого вызова функции как этап name.
+
+    Args:
+        name: Имя этапа.
+
+    Note:
+        Когда измерения выключены, обертка только проверяет флаг enabled
+        и вызывает функцию, но сам лишний вызов стоит около 0,3 мкс. Для
+        функций короче нескольких микросекунд, вызываемых на каждый ответ,
+        лучше проверить enabled на месте и использовать span.
+    """
+    def decorator(func: Callable) -> Callable:
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if not enabled:
+                return func(*args, **kwargs)
+            with _Span(name):
+                return func(*args, **kwargs)
+        return wrapper
+    return decorator
+
+
+def count(name: str, value: int = 1) -> None:
+    """Увеличивает счетчик name на value."""
+    if enabled:
+        with _lock:
+            _counters[name] = _counters.get(name, 0) + value
+
+
+def observe(name: str, value: float) -> None:
+    """Добавляет значение в гистограмму name."""
+    if enabled:
+        with _lock:
+            histogram = _histograms.get(name)
+            if histogram is None:
+                histogram = _histograms[name] = Histogram()
+            histogram.add(value)
+
+
+def enable(memory: bool = False, report_at_exit: bool = True) -> None:
+    """Включает измерения.
+
+    Args:
+        memory: Учитывать выделение памяти по этапам (tracemalloc).
+            Замедляет выполнение в несколько раз.
+        report_at_exit: Напечатать сводку в stderr при завершении процесса.
+    """
+    global enabled, _memory, _registered
+    if memory:
+        import tracemalloc
+        if not tracemalloc.is_tracing():
+            tracemalloc.start()
+    _memory = memory
+    enabled = True
+    if report_at_exit and not _registered:
+        atexit.register(report)
+        _registered = True
+
+
+def disable() -> None:
+    """Выключает измерения (накопленные данные сохраняются)."""
+    global enabled, _memory
+    if _memory:
+        import tracemalloc
+        tracemalloc.stop()
+    enabled = False
+    _memory = False
+
+
+def reset() -> None:
+    """Удаляет накопленные измерения."""
+    with _lock:
+        _spans.clear()
+        _counters.clear()
+        _histograms.clear()
+
+
+def snapshot() -> Dict[str, Any]:
+    """Возвращает накопленные измерения.
+
+    Returns:
+        Словарь с полями spans (этап -> сводка длительностей в
+        микросекундах и allocated - прирост памяти в байтах), counters
+        и histograms.
+    """
+    with _lock:
+        spans = {}
+        for name, stats in _spans.items():
+            spans[name] = stats.durations.to_dict()
+            spans[name]['total'] = stats.durations.total
+            spans[name]['allocated'] = stats.allocated
+        return {
+            'spans': spans,
+            'counters': dict(_counters),
+            'histograms': {name: histogram.to_dict() for name, histogram in _histograms.items()}
+        }
+
+
+def report(file: Optional[TextIO] = None) -> None:
+    """Печатает сводку измерений.
+
+    Args:
+        file: Файл для вывода (по умолчанию sys.stderr).
+    """
+    file = file or sys.stderr
+    data = snapshot()
+    if not any(data.values()):
+        return
+
+    print("\n=== Профиль выполнения ===", file=file)
+    if data['spans']:
+        header = f"{'Этап':<28} {'вызовы':>7} {'всего, мс':>10} {'среднее, мс':>12} {'p95, мс':>9}"
+        if _memory:
+            header += f" {'память, КБ':>11}"
+        print(header, file=file)
+        for name, span_data in sorted(data['spans'].items(), key=lambda item: -item[1]['total']):
+            line = (f"{name:<28} {span_data['count']:>7} {span_data['total'] / 1000:>10.2f} "
+                    f"{span_data['mean'] / 1000:>12.3f} {span_data['p95'] / 1000:>9.3f}")
+            if _memory:
+                line += f" {span_data['allocated'] / 1024:>11.1f}"
+            print(line, file=file)
+
+    if data['counters']:
+        print("\nСчетчики:", file=file)
+        for name, value in sorted(data['counters'].items()):
+            print(f"  {name}: {value}", file=file)
+
+    if data['histograms']:
+        print("\nГистограммы:", file=file)
+        for name, values in sorted(data['histograms'].items()):
+            print(f"  {name}: количество {values['count']}, среднее {values['mean']:.1f}, "
+                  f"p50 {values['p50']:.1f}, p95 {values['p95']:.1f}, макс {values['max']:.1f}",
+                  file=file)
+
+    if _memory:
+        import tracemalloc
+        if tracemalloc.is_tracing():
+            current, peak = tracemalloc.get_traced_memory()
+            print(f"\nПамять: сейчас {current / 1024:.1f} КБ, пик {peak / 1024:.1f} КБ", file=file)
+            print("Больше всего памяти выделили:", file=file)
+            # Память самих измерений в сводку не попадает
+            snapshot_data = tracemalloc.take_snapshot().filter_traces([
+                tracemalloc.Filter(False, __file__),
+                tracemalloc.Filter(False, tracemalloc.__file__)
+            ])
+            for stat in snapshot_data.statistics('lineno')[:MEMORY_TOP]:
+                frame = stat.traceback[0]
+                print(f"  {stat.size / 1024:9.1f} КБ  {frame.filename}:{frame.lineno}", file=file)
+
+
+def profile_call(func: Callable[[], Any], output: Optional[str] = None,
+                 top: int = 20, file: Optional[TextIO] = None) -> Any:
+    """Выполняет функцию под cProfile.
+
+    Args:
+        func: Функция без аргументов, например выполнение одной команды.
+        output: Файл для сохранения статистики в формате pstats (для
+            snakeviz, python -m pstats и т.п.). Если None, не сохраняется.
+        top: Сколько функций с наибольшим суммарным временем напечатать.
+        file: Файл для вывода (по умолчанию sys.stderr).
+
+    Returns:
+        Результат func.
+
+    Note:
+        Профиль сохраняется и печатается, даже если func завершилась
+        исключением (в том числе SystemExit).
+    """
+    import cProfile
+    import pstats
+
+    profiler = cProfile.Profile()
+    profiler.enable()
+    try:
+        return func()
+    finally:
+        profiler.disable()
+        if output:
+            profiler.dump_stats(output)
+        stats = pstats.Stats(profiler, stream=file or sys.stderr)
+        stats.sort_stats('cumulative').print_stats(top)
+
+
+_mode = os.environ.get(PROFILE_ENV, '').strip().lower()
+if _mode not in ('', '0'):
+    enable(memory=_mode == 'memory')
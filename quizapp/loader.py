@@ -3,11 +3,422 @@
 
 Этот модуль предоставляет функциональность для работы с файлами тестов
 в формате JSON. Включает валидацию структуры тестов и обработку ошибок.
+Для очень больших тестов поддерживается потоковая загрузка (TestStream),
+при которой в памяти одновременно находится только один вопрос.
+Загруженные тесты хранятся в ограниченном по размеру кэше (TestCache):
+QuestionBank - общим объектом, а словарь теста - текстом JSON, который
+разбирается заново при каждом вызове load_test.
 """
 import json
 import os
-from typing import Dict, List, Any
-import glob
+import re
+import sys
+import threading
+from collections import OrderedDict
+from typing import Dict, List, Any, Iterator, Callable, Optional
+
+from . import instrument
+from .question import Question, QuestionBank, as_question
+from .compiled import COMPILED_EXTENSION, MappedQuestions, find_compiled, open_compiled
+
+# Размер блока, которым читается файл при потоковой загрузке
+STREAM_CHUNK_SIZE = 64 * 1024
+
+# Ограничения кэша загруженных тестов по умолчанию
+CACHE_MAX_ENTRIES = 32
+CACHE_MAX_BYTES = 256 * 1024 * 1024
+
+# Максимальное количество потоков для одновременной загрузки тестов
+MAX_LOAD_THREADS = 8
+
+# Сколько байт с конца файла читается при добавлении вопроса
+_APPEND_TAIL_SIZE = 4096
+
+# Во сколько раз разобранный тест в памяти больше JSON файла (оценка)
+_BANK_SIZE_FACTOR = 2
+_WHITESPACE = ' \t\n\r'
+
+
+class TestStream:
+    """Потоковое чтение теста из JSON файла.
+
+    Поля верхнего уровня (title, description и т.д.) читаются сразу,
+    а вопросы из массива questions разбираются по одному при итерации.
+    Поэтому пиковое потребление памяти определяется размером одного
+    вопроса, а не всего файла.
+
+    Attributes:
+        file_path (str): Путь к файлу теста.
+        header (Dict[str, Any]): Поля теста, кроме questions.
+        title (str): Название теста.
+
+    Example:
+        >>> stream = TestStream('tests/math_test.json')
+        >>> print(stream.title)
+        'Математический тест'
+        >>> for question in stream:
+        ...     print(question.text)
+    """
+
+    def __init__(self, file_path: str):
+        """Открывает файл теста и читает поля верхнего уровня.
+
+        Args:
+            file_path: Путь к файлу теста.
+
+        Raises:
+            FileNotFoundError: Если файл не найден.
+            ValueError: Если файл содержит некорректный JSON или отсутствуют
+                обязательные поля.
+        """
+        self.file_path = file_path
+        self.header = {}
+        self._has_questions = False
+
+        # Обычно заголовок идет перед вопросами и файл дочитывать не нужно.
+        # Если же название указано после массива вопросов, массив
+        # пропускается по одному вопросу, не загружая его целиком.
+        for _ in self._parse(collect_header=True):
+            pass
+
+        if 'title' not in self.header:
+            raise ValueError("Отсутствует обязательное поле: title")
+        if not self._has_questions:
+            raise ValueError("Отсутствует обязательное поле: questions")
+
+        self.title = self.header['title']
+
+    def __iter__(self) -> Iterator[Question]:
+        """Последовательно возвращает вопросы теста.
+
+        Yields:
+            Вопросы (Question) в порядке следования в файле.
+        """
+        for data in self.iter_dicts():
+            yield Question.from_dict(data)
+
+    def iter_dicts(self) -> Iterator[Dict[str, Any]]:
+        """Последовательно возвращает вопросы теста без преобразования в Question.
+
+        Yields:
+            Словари с данными вопросов в порядке следования в файле.
+
+        Note:
+            Подходит для случаев, когда большинство вопросов будет
+            пропущено (например, при случайной выборке), и компилировать
+            ключ ответа для каждого из них не нужно.
+        """
+        for i, data in enumerate(self._parse(collect_header=False), 1):
+            if not isinstance(data, dict):
+                raise ValueError(f"Вопрос {i}: ожидался объект JSON")
+            yield data
+
+    def _parse(self, collect_header: bool) -> Iterator[Dict[str, Any]]:
+        """Разбирает файл теста, возвращая вопросы по одному.
+
+        Args:
+            collect_header: Режим чтения заголовка: поля верхнего уровня
+                сохраняются, а массив вопросов просматривается, только если
+                название теста еще не встретилось.
+
+        Yields:
+            Словари с данными вопросов.
+        """
+        try:
+            with open(self.file_path, 'r', encoding='utf-8') as file:
+                reader = _JsonChunkReader(file)
+                reader.expect('{')
+                if reader.peek() == '}':
+                    return
+
+                while True:
+                    key = reader.value()
+                    reader.expect(':')
+
+                    if key == 'questions' and reader.peek() == '[':
+                        self._has_questions = True
+                        if collect_header and 'title' in self.header:
+                            return
+                        reader.expect('[')
+                        if reader.peek() == ']':
+                            reader.expect(']')
+                        else:
+                            while True:
+                                yield reader.value()
+                                if reader.expect(',]') == ']':
+                                    break
+                        if not collect_header:
+                            return
+                    elif collect_header:
+                        self.header[key] = reader.value()
+                    else:
+                        reader.value()
+
+                    if reader.expect(',}') == '}':
+                        return
+
+        except FileNotFoundError:
+            raise FileNotFoundError(f"Файл теста не найден: {self.file_path}")
+        except json.JSONDecodeError as e:
+            raise ValueError(f"Ошибка чтения JSON файла: {e}")
+
+
+class _JsonChunkReader:
+    """Читает JSON значения из текстового файла блоками.
+
+    Note:
+        Вспомогательный класс для TestStream. В буфере хранится только
+        еще не разобранная часть файла.
+    """
+
+    def __init__(self, file):
+        self._file = file
+        self._buffer = ''
+        self._pos = 0
+        self._eof = False
+        self._decoder = json.JSONDecoder()
+
+    def _fill(self) -> bool:
+        """Дочитывает очередной блок файла; возвращает False в конце файла."""
+        if self._eof:
+            return False
+        chunk = self._file.read(STREAM_CHUNK_SIZE)
+        if not chunk:
+            self._eof = True
+            return False
+        self._buffer = self._buffer[self._pos:] + chunk
+        self._pos = 0
+        return True
+
+    def peek(self) -> str:
+        """Возвращает следующий значимый символ, не извлекая его."""
+        while True:
+            while self._pos < len(self._buffer) and self._buffer[self._pos] in _WHITESPACE:
+                self._pos += 1
+            if self._pos < len(self._buffer):
+                return self._buffer[self._pos]
+            if not self._fill():
+                return ''
+
+    def expect(self, allowed: str) -> str:
+        """Извлекает следующий значимый символ, проверяя, что он допустим."""
+        char = self.peek()
+        if not char or char not in allowed:
+            raise json.JSONDecodeError(
+                f"Ожидался один из символов {allowed!r}", self._buffer, self._pos)
+        self._pos += 1
+        return char
+
+    def value(self) -> Any:
+        """Извлекает следующее JSON значение целиком."""
+        self.peek()
+        while True:
+            try:
+                value, end = self._decoder.raw_decode(self._buffer, self._pos)
+                # Число в конце буфера может быть прочитано не полностью
+                if end < len(self._buffer) or self._eof:
+                    self._pos = end
+                    return value
+            except json.JSONDecodeError:
+                if self._eof:
+                    raise
+            if not self._fill():
+                # Повторная попытка уже с признаком конца файла
+                continue
+
+
+def _ends_questions_array(tail: bytes, element_end: int, previous: bytes) -> bool:
+    """Проверяет по концу файла, что последний массив - это questions.
+
+    Args:
+        tail: Конец файла.
+        element_end: Позиция конца последнего элемента массива (или
+            сразу после открывающей скобки пустого массива).
+        previous: Последний значимый символ перед закрывающей скобкой
+            массива: b'}' или b'['.
+
+    Returns:
+        True, если последний элемент - объект с полем question, или
+        массив пуст и перед ним стоит ключ "questions".
+    """
+    if previous == b'[':
+        return re.search(rb'"questions"\s*:\s*$', tail[:element_end - 1]) is not None
+    # Начало последнего элемента ищется справа налево среди открывающих
+    # скобок конца файла, пока срез не окажется одним объектом JSON
+    start = element_end
+    while True:
+        start = tail.rfind(b'{', 0, start)
+        if start < 0:
+            return False
+        try:
+            element = json.loads(tail[start:element_end])
+        except ValueError:
+            continue
+        return isinstance(element, dict) and 'question' in element
+
+
+class TestCache:
+    """Кэш загруженных тестов с вытеснением давно неиспользуемых (LRU).
+
+    Запись кэша действительна, пока у файла не изменились время изменения
+    и размер. Размер кэша ограничен количеством записей и приблизительным
+    объемом памяти, который оценивается по размеру файла.
+
+    Attributes:
+        max_entries (int): Максимальное количество записей.
+        max_bytes (int): Максимальный приблизительный объем в байтах.
+        total_bytes (int): Текущий приблизительный объем в байтах.
+        hits (int): Количество обращений, обслуженных из кэша.
+        misses (int): Количество обращений, потребовавших загрузки файла.
+        evictions (int): Количество вытесненных записей.
+
+    Example:
+        >>> test_cache.get('bank', 'tests/math_test.json', TestLoader._read_bank)
+        >>> test_cache.stats()
+        {'entries': 1, 'bytes': 1608, 'hits': 0, 'misses': 1, 'evictions': 0}
+    """
+
+    def __init__(self, max_entries: int = CACHE_MAX_ENTRIES, max_bytes: int = CACHE_MAX_BYTES):
+        """Создает пустой кэш.
+
+        Args:
+            max_entries: Максимальное количество записей.
+            max_bytes: Максимальный приблизительный объем в байтах.
+        """
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.total_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._entries = OrderedDict()
+        # Тесты могут загружаться из нескольких потоков (load_banks)
+        self._lock = threading.Lock()
+
+    def get(self, kind: str, file_path: str, load: Callable[[str], Any]) -> Any:
+        """Возвращает тест из кэша или загружает его.
+
+        Args:
+            kind: Вид представления теста ('test' или 'bank').
+            file_path: Путь к файлу теста.
+            load: Функция загрузки, вызываемая при промахе.
+
+        Returns:
+            Загруженный тест.
+        """
+        try:
+            stat = os.stat(file_path)
+        except OSError:
+            # Ошибку в понятном виде сообщит функция загрузки
+            return load(file_path)
+
+        key = (kind, os.path.abspath(file_path))
+        signature = (stat.st_mtime_ns, stat.st_size)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] == signature:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                instrument.count('loader.cache_hit')
+                return entry[1]
+            self.misses += 1
+        instrument.count('loader.cache_miss')
+
+        # Загрузка выполняется без блокировки, чтобы разные файлы
+        # загружались параллельно
+        value = load(file_path)
+
+        size = self._estimate_size(value, stat.st_size)
+        with self._lock:
+            self._discard(key)
+            if size <= self.max_bytes:
+                self._entries[key] = (signature, value, size)
+                self.total_bytes += size
+                while len(self._entries) > self.max_entries or self.total_bytes > self.max_bytes:
+                    _, (_, _, evicted_size) = self._entries.popitem(last=False)
+                    self.total_bytes -= evicted_size
+                    self.evictions += 1
+
+        return value
+
+    def cached(self, kind: str, file_path: str) -> Optional[Any]:
+        """Возвращает тест, только если он уже есть в кэше и актуален.
+
+        Args:
+            kind: Вид представления теста ('test' или 'bank').
+            file_path: Путь к файлу теста.
+
+        Returns:
+            Загруженный тест или None.
+        """
+        key = (kind, os.path.abspath(file_path))
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        try:
+            stat = os.stat(file_path)
+        except OSError:
+            return None
+        if entry[0] != (stat.st_mtime_ns, stat.st_size):
+            return None
+        with self._lock:
+            if key in self._entries:
+                self._entries.move_to_end(key)
+            self.hits += 1
+        return entry[1]
+
+    def invalidate(self, file_path: Optional[str] = None) -> None:
+        """Удаляет записи о файле из кэша.
+
+        Args:
+            file_path: Путь к файлу теста. Если None, кэш очищается полностью.
+        """
+        with self._lock:
+            if file_path is None:
+                self._entries.clear()
+                self.total_bytes = 0
+                return
+
+            path = os.path.abspath(file_path)
+            for kind in ('test', 'bank'):
+                self._discard((kind, path))
+
+    def stats(self) -> Dict[str, int]:
+        """Возвращает счетчики кэша.
+
+        Returns:
+            Словарь с количеством записей, объемом, попаданиями,
+            промахами и вытеснениями.
+        """
+        return {
+            'entries': len(self._entries),
+            'bytes': self.total_bytes,
+            'hits': self.hits,
+            'misses': self.misses,
+            'evictions': self.evictions
+        }
+
+    def _discard(self, key: tuple) -> None:
+        """Удаляет запись из кэша, если она есть (вызывается под блокировкой)."""
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self.total_bytes -= entry[2]
+
+    @staticmethod
+    def _estimate_size(value: Any, file_size: int) -> int:
+        """Оценивает объем памяти, занимаемый загруженным тестом."""
+        if isinstance(value, QuestionBank):
+            if isinstance(value.questions, MappedQuestions):
+                # Вопросы остаются в файле, в памяти только заголовок
+                return 4096
+            return file_size * _BANK_SIZE_FACTOR
+        if isinstance(value, str):
+            return sys.getsizeof(value)
+        return file_size
+
+
+# Общий кэш загруженных тестов процесса
+test_cache = TestCache()
 
 
 class TestLoader:
@@ -37,14 +448,93 @@ class TestLoader:
                       обязательные поля.
                   Exception: При других ошибках загрузки.
 
+              Note:
+                  Текст файла кэшируется (см. TestCache), пока не изменятся время
+                  изменения и размер файла, и разбирается заново при каждом
+                  вызове: возвращаемый словарь принадлежит вызывающему, и его
+                  можно изменять. Разбор текста из памяти в несколько раз
+                  быстрее copy.deepcopy готового словаря.
+
               Example:
                   >>> test = TestLoader.load_test('math_test.json')
                   >>> print(test['title'])
                   'Математический тест'
               """
+        return json.loads(test_cache.get('test', file_path, TestLoader._read_test))
+
+    @staticmethod
+    def load_bank(file_path: str) -> QuestionBank:
+        """Загружает тест из JSON файла в компактном представлении.
+
+              Вопросы преобразуются в объекты Question прямо во время разбора
+              JSON, поэтому промежуточные словари вопросов не накапливаются.
+
+              Если передан файл .qbin или рядом с JSON файлом лежит актуальная
+              скомпилированная версия (см. quizapp.compiled), тест открывается
+              через mmap: вопросы читаются из файла по требованию, а время
+              открытия не зависит от размера теста. Результат кэшируется
+              (см. TestCache).
+
+              Args:
+                  file_path: Путь к файлу теста.
+
+              Returns:
+                  Набор вопросов QuestionBank.
+
+              Raises:
+                  FileNotFoundError: Если файл не найден.
+                  ValueError: Если файл содержит некорректный JSON или отсутствуют
+                      обязательные поля.
+                  Exception: При других ошибках загрузки.
+
+              Example:
+                  >>> bank = TestLoader.load_bank('math_test.json')
+                  >>> print(bank[0].text)
+                  'Сколько будет 2 + 2?'
+              """
+        return test_cache.get('bank', file_path, TestLoader._read_bank)
+
+    @staticmethod
+    @instrument.timed('loader.read_test')
+    def _read_test(file_path: str) -> str:
+        """Читает и проверяет JSON файл теста без использования кэша.
+
+        Returns:
+            Текст файла для кэша (см. load_test).
+        """
+        try:
+            with open(file_path, 'r', encoding='utf-8') as file:
+                text = file.read()
+            test_data = json.loads(text)
+
+            # Валидация структуры теста
+            required_fields = ['title', 'questions']
+            for field in required_fields:
+                if field not in test_data:
+                    raise ValueError(f"Отсутствует обязательное поле: {field}")
+
+            return text
+
+        except FileNotFoundError:
+            raise FileNotFoundError(f"Файл теста не найден: {file_path}")
+        except json.JSONDecodeError as e:
+            raise ValueError(f"Ошибка чтения JSON файла: {e}")
+        except Exception as e:
+            raise Exception(f"Ошибка загрузки теста: {e}")
+
+    @staticmethod
+    @instrument.timed('loader.read_bank')
+    def _read_bank(file_path: str) -> QuestionBank:
+        """Читает тест в компактном представлении без использования кэша."""
         try:
+            if file_path.endswith(COMPILED_EXTENSION):
+                return open_compiled(file_path)
+            binary_path = find_compiled(file_path)
+            if binary_path is not None:
+                return open_compiled(binary_path)
+
             with open(file_path, 'r', encoding='utf-8') as file:
-                test_data = json.load(file)
+                test_data = json.load(file, object_hook=_question_hook)
 
             # Валидация структуры теста
             required_fields = ['title', 'questions']
@@ -52,7 +542,13 @@ class TestLoader:
                 if field not in test_data:
                     raise ValueError(f"Отсутствует обязательное поле: {field}")
 
-            return test_data
+            questions = test_data['questions']
+            for i, question in enumerate(questions, 1):
+                if not isinstance(question, Question):
+                    raise ValueError(f"Вопрос {i}: отсутствует обязательное поле: question")
+
+            instrument.observe('loader.questions', len(questions))
+            return QuestionBank(test_data['title'], test_data.get('description', ''), questions)
 
         except FileNotFoundError:
             raise FileNotFoundError(f"Файл теста не найден: {file_path}")
@@ -62,30 +558,188 @@ class TestLoader:
             raise Exception(f"Ошибка загрузки теста: {e}")
 
     @staticmethod
-    def save_test(test_data: Dict[str, Any], file_path: str) -> None:
+    def load_test_stream(file_path: str) -> TestStream:
+        """Открывает тест для потокового чтения вопросов.
+
+              Args:
+                  file_path: Путь к файлу теста.
+
+              Returns:
+                  Объект TestStream, который возвращает вопросы по одному.
+
+              Raises:
+                  FileNotFoundError: Если файл не найден.
+                  ValueError: Если файл содержит некорректный JSON или отсутствуют
+                      обязательные поля.
+
+              Example:
+                  >>> stream = TestLoader.load_test_stream('big_test.json')
+                  >>> first_question = next(iter(stream))
+              """
+        return TestStream(file_path)
+
+    @staticmethod
+    @instrument.timed('loader.save_test')
+    def save_test(test_data: Dict[str, Any], file_path: str,
+                  compact: bool = False, fsync: bool = False) -> None:
         """Сохраняет тест в JSON файл.
 
                Args:
-                   test_data: Данные теста для сохранения.
+                   test_data: Данные теста для сохранения (словарь или QuestionBank).
                    file_path: Путь для сохранения файла.
+                   compact: Сохранить без отступов и пробелов. Уменьшает
+                       размер больших тестов на 30-40%.
+                   fsync: Дождаться записи данных на диск перед заменой файла.
 
                Raises:
                    Exception: При ошибках сохранения файла.
 
                Note:
                    Автоматически создает директории, если они не существуют.
+                   Тест записывается во временный файл, который затем атомарно
+                   заменяет исходный, поэтому сбой во время записи не
+                   повреждает уже существующий тест. Поле questions
+                   записывается последним, чтобы к файлу можно было
+                   добавлять вопросы через append_question.
                """
+        if isinstance(test_data, QuestionBank):
+            test_data = test_data.to_dict()
+
+        temp_path = f"{file_path}.{os.getpid()}.tmp"
         try:
             # Создаем директорию, если она не существует
-            os.makedirs(os.path.dirname(file_path), exist_ok=True)
-
-            with open(file_path, 'w', encoding='utf-8') as file:
-                json.dump(test_data, file, ensure_ascii=False, indent=2)
+            directory = os.path.dirname(file_path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+
+            # Вопросы записываются последними
+            ordered = {key: value for key, value in test_data.items() if key != 'questions'}
+            if 'questions' in test_data:
+                ordered['questions'] = test_data['questions']
+
+            with open(temp_path, 'w', encoding='utf-8') as file:
+                if compact:
+                    json.dump(ordered, file, ensure_ascii=False, separators=(',', ':'))
+                else:
+                    json.dump(ordered, file, ensure_ascii=False, indent=2)
+                if fsync:
+                    file.flush()
+                    os.fsync(file.fileno())
+
+            if os.path.exists(file_path):
+                os.chmod(temp_path, os.stat(file_path).st_mode & 0o7777)
+            os.replace(temp_path, file_path)
+            if fsync:
+                _fsync_directory(directory or '.')
+
+            test_cache.invalidate(file_path)
 
         except Exception as e:
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
             raise Exception(f"Ошибка сохранения теста: {e}")
 
     @staticmethod
+    def append_question(file_path: str, question: Any, fsync: bool = False) -> None:
+        """Добавляет вопрос в конец теста без перезаписи всего файла.
+
+               Args:
+                   file_path: Путь к файлу теста.
+                   question: Вопрос (словарь или Question).
+                   fsync: Дождаться записи данных на диск.
+
+               Raises:
+                   ValueError: Если вопрос некорректен или в файле нет
+                       массива questions.
+                   Exception: При других ошибках записи.
+
+               Note:
+                   save_test записывает массив questions последним полем,
+                   поэтому обычно перезаписывается только конец файла,
+                   начиная с закрывающей скобки массива. Читаются только
+                   последние _APPEND_TAIL_SIZE байт: файл должен заканчиваться
+                   на ] }, а последний элемент массива - быть вопросом (объект
+                   с полем question) или массив - быть пустым полем questions.
+                   Время добавления не зависит от размера теста. Оформление
+                   (с отступами или компактное) определяется по существующему
+                   файлу. Запись на месте, в отличие от save_test, не атомарна.
+
+                   Если конец файла другой (например, после questions идут
+                   другие поля или последний вопрос длиннее просматриваемого
+                   конца), тест загружается целиком и сохраняется через
+                   save_test (атомарно, с полем questions в конце, поэтому
+                   следующие добавления снова выполняются на месте).
+
+               Example:
+                   >>> TestLoader.append_question('tests/math_test.json',
+                   ...     {'question': 'Сколько будет 3 + 3?', 'answer': '6'})
+               """
+        question_data = as_question(question).to_dict()
+
+        try:
+            with open(file_path, 'rb') as file:
+                file_size = file.seek(0, os.SEEK_END)
+                tail_start = max(0, file_size - _APPEND_TAIL_SIZE)
+                file.seek(tail_start)
+                tail = file.read()
+
+            # Конец файла должен иметь вид: ...<последний вопрос или [> ] }
+            position = len(tail.rstrip())
+            close_position = len(tail[:position - 1].rstrip()) if position else 0
+            element_end = len(tail[:close_position - 1].rstrip()) if close_position else 0
+            previous = tail[element_end - 1:element_end]
+            if (tail[position - 1:position] != b'}'
+                    or tail[close_position - 1:close_position] != b']'
+                    or previous not in (b'}', b'[')
+                    or not _ends_questions_array(tail, element_end, previous)):
+                TestLoader._append_by_rewrite(file_path, question_data, fsync)
+                return
+            close_position -= 1
+
+            whitespace = tail[element_end:close_position].decode('utf-8')
+            if previous == b'[':
+                record = json.dumps(question_data, ensure_ascii=False, separators=(',', ':'))
+            elif '\n' in whitespace:
+                indent = whitespace + '  '
+                record = ',' + indent + json.dumps(
+                    question_data, ensure_ascii=False, indent=2).replace('\n', indent)
+            else:
+                record = ',' + json.dumps(question_data, ensure_ascii=False, separators=(',', ':'))
+
+            with open(file_path, 'r+b') as file:
+                file.seek(tail_start + element_end)
+                file.write(record.encode('utf-8') + tail[element_end:])
+                if fsync:
+                    file.flush()
+                    os.fsync(file.fileno())
+
+            test_cache.invalidate(file_path)
+
+        except FileNotFoundError:
+            raise FileNotFoundError(f"Файл теста не найден: {file_path}")
+        except ValueError:
+            raise
+        except Exception as e:
+            raise Exception(f"Ошибка добавления вопроса: {e}")
+
+    @staticmethod
+    def _append_by_rewrite(file_path: str, question_data: Dict[str, Any], fsync: bool) -> None:
+        """Добавляет вопрос, загружая и атомарно пересохраняя весь тест."""
+        with open(file_path, 'r', encoding='utf-8') as file:
+            text = file.read()
+        try:
+            test_data = json.loads(text)
+        except json.JSONDecodeError as e:
+            raise ValueError(f"Некорректный JSON в файле теста: {e}")
+        if not isinstance(test_data, dict) or not isinstance(test_data.get('questions'), list):
+            raise ValueError("В файле теста нет массива questions")
+
+        test_data['questions'].append(question_data)
+        # Оформление сохраняется: файл без переводов строк остается компактным
+        TestLoader.save_test(test_data, file_path, compact='\n' not in text.strip(), fsync=fsync)
+
+    @staticmethod
+    @instrument.timed('loader.list_tests')
     def list_available_tests() -> List[str]:
         """Возвращает список доступных тестов.
 
@@ -95,6 +749,8 @@ class TestLoader:
              Note:
                  Ищет файлы в папке 'tests' и корневой директории проекта.
              """
+        import glob
+
         test_patterns = [
             'tests/*.json',
             '*.json'
@@ -107,6 +763,27 @@ class TestLoader:
         return tests
 
 
+def _fsync_directory(directory: str) -> None:
+    """Сбрасывает на диск запись каталога (после переименования файла)."""
+    try:
+        descriptor = os.open(directory, os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        os.fsync(descriptor)
+    except OSError:
+        pass
+    finally:
+        os.close(descriptor)
+
+
+def _question_hook(obj: Dict[str, Any]) -> Any:
+    """Преобразует объекты вопросов в Question во время разбора JSON."""
+    if 'question' in obj and 'questions' not in obj:
+        return Question.from_dict(obj)
+    return obj
+
+
 # Создаем функции-обертки для удобного импорта
 def load_test(file_path: str) -> Dict[str, Any]:
     """Загружает тест из JSON файла.
@@ -123,17 +800,96 @@ def load_test(file_path: str) -> Dict[str, Any]:
     return TestLoader.load_test(file_path)
 
 
-def save_test(test_data: Dict[str, Any], file_path: str) -> None:
+def load_bank(file_path: str) -> QuestionBank:
+    """Загружает тест в компактном представлении.
+
+    Args:
+        file_path: Путь к файлу теста.
+
+    Returns:
+        Набор вопросов QuestionBank.
+
+    See Also:
+        TestLoader.load_bank: Реализация метода класса.
+    """
+    return TestLoader.load_bank(file_path)
+
+
+def load_banks(file_paths: List[str], max_workers: Optional[int] = None) -> List[QuestionBank]:
+    """Загружает несколько тестов одновременно.
+
+    Args:
+        file_paths: Пути к файлам тестов.
+        max_workers: Количество потоков. По умолчанию по числу файлов,
+            но не больше MAX_LOAD_THREADS.
+
+    Returns:
+        Список QuestionBank в порядке file_paths.
+
+    Raises:
+        FileNotFoundError: Если какой-либо файл не найден.
+        ValueError: Если какой-либо тест некорректен.
+
+    Note:
+        Чтение файлов с диска и открытие скомпилированных тестов идут
+        параллельно, поэтому общее время близко ко времени загрузки
+        самого медленного файла, а не к сумме. Разбор JSON выполняется
+        под GIL, поэтому для больших JSON тестов выигрыш меньше - их
+        стоит скомпилировать (quizapp.compiled).
+    """
+    if max_workers is None:
+        max_workers = min(len(file_paths), MAX_LOAD_THREADS) or 1
+    if max_workers == 1:
+        return [load_bank(file_path) for file_path in file_paths]
+
+    from concurrent.futures import ThreadPoolExecutor
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        return list(executor.map(load_bank, file_paths))
+
+
+def load_test_stream(file_path: str) -> TestStream:
+    """Открывает тест для потокового чтения вопросов.
+
+    Args:
+        file_path: Путь к файлу теста.
+
+    Returns:
+        Объект TestStream с заголовком теста и итератором вопросов.
+
+    See Also:
+        TestLoader.load_test_stream: Реализация метода класса.
+    """
+    return TestLoader.load_test_stream(file_path)
+
+
+def save_test(test_data: Dict[str, Any], file_path: str,
+              compact: bool = False, fsync: bool = False) -> None:
     """Сохраняет тест в JSON файл.
 
     Args:
         test_data: Данные теста для сохранения.
         file_path: Путь для сохранения файла.
+        compact: Сохранить без отступов и пробелов.
+        fsync: Дождаться записи данных на диск.
 
     See Also:
         TestLoader.save_test: Реализация метода класса.
     """
-    TestLoader.save_test(test_data, file_path)
+    TestLoader.save_test(test_data, file_path, compact, fsync)
+
+
+def append_question(file_path: str, question: Any, fsync: bool = False) -> None:
+    """Добавляет вопрос в конец теста без перезаписи всего файла.
+
+    Args:
+        file_path: Путь к файлу теста.
+        question: Вопрос (словарь или Question).
+        fsync: Дождаться записи данных на диск.
+
+    See Also:
+        TestLoader.append_question: Реализация метода класса.
+    """
+    TestLoader.append_question(file_path, question, fsync)
 
 
 def list_available_tests() -> List[str]:
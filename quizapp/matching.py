@@ -0,0 +1,223 @@
+"""
+Модуль сравнения текстовых ответов с допуском.
+
+Ответ пользователя и правильный ответ приводятся к нормальной форме:
+Unicode NFKC, без учета регистра, ё заменяется на е, пробелы и знаки
+препинания удаляются (значимые символы вроде '+', '#', '=', скобки,
+минус рядом с цифрой и десятичная точка или запятая между цифрами
+сохраняются). Поэтому "Python 3" и "python3", "Ёлка" и "елка", "3,14"
+и "3.14" считаются одинаковыми, а "-5" и "5", "1-2" и "12",
+"list(range(10))" и "listrange10" - нет. Ответ только из знаков
+препинания (например "?") сравнивается без удаления знаков.
+
+По выбору (main.py --max-typos N) допускается небольшое количество
+опечаток (расстояние Левенштейна), зависящее от длины ответа. По умолчанию
+опечатки не допускаются, чтобы не менять оценку существующих тестов. Числа
+в ответе должны совпадать точно, вместе со знаком и дробной частью: "1945"
+и "1946", "-273" и "273" - разные ответы.
+
+Правильные ответы нормализуются один раз при загрузке вопроса
+(Question.answer_key и Question.alias_keys), а расстояние Левенштейна вычисляется только при
+несовпадении нормализованных строк, в полосе ширины 2k+1 и с досрочным
+выходом, как только расстояние заведомо превышает допуск k.
+"""
+import re
+import unicodedata
+from typing import Iterable, Optional
+
+# Наибольшее количество опечаток по умолчанию (опечатки не допускаются)
+DEFAULT_MAX_TYPOS = 0
+# Длина ответа, начиная с которой допускается одна опечатка
+# (с удвоенной длины - две и т.д., но не больше max_typos)
+TYPO_MIN_LENGTH = 5
+
+# Удаляются пробелы и знаки препинания, кроме точки между цифрами,
+# минуса рядом с цифрой и скобок
+_INSIGNIFICANT = re.compile(r'(?<!\d)\.|\.(?!\d)|(?<!\d)-(?!\d)|[^\w.\-#$%&*+/<=>@\\^|~()\[\]{}]+')
+_DECIMAL_COMMA = re.compile(r'(?<=\d),(?=\d)')
+# Числа со знаком и дробной частью: опечаткой не считается никакое
+# отличие в числе
+_DIGITS = re.compile(r'-?\d+(?:\.\d+)?')
+# Размер кэша нормализованных ответов: при пакетной проверке одни и те же
+# ответы встречаются многократно
+NORMALIZE_CACHE_SIZE = 65536
+_normalized = {}
+
+
+def normalize_answer(text: str) -> str:
+    """Приводит ответ к нормальной форме для сравнения.
+
+    Args:
+        text: Ответ.
+
+    Returns:
+        Нормализованная строка.
+
+    Example:
+        >>> normalize_answer(' Python 3! ')
+        'python3'
+    """
+    normalized = _normalized.get(text)
+    if normalized is not None:
+        return normalized
+
+    # Для ASCII строк нормализация Unicode и замена ё не нужны, а строки
+    # только из букв и цифр не требуют удаления знаков
+    if text.isascii():
+        lowered = text.lower()
+    else:
+        lowered = unicodedata.normalize('NFKC', text).casefold().replace('ё', 'е')
+    normalized = lowered
+    if not normalized.isalnum():
+        normalized = _INSIGNIFICANT.sub('', _DECIMAL_COMMA.sub('.', normalized))
+        if not normalized:
+            # Ответ только из знаков препинания: иначе "?" совпал бы
+            # с любым другим набором знаков
+            normalized = lowered.strip()
+
+    if len(_normalized) >= NORMALIZE_CACHE_SIZE:
+        _normalized.clear()
+    _normalized[text] = normalized
+    return normalized
+
+
+def bounded_levenshtein(first: str, second: str, limit: int) -> int:
+    """Вычисляет расстояние Левенштейна, если оно не больше limit.
+
+    Args:
+        first: Первая строка.
+        second: Вторая строка.
+        limit: Наибольшее интересующее расстояние.
+
+    Returns:
+        Расстояние или limit + 1, если оно больше limit.
+
+    Note:
+        Общие начало и конец строк отбрасываются, затем вычисляется только
+        полоса шириной 2 * limit + 1 вокруг диагонали матрицы, и вычисление
+        прекращается, как только все значения в строке матрицы превышают
+        limit.
+    """
+    if abs(len(first) - len(second)) > limit:
+        return limit + 1
+
+    # Общие начало и конец не влияют на расстояние
+    prefix = 0
+    shortest = min(len(first), len(second))
+    while prefix < shortest and first[prefix] == second[prefix]:
+        prefix += 1
+    suffix = 0
+    while suffix < shortest - prefix and first[-1 - suffix] == second[-1 - suffix]:
+        suffix += 1
+    first = first[prefix:len(first) - suffix]
+    second = second[prefix:len(second) - suffix]
+
+    if len(first) > len(second):
+        first, second = second, first
+    if not first:
+        return min(len(second), limit + 1)
+    if limit == 1:
+        # Одна правка оставляет после отбрасывания общих частей не более
+        # одного символа в каждой строке
+        return 1 if len(second) == 1 else 2
+
+    over = limit + 1
+    previous = list(range(len(second) + 1))
+    for i in range(1, len(first) + 1):
+        char = first[i - 1]
+        start = max(1, i - limit)
+        end = min(len(second), i + limit)
+        current = [over] * (len(second) + 1)
+        current[0] = i if i <= limit else over
+        best = current[0]
+        for j in range(start, end + 1):
+            cost = previous[j - 1] + (char != second[j - 1])
+            deletion = previous[j] + 1
+            insertion = current[j - 1] + 1
+            value = min(cost, deletion, insertion, over)
+            current[j] = value
+            if value < best:
+                best = value
+        if best > limit:
+            return over
+        previous = current
+    return min(previous[len(second)], over)
+
+
+class AnswerMatcher:
+    """Правило сравнения текстовых ответов.
+
+    Attributes:
+        max_typos (int): Наибольшее количество опечаток (0 - только
+            совпадение после нормализации).
+        min_length (int): Длина правильного ответа, начиная с которой
+            допускается одна опечатка.
+
+    Example:
+        >>> matcher = AnswerMatcher(max_typos=2)
+        >>> matcher.matches(('программирование',), 'програмирование')
+        True
+    """
+
+    def __init__(self, max_typos: int = DEFAULT_MAX_TYPOS, min_length: int = TYPO_MIN_LENGTH):
+        """Создает правило сравнения.
+
+        Args:
+            max_typos: Наибольшее количество опечаток.
+            min_length: Длина ответа, начиная с которой допускается опечатка.
+        """
+        self.max_typos = max_typos
+        self.min_length = min_length
+
+    def allowed_typos(self, key: str) -> int:
+        """Возвращает допустимое количество опечаток для правильного ответа."""
+        if self.max_typos <= 0 or self.min_length <= 0:
+            return 0
+        return min(self.max_typos, len(key) // self.min_length)
+
+    def matches(self, keys: Iterable[str], user_answer: str) -> bool:
+        """Проверяет ответ пользователя.
+
+        Args:
+            keys: Нормализованные правильные ответы (см. normalize_answer).
+            user_answer: Ответ пользователя как есть.
+
+        Returns:
+            True, если ответ совпадает с одним из правильных ответов
+            с учетом допуска.
+        """
+        answer = normalize_answer(user_answer)
+        if answer in keys:
+            return True
+        if self.max_typos <= 0 or not answer:
+            return False
+
+        numbers = None
+        for key in keys:
+            limit = self.allowed_typos(key)
+            if limit == 0 or abs(len(key) - len(answer)) > limit:
+                continue
+            if numbers is None:
+                numbers = _DIGITS.findall(answer)
+            if _DIGITS.findall(key) != numbers:
+                continue
+            if bounded_levenshtein(key, answer, limit) <= limit:
+                return True
+        return False
+
+    def __repr__(self) -> str:
+        return f"AnswerMatcher(max_typos={self.max_typos}, min_length={self.min_length})"
+
+
+default_matcher = AnswerMatcher()
+
+
+def set_default_matcher(matcher: Optional[AnswerMatcher]) -> None:
+    """Задает правило сравнения, используемое Question.check по умолчанию.
+
+    Args:
+        matcher: Правило сравнения. None восстанавливает правило
+            по умолчанию (DEFAULT_MAX_TYPOS опечаток).
+    """
+    global default_matcher
+    default_matcher = matcher if matcher is not None else AnswerMatcher()
@@ -0,0 +1,307 @@
+"""
+Модуль компактного представления вопросов.
+
+Вопросы теста хранятся не как словари, а как объекты Question со
+__slots__: у них нет собственного __dict__, варианты ответов хранятся
+в кортеже, а короткие повторяющиеся строки (варианты и ответы) интернируются.
+
+При создании вопроса ключ ответа компилируется один раз: для вопроса с
+вариантами определяется номер правильного варианта, для текстового
+вопроса - нормализованный ответ и допустимые варианты ответа (aliases,
+см. quizapp.matching). Проверка ответа после этого сводится к сравнению
+чисел или строк без повторной нормализации правильного ответа. Если
+правильный ответ не совпадает ровно с одним вариантом, вопрос все равно
+создается: номер правильного варианта не определяется, причина
+сохраняется в поле warning (ее показывает --validate), а ответ
+проверяется прежним правилом - вариант должен начинаться с правильного
+ответа.
+
+Необязательные поля tags (темы), difficulty (сложность) и weight (вес)
+используются при выборке случайных вопросов (см. quizapp.sampling). Темы
+и сложность интернируются, а вес по умолчанию - общий объект 1.0, поэтому
+вопросы без этих полей (вместе с полем warning) занимают всего на 32 байта
+больше.
+
+Память на один вопрос (Python 3.11, tracemalloc, с учетом текста вопроса
+"Вопрос номер N?" и ссылки в списке):
+
+    ==============================  ==========  ==========
+    Вопрос                          dict        Question
+    ==============================  ==========  ==========
+    С 4 вариантами ответов          ~560 байт   ~280 байт
+    Текстовый                       ~415 байт   ~205 байт
+    ==============================  ==========  ==========
+"""
+import sys
+from typing import Dict, List, Any, Optional, Tuple, Iterator
+
+from . import matching
+from .matching import AnswerMatcher, normalize_answer
+
+
+class Question:
+    """Вопрос теста.
+
+    Attributes:
+        text (str): Текст вопроса.
+        options (Optional[Tuple[str, ...]]): Варианты ответов или None
+            для текстового вопроса.
+        answer (str): Правильный ответ.
+        aliases (Optional[Tuple[str, ...]]): Другие допустимые формулировки
+            правильного ответа или None.
+        answer_key (str): Нормализованный правильный ответ
+            (см. matching.normalize_answer, интернированная строка).
+        alias_keys (Optional[Tuple[str, ...]]): Нормализованные aliases.
+        correct_index (Optional[int]): Индекс правильного варианта или None
+            для текстового вопроса.
+        tags (Optional[Tuple[str, ...]]): Темы вопроса или None.
+        difficulty (Optional[str]): Сложность вопроса (например easy,
+            medium, hard) или None.
+        weight (float): Относительная вероятность выбора вопроса
+            в случайной выборке (по умолчанию 1.0).
+
+    Example:
+        >>> question = Question.from_dict({'question': '2 + 2?', 'answer': '4'})
+        >>> question.check('4')
+        True
+    """
+    __slots__ = ('text', 'options', 'answer', 'aliases', 'answer_key', 'alias_keys', 'correct_index',
+                 'warning', 'tags', 'difficulty', 'weight')
+
+    def __init__(self, text: str, options: Optional[Tuple[str, ...]], answer: str,
+                 aliases: Optional[Tuple[str, ...]] = None, tags: Optional[Tuple[str, ...]] = None,
+                 difficulty: Optional[str] = None, weight: float = 1.0):
+        """Создает вопрос и компилирует ключ ответа.
+
+        Args:
+            text: Текст вопроса.
+            options: Варианты ответов или None для текстового вопроса.
+            answer: Правильный ответ.
+            aliases: Другие допустимые формулировки правильного ответа.
+            tags: Темы вопроса.
+            difficulty: Сложность вопроса.
+            weight: Относительная вероятность выбора вопроса.
+
+        Raises:
+            ValueError: Если вес не является положительным числом.
+        """
+        if not weight > 0 or weight == float('inf'):
+            raise ValueError(f"Вопрос «{text}»: вес должен быть положительным числом, а не {weight}")
+        self.text = text
+        self.options = options
+        self.answer = answer
+        self.aliases = aliases or None
+        self.tags = tags or None
+        self.difficulty = difficulty
+        self.weight = weight
+        self.answer_key = sys.intern(normalize_answer(answer))
+        self.alias_keys = (tuple(sys.intern(normalize_answer(alias)) for alias in aliases)
+                           if aliases else None)
+        self.correct_index = None
+        self.warning = None
+
+        if options is not None:
+            # Сначала точное совпадение без учета регистра, затем
+            # совпадение нормализованных строк
+            plain_answer = answer.lower().strip()
+            matches = [i for i, option in enumerate(options)
+                       if option.lower().strip() == plain_answer]
+            if not matches:
+                matches = [i for i, option in enumerate(options)
+                           if normalize_answer(option) == self.answer_key]
+            if not matches:
+                self.warning = f"Вопрос «{text}»: ответ «{answer}» не совпадает ни с одним вариантом"
+            elif len(matches) > 1:
+                numbers = ', '.join(str(i + 1) for i in matches)
+                self.warning = (f"Вопрос «{text}»: ответ «{answer}» совпадает с несколькими "
+                                f"вариантами ({numbers})")
+            else:
+                self.correct_index = matches[0]
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'Question':
+        """Создает вопрос из словаря в формате JSON файла теста.
+
+        Args:
+            data: Словарь с ключами question, answer и необязательными
+                options, aliases, tags, difficulty и weight.
+
+        Returns:
+            Объект Question.
+
+        Raises:
+            ValueError: Если отсутствует текст вопроса, темы заданы
+                не списком или вес не является положительным числом.
+        """
+        if 'question' not in data:
+            raise ValueError("Отсутствует обязательное поле вопроса: question")
+
+        options = data.get('options')
+        if options is not None:
+            options = tuple(sys.intern(str(option)) for option in options)
+
+        aliases = data.get('aliases')
+        if aliases:
+            aliases = tuple(str(alias) for alias in aliases)
+
+        tags = data.get('tags')
+        if tags is not None and not isinstance(tags, list):
+            raise ValueError(f"Вопрос «{data['question']}»: темы (tags) должны быть списком")
+        if tags:
+            tags = tuple(sys.intern(str(tag)) for tag in tags)
+
+        difficulty = data.get('difficulty')
+        if difficulty is not None:
+            difficulty = sys.intern(str(difficulty))
+
+        weight = data.get('weight', 1.0)
+        if isinstance(weight, bool) or not isinstance(weight, (int, float)):
+            raise ValueError(f"Вопрос «{data['question']}»: вес должен быть числом")
+
+        return cls(data['question'], options, sys.intern(str(data.get('answer', ''))), aliases,
+                   tags, difficulty, weight)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Преобразует вопрос в словарь для сохранения в JSON.
+
+        Returns:
+            Словарь в формате JSON файла теста.
+        """
+        data = {'question': self.text}
+        if self.options is not None:
+            data['options'] = list(self.options)
+        data['answer'] = self.answer
+        if self.aliases:
+            data['aliases'] = list(self.aliases)
+        if self.tags:
+            data['tags'] = list(self.tags)
+        if self.difficulty is not None:
+            data['difficulty'] = self.difficulty
+        if self.weight != 1.0:
+            data['weight'] = self.weight
+        return data
+
+    def check(self, user_answer: str, matcher: Optional[AnswerMatcher] = None) -> bool:
+        """Проверяет ответ пользователя по скомпилированному ключу.
+
+        Args:
+            user_answer: Ответ, введенный пользователем.
+            matcher: Правило сравнения текстовых ответов. По умолчанию
+                matching.default_matcher.
+
+        Returns:
+            True если ответ правильный, иначе False.
+
+        Note:
+            Для вопросов с вариантами ответов номер варианта сравнивается
+            с индексом правильного варианта. Если введено не число или номер
+            вне диапазона, ответ сравнивается с правильным ответом после
+            нормализации, но без допуска опечаток (соседний вариант может
+            отличаться от правильного одной буквой). Текстовые ответы
+            сравниваются по правилу matcher. Если номер правильного варианта
+            не определен (см. warning), выбранный вариант засчитывается,
+            когда он начинается с правильного ответа.
+        """
+        if self.options is not None:
+            try:
+                option_index = int(user_answer.strip()) - 1
+                if 0 <= option_index < len(self.options):
+                    if self.correct_index is None:
+                        return self.options[option_index].lower().startswith(self.answer.lower().strip())
+                    return option_index == self.correct_index
+            except ValueError:
+                pass
+            answer = normalize_answer(user_answer)
+            return answer == self.answer_key or (self.alias_keys is not None and answer in self.alias_keys)
+
+        if user_answer == self.answer:
+            return True
+        keys = (self.answer_key,) if self.alias_keys is None else (self.answer_key,) + self.alias_keys
+        return (matcher or matching.default_matcher).matches(keys, user_answer)
+
+    @property
+    def is_multiple_choice(self) -> bool:
+        """True, если у вопроса есть варианты ответов."""
+        return self.options is not None
+
+    def __repr__(self) -> str:
+        return f"Question({self.text!r})"
+
+
+class QuestionBank:
+    """Набор вопросов теста вместе с его заголовком.
+
+    Attributes:
+        title (str): Название теста.
+        description (str): Описание теста.
+        questions (List[Question]): Вопросы теста.
+
+    Example:
+        >>> bank = QuestionBank.from_dict(test_data)
+        >>> print(len(bank), bank[0].text)
+    """
+    __slots__ = ('title', 'description', 'questions')
+
+    def __init__(self, title: str, description: str, questions: List[Question]):
+        """Создает набор вопросов.
+
+        Args:
+            title: Название теста.
+            description: Описание теста.
+            questions: Вопросы теста.
+        """
+        self.title = title
+        self.description = description
+        self.questions = questions
+
+    @classmethod
+    def from_dict(cls, test_data: Dict[str, Any]) -> 'QuestionBank':
+        """Создает набор вопросов из данных теста.
+
+        Args:
+            test_data: Данные теста; вопросы могут быть словарями
+                или уже готовыми объектами Question.
+
+        Returns:
+            Объект QuestionBank.
+        """
+        return cls(
+            test_data.get('title', 'Без названия'),
+            test_data.get('description', ''),
+            [as_question(question) for question in test_data.get('questions', [])]
+        )
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Преобразует набор вопросов в данные теста для сохранения в JSON.
+
+        Returns:
+            Словарь в формате JSON файла теста.
+        """
+        return {
+            'title': self.title,
+            'description': self.description,
+            'questions': [question.to_dict() for question in self.questions]
+        }
+
+    def __len__(self) -> int:
+        return len(self.questions)
+
+    def __getitem__(self, index: int) -> Question:
+        return self.questions[index]
+
+    def __iter__(self) -> Iterator[Question]:
+        return iter(self.questions)
+
+
+def as_question(question: Any) -> Question:
+    """Приводит вопрос к типу Question.
+
+    Args:
+        question: Объект Question или словарь с данными вопроса.
+
+    Returns:
+        Объект Question.
+    """
+    if isinstance(question, Question):
+        return question
+    return Question.from_dict(question)
@@ -0,0 +1,309 @@
+"""
+Модуль вывода (рендереры).
+
+Движок тестирования, вывод результатов и команды CLI не печатают текст
+напрямую, а сообщают о событиях рендереру: начало теста, очередной вопрос,
+проверка ответа, результаты, произвольная строка. Рендерер решает, как
+их показать:
+
+    TerminalRenderer  - текст для человека; строки накапливаются в буфере
+                        и выводятся одной записью на экран (перед запросом
+                        ввода, после результатов), а не print на каждую
+                        строку, что заметно быстрее при выводе в канал,
+                        файл или удаленный терминал
+    JsonLinesRenderer - по одному JSON объекту на событие для программ
+    NullRenderer      - ничего не выводит: для сценариев и измерений
+                        производительности, где вывод не нужен
+
+Рендерер по умолчанию - TerminalRenderer; его можно заменить через
+set_default_renderer или флагом --render в main.py.
+
+Example:
+    >>> set_default_renderer(create_renderer('jsonl'))
+    >>> display_results(4, 5, user_answers)
+    {"event": "results", "score": 4, "total": 5, ...}
+"""
+import atexit
+import json
+import sys
+from typing import Dict, List, Any, Optional, TextIO
+
+# Наибольшее количество строк в буфере TerminalRenderer до записи
+MAX_BUFFERED_LINES = 1000
+
+
+class Renderer:
+    """Интерфейс рендерера.
+
+    Методы вызываются движком (QuizEngine), display_results и командами
+    CLI. Базовый класс ничего не выводит, а ask читает ответ через input().
+    """
+
+    def line(self, text: str = '') -> None:
+        """Выводит строку текста (сообщение команды)."""
+
+    def quiz_started(self, title: str, total: Optional[int]) -> None:
+        """Сообщает о начале теста.
+
+        Args:
+            title: Название теста.
+            total: Количество вопросов или None, если оно неизвестно.
+        """
+
+    def question(self, question: Any, position: Optional[int] = None,
+                 total: Optional[int] = None) -> None:
+        """Показывает вопрос.
+
+        Args:
+            question: Вопрос (Question).
+            position: Номер вопроса с единицы. Если None, заголовок
+                вопроса не выводится.
+            total: Количество вопросов в тесте или None.
+        """
+
+    def answer_result(self, question: Any, is_correct: bool) -> None:
+        """Сообщает результат проверки ответа на вопрос."""
+
+    def interrupted(self) -> None:
+        """Сообщает, что тестирование прервано пользователем."""
+
+    def results(self, score: int, total: int, percentage: float, grade: str,
+                user_answers: List[Dict]) -> None:
+        """Показывает результаты тестирования.
+
+        Args:
+            score: Количество правильных ответов.
+            total: Общее количество вопросов.
+            percentage: Процент правильных ответов.
+            grade: Оценка словами.
+            user_answers: История ответов пользователя.
+        """
+
+    def ask(self, prompt: str) -> str:
+        """Запрашивает ввод пользователя.
+
+        Args:
+            prompt: Приглашение к вводу.
+
+        Returns:
+            Введенная строка.
+        """
+        self.flush()
+        return input()
+
+    def flush(self) -> None:
+        """Выводит накопленный текст."""
+
+
+class NullRenderer(Renderer):
+    """Рендерер, который ничего не выводит.
+
+    Ответы по-прежнему читаются из стандартного ввода, поэтому тест можно
+    пройти по сценарию: printf '2\\n4\\n' | python main.py --take-test ... --render null
+    """
+
+
+class TerminalRenderer(Renderer):
+    """Текстовый вывод с буферизацией по экранам.
+
+    Attributes:
+        stream (Optional[TextIO]): Поток вывода. Если None, используется
+            текущий sys.stdout (на момент записи).
+    """
+
+    def __init__(self, stream: Optional[TextIO] = None):
+        """Создает рендерер.
+
+        Args:
+            stream: Поток вывода (по умолчанию sys.stdout).
+        """
+        self.stream = stream
+        self._lines = []
+
+    def line(self, text: str = '') -> None:
+        self._lines.append(text)
+        if len(self._lines) >= MAX_BUFFERED_LINES:
+            self.flush()
+
+    def quiz_started(self, title: str, total: Optional[int]) -> None:
+        self._lines.append(f"\n=== Тест: {title} ===")
+        if total is not None:
+            self._lines.append(f"Количество вопросов: {total}")
+
+    def question(self, question: Any, position: Optional[int] = None,
+                 total: Optional[int] = None) -> None:
+        lines = self._lines
+        if position is not None:
+            if total is not None:
+                lines.append(f"\n--- Вопрос {position} из {total} ---")
+            else:
+                lines.append(f"\n--- Вопрос {position} ---")
+        lines.append(f"\n{question.text}")
+        if question.options is not None:
+            lines.extend(f"{i}. {option}" for i, option in enumerate(question.options, 1))
+
+    def answer_result(self, question: Any, is_correct: bool) -> None:
+        if is_correct:
+            self._lines.append("✓ Правильно!")
+        else:
+            self._lines.append(f"✗ Неправильно. Правильный ответ: {question.answer or 'Не указан'}")
+
+    def interrupted(self) -> None:
+        self._lines.append("\n\nТестирование прервано.")
+        self.flush()
+
+    def results(self, score: int, total: int, percentage: float, grade: str,
+                user_answers: List[Dict]) -> None:
+        lines = self._lines
+        lines.append("\n" + "=" * 50)
+        lines.append("РЕЗУЛЬТАТЫ ТЕСТИРОВАНИЯ")
+        lines.append("=" * 50)
+        lines.append(f"Правильные ответы: {score}/{total}")
+        lines.append(f"Процент правильных ответов: {percentage:.1f}%")
+        lines.append(f"Оценка: {grade}")
+
+        # Детальная статистика по ответам
+        lines.append("\nДетальная статистика:")
+        lines.extend(f"{i}. {'✓' if answer['is_correct'] else '✗'} {answer['question']}"
+                     for i, answer in enumerate(user_answers, 1))
+        self.flush()
+
+    def ask(self, prompt: str) -> str:
+        # Приглашение выводится вместе с экраном, без перевода строки
+        stream = self.stream or sys.stdout
+        text = '\n'.join(self._lines) + '\n' if self._lines else ''
+        self._lines.clear()
+        stream.write(text + prompt)
+        stream.flush()
+        return input()
+
+    def flush(self) -> None:
+        if not self._lines:
+            return
+        stream = self.stream or sys.stdout
+        stream.write('\n'.join(self._lines) + '\n')
+        self._lines.clear()
+        stream.flush()
+
+
+class JsonLinesRenderer(Renderer):
+    """Вывод событий в формате JSON Lines для программ.
+
+    Каждое событие - одна строка с JSON объектом, поле event задает тип:
+    message, quiz, question, prompt, answer, interrupted, results.
+
+    Attributes:
+        stream (Optional[TextIO]): Поток вывода. Если None, используется
+            текущий sys.stdout.
+    """
+
+    def __init__(self, stream: Optional[TextIO] = None):
+        """Создает рендерер.
+
+        Args:
+            stream: Поток вывода (по умолчанию sys.stdout).
+        """
+        self.stream = stream
+
+    def _emit(self, event: Dict[str, Any]) -> None:
+        (self.stream or sys.stdout).write(json.dumps(event, ensure_ascii=False) + '\n')
+
+    def line(self, text: str = '') -> None:
+        # Пустые строки и отступы нужны только для чтения человеком
+        text = text.strip('\n')
+        if text:
+            self._emit({'event': 'message', 'text': text})
+
+    def quiz_started(self, title: str, total: Optional[int]) -> None:
+        self._emit({'event': 'quiz', 'title': title, 'total': total})
+
+    def question(self, question: Any, position: Optional[int] = None,
+                 total: Optional[int] = None) -> None:
+        self._emit({'event': 'question', 'position': position, 'total': total,
+                    'text': question.text, 'options': question.options})
+
+    def answer_result(self, question: Any, is_correct: bool) -> None:
+        self._emit({'event': 'answer', 'is_correct': is_correct,
+                    'correct_answer': question.answer})
+
+    def interrupted(self) -> None:
+        self._emit({'event': 'interrupted'})
+        self.flush()
+
+    def results(self, score: int, total: int, percentage: float, grade: str,
+                user_answers: List[Dict]) -> None:
+        self._emit({'event': 'results', 'score': score, 'total': total,
+                    'percentage': percentage, 'grade': grade, 'answers': user_answers})
+        self.flush()
+
+    def ask(self, prompt: str) -> str:
+        self._emit({'event': 'prompt', 'text': prompt.strip()})
+        self.flush()
+        return input()
+
+    def flush(self) -> None:
+        (self.stream or sys.stdout).flush()
+
+
+RENDERERS = {
+    'terminal': TerminalRenderer,
+    'jsonl': JsonLinesRenderer,
+    'null': NullRenderer,
+}
+
+
+def create_renderer(name: str) -> Renderer:
+    """Создает рендерер по имени.
+
+    Args:
+        name: 'terminal', 'jsonl' или 'null'.
+
+    Returns:
+        Новый рендерер.
+
+    Raises:
+        ValueError: Если имя неизвестно.
+    """
+    try:
+        return RENDERERS[name]()
+    except KeyError:
+        raise ValueError(f"Неизвестный формат вывода: {name} "
+                         f"(доступны: {', '.join(RENDERERS)})")
+
+
+default_renderer = TerminalRenderer()
+
+
+def _flush_default() -> None:
+    default_renderer.flush()
+
+
+# Накопленный вывод не теряется при завершении процесса
+atexit.register(_flush_default)
+
+
+def set_default_renderer(renderer: Optional[Renderer]) -> None:
+    """Задает рендерер, используемый по умолчанию.
+
+    Args:
+        renderer: Рендерер. None восстанавливает TerminalRenderer.
+            Накопленный вывод предыдущего рендерера выводится.
+    """
+    global default_renderer
+    default_renderer.flush()
+    default_renderer = renderer if renderer is not None else TerminalRenderer()
+
+
+def flush_output() -> None:
+    """Выводит накопленный текст рендерера по умолчанию."""
+    default_renderer.flush()
+
+
+def echo(text: str = '') -> None:
+    """Выводит строку через рендерер по умолчанию."""
+    default_renderer.line(text)
+
+
+def ask(prompt: str) -> str:
+    """Запрашивает ввод через рендерер по умолчанию."""
+    return default_renderer.ask(prompt)
@@ -2,18 +2,28 @@
 Модуль для отображения результатов и статистики.
 
 Этот модуль предоставляет функции для форматированного вывода результатов
-тестирования и расчета статистики.
+тестирования и расчета статистики, а также накопители статистики,
+которые обновляются по одному ответу и объединяются между процессами.
 """
-from typing import List, Dict, Any, Tuple
+import math
+from typing import List, Dict, Any, Tuple, Iterable, Optional
 
+from . import instrument, render
 
-def display_results(score: int, total: int, user_answers: List[Dict]) -> None:
+# Ширина корзины распределения результатов (в процентах)
+SKETCH_RESOLUTION = 0.1
+
+
+@instrument.timed('results.display')
+def display_results(score: int, total: int, user_answers: List[Dict],
+                    renderer: Optional[render.Renderer] = None) -> None:
     """Отображает результаты тестирования в форматированном виде.
 
        Args:
            score: Количество правильных ответов.
            total: Общее количество вопросов.
            user_answers: История ответов пользователя.
+           renderer: Рендерер вывода (по умолчанию render.default_renderer).
 
        Example:
            >>> display_results(8, 10, user_answers)
@@ -26,12 +36,6 @@ def display_results(score: int, total: int, user_answers: List[Dict]) -> None:
        """
     percentage = (score / total) * 100 if total > 0 else 0
 
-    print("\n" + "=" * 50)
-    print("РЕЗУЛЬТАТЫ ТЕСТИРОВАНИЯ")
-    print("=" * 50)
-    print(f"Правильные ответы: {score}/{total}")
-    print(f"Процент правильных ответов: {percentage:.1f}%")
-
     # Оценка
     if percentage >= 90:
         grade = "Отлично! 🎉"
@@ -42,20 +46,219 @@ def display_results(score: int, total: int, user_answers: List[Dict]) -> None:
     else:
         grade = "Нужно повторить материал 📚"
 
-    print(f"Оценка: {grade}")
+    (renderer or render.default_renderer).results(score, total, percentage, grade, user_answers)
+
+
+class ScoreSketch:
+    """Приближенное распределение результатов с ограниченной памятью.
+
+    Результаты в процентах (от 0 до 100) раскладываются по корзинам
+    фиксированной ширины, поэтому объем памяти не зависит от количества
+    результатов, перцентили вычисляются с точностью до ширины корзины,
+    а два распределения объединяются сложением счетчиков.
+
+    Attributes:
+        resolution (float): Ширина корзины в процентах.
+        count (int): Количество учтенных результатов.
+
+    Example:
+        >>> sketch = ScoreSketch()
+        >>> for percentage in (40, 80, 100):
+        ...     sketch.add(percentage)
+        >>> sketch.quantile(0.5)
+        80.0
+    """
+    __slots__ = ('resolution', 'count', '_bins')
+
+    def __init__(self, resolution: float = SKETCH_RESOLUTION):
+        """Создает пустое распределение.
+
+        Args:
+            resolution: Ширина корзины в процентах.
+        """
+        self.resolution = resolution
+        self.count = 0
+        self._bins = [0] * (int(round(100 / resolution)) + 1)
+
+    def add(self, percentage: float) -> None:
+        """Учитывает результат в процентах."""
+        index = int(round(min(max(percentage, 0.0), 100.0) / self.resolution))
+        self._bins[index] += 1
+        self.count += 1
+
+    def merge(self, other: 'ScoreSketch') -> 'ScoreSketch':
+        """Добавляет к распределению другое распределение той же точности.
+
+        Raises:
+            ValueError: Если у распределений разная ширина корзины.
+        """
+        if other.resolution != self.resolution:
+            raise ValueError("Нельзя объединить распределения с разной точностью")
+        for index, value in enumerate(other._bins):
+            if value:
+                self._bins[index] += value
+        self.count += other.count
+        return self
+
+    def quantile(self, fraction: float) -> Optional[float]:
+        """Возвращает приближенный перцентиль.
+
+        Args:
+            fraction: Доля от 0 до 1 (например, 0.95 для p95).
+
+        Returns:
+            Результат в процентах или None, если результатов нет.
+        """
+        if self.count == 0:
+            return None
+        rank = max(1, math.ceil(fraction * self.count))
+        seen = 0
+        for index, value in enumerate(self._bins):
+            seen += value
+            if seen >= rank:
+                return index * self.resolution
+        return 100.0
+
+
+class StatisticsAccumulator:
+    """Накопитель статистики, обновляемый по одному ответу.
+
+    Накопители можно объединять (merge), поэтому статистику можно
+    собирать параллельно в разных процессах или по частям журнала и
+    затем сложить. Чтение текущих значений (to_dict) не требует
+    повторного просмотра истории.
+
+    Attributes:
+        total (int): Количество ответов.
+        correct (int): Количество правильных ответов.
+        question_types (Dict[str, Dict[str, int]]): Ответы по типам вопросов.
+        attempts (int): Количество завершенных попыток.
+        score_mean (float): Средний результат попытки в процентах.
+        sketch (ScoreSketch): Распределение результатов попыток.
+
+    Example:
+        >>> accumulator = StatisticsAccumulator()
+        >>> for answer in user_answers:
+        ...     accumulator.add_answer(answer)
+        >>> accumulator.add_attempt(score, total)
+        >>> accumulator.to_dict()['score_percentiles']['p50']
+    """
+    __slots__ = ('total', 'correct', 'question_types', 'attempts',
+                 'score_mean', '_score_m2', 'sketch')
 
-    # Детальная статистика по ответам
-    print("\nДетальная статистика:")
-    for i, answer in enumerate(user_answers, 1):
-        status = "✓" if answer['is_correct'] else "✗"
-        print(f"{i}. {status} {answer['question']}")
+    def __init__(self):
+        """Создает пустой накопитель."""
+        self.total = 0
+        self.correct = 0
+        self.question_types = {}
+        self.attempts = 0
+        self.score_mean = 0.0
+        self._score_m2 = 0.0
+        self.sketch = ScoreSketch()
 
+    def add_answer(self, answer: Dict[str, Any]) -> None:
+        """Учитывает один ответ.
 
-def calculate_statistics(user_answers: List[Dict]) -> Dict[str, Any]:
+        Args:
+            answer: Ответ в формате истории ответов или записи журнала
+                попыток (используются поля is_correct и type).
+        """
+        is_correct = bool(answer['is_correct'])
+        self.total += 1
+        self.correct += is_correct
+
+        q_type = answer.get('type', 'text')
+        type_stats = self.question_types.get(q_type)
+        if type_stats is None:
+            type_stats = self.question_types[q_type] = {'total': 0, 'correct': 0}
+        type_stats['total'] += 1
+        type_stats['correct'] += is_correct
+
+    def add_attempt(self, score: int, total: int) -> None:
+        """Учитывает результат завершенной попытки.
+
+        Args:
+            score: Количество правильных ответов.
+            total: Количество вопросов.
+        """
+        percentage = (score / total) * 100 if total > 0 else 0.0
+        # Алгоритм Уэлфорда для среднего и дисперсии
+        self.attempts += 1
+        delta = percentage - self.score_mean
+        self.score_mean += delta / self.attempts
+        self._score_m2 += delta * (percentage - self.score_mean)
+        self.sketch.add(percentage)
+
+    @property
+    def score_variance(self) -> float:
+        """Выборочная дисперсия результатов попыток."""
+        return self._score_m2 / (self.attempts - 1) if self.attempts > 1 else 0.0
+
+    def merge(self, other: 'StatisticsAccumulator') -> 'StatisticsAccumulator':
+        """Добавляет к накопителю статистику другого накопителя.
+
+        Args:
+            other: Накопитель, собранный в другом процессе или по другой
+                части данных.
+
+        Returns:
+            Этот же накопитель.
+        """
+        self.total += other.total
+        self.correct += other.correct
+        for q_type, type_stats in other.question_types.items():
+            own = self.question_types.setdefault(q_type, {'total': 0, 'correct': 0})
+            own['total'] += type_stats['total']
+            own['correct'] += type_stats['correct']
+
+        if other.attempts:
+            # Объединение средних и дисперсий (формула Чана)
+            attempts = self.attempts + other.attempts
+            delta = other.score_mean - self.score_mean
+            self.score_mean += delta * other.attempts / attempts
+            self._score_m2 += other._score_m2 + delta * delta * self.attempts * other.attempts / attempts
+            self.attempts = attempts
+            self.sketch.merge(other.sketch)
+        return self
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Возвращает текущую статистику.
+
+        Returns:
+            Словарь с полями calculate_statistics, а если учтены попытки -
+            также attempts, score_mean, score_variance и score_percentiles.
+            Для пустого накопителя возвращается пустой словарь.
+        """
+        if self.total == 0 and self.attempts == 0:
+            return {}
+
+        stats = {
+            'total_questions': self.total,
+            'correct_answers': self.correct,
+            'percentage': (self.correct / self.total) * 100 if self.total else 0.0,
+            'question_types': {q_type: dict(type_stats)
+                               for q_type, type_stats in self.question_types.items()}
+        }
+        if self.attempts:
+            stats.update({
+                'attempts': self.attempts,
+                'score_mean': self.score_mean,
+                'score_variance': self.score_variance,
+                'score_percentiles': {
+                    f"p{int(fraction * 100)}": self.sketch.quantile(fraction)
+                    for fraction in (0.5, 0.9, 0.95, 0.99)
+                }
+            })
+        return stats
+
+
+@instrument.timed('results.statistics')
+def calculate_statistics(user_answers: Iterable[Dict]) -> Dict[str, Any]:
     """Рассчитывает подробную статистику тестирования.
 
       Args:
-          user_answers: История ответов пользователя.
+          user_answers: История ответов пользователя или любой поток ответов,
+              например записи журнала попыток (quizapp.attempts.iter_attempts).
 
       Returns:
           Словарь со статистикой, содержащий:
@@ -64,31 +267,49 @@ def calculate_statistics(user_answers: List[Dict]) -> Dict[str, Any]:
           - percentage: Процент правильных ответов
           - question_types: Статистика по типам вопросов
 
+      Note:
+          Ответы обрабатываются за один проход без сохранения в памяти
+          (см. StatisticsAccumulator), поэтому функция подходит для
+          миллионов записей журнала.
+
       Example:
           >>> stats = calculate_statistics(user_answers)
           >>> print(stats['percentage'])
           80.0
       """
-    if not user_answers:
-        return {}
+    accumulator = StatisticsAccumulator()
+    for answer in user_answers:
+        accumulator.add_answer(answer)
+    return accumulator.to_dict()
 
-    total = len(user_answers)
-    correct = sum(1 for answer in user_answers if answer['is_correct'])
-    percentage = (correct / total) * 100
 
-    # Анализ по типам вопросов (можно расширить)
-    question_types = {}
-    for answer in user_answers:
-        q_type = "multiple_choice" if 'options' in answer else "text"
-        if q_type not in question_types:
-            question_types[q_type] = {'total': 0, 'correct': 0}
-        question_types[q_type]['total'] += 1
-        if answer['is_correct']:
-            question_types[q_type]['correct'] += 1
-
-    return {
-        'total_questions': total,
-        'correct_answers': correct,
-        'percentage': percentage,
-        'question_types': question_types
-    }
\ No newline at end of file
+def accumulate_attempts(records: Iterable[Dict[str, Any]]) -> StatisticsAccumulator:
+    """Собирает накопитель статистики по записям журнала попыток.
+
+    Args:
+        records: Записи журнала (quizapp.attempts.iter_attempts).
+
+    Returns:
+        StatisticsAccumulator со статистикой ответов и результатами
+        попыток (записи группируются по полю attempt).
+
+    Note:
+        Записи не хранятся, но для каждой попытки в памяти остаются два
+        счетчика, пока поток не будет прочитан до конца: записи попыток
+        из сервера (quizapp.server) перемежаются в одном сегменте, поэтому
+        попытку нельзя закрыть при смене поля attempt. Память растет
+        с количеством попыток, а не ответов.
+    """
+    accumulator = StatisticsAccumulator()
+    attempts = {}
+    for record in records:
+        accumulator.add_answer(record)
+        counters = attempts.get(record.get('attempt'))
+        if counters is None:
+            counters = attempts[record.get('attempt')] = [0, 0]
+        counters[0] += bool(record['is_correct'])
+        counters[1] += 1
+
+    for score, total in attempts.values():
+        accumulator.add_attempt(score, total)
+    return accumulator
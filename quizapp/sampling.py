@@ -0,0 +1,329 @@
+"""
+Модуль выборки вопросов по весам, сложности и темам.
+
+Равномерная выборка (random.sample) не позволяет собрать сбалансированный
+вариант теста: например 30% легких, 50% средних и 20% сложных вопросов или
+не менее двух вопросов по каждой теме. QuestionSampler строит один раз
+для набора вопросов:
+
+    - страты - массивы номеров вопросов каждой сложности и каждой темы
+      (поля difficulty и tags вопроса);
+    - таблицы псевдонимов (alias method) по весам вопросов страты (поле
+      weight), которые позволяют выбрать вопрос с вероятностью,
+      пропорциональной весу, за O(1): одно случайное число и одно сравнение.
+
+Выборка без повторов: уже выбранный вопрос отбрасывается, и выбор
+повторяется. Пока выборка мала по сравнению со стратой, повторы редки,
+и время выбора зависит только от размера выборки, а не от размера теста.
+Если повторов слишком много (выборка сравнима со стратой), оставшиеся
+вопросы выбираются точно за один проход по страте (ключи
+Эфраимидиса-Спиракиса). Оба способа дают одно и то же распределение:
+каждый следующий вопрос выбирается пропорционально весу среди еще
+не выбранных.
+
+Построение стратов требует одного прохода по вопросам, а таблица
+псевдонимов строится при первой выборке с учетом весов из страты,
+поэтому сэмплер стоит создавать один раз на набор (см.
+QuizEngine.sampler).
+
+Example:
+    >>> sampler = QuestionSampler(bank.questions)
+    >>> questions = sampler.sample(10, difficulty={'easy': 30, 'medium': 50, 'hard': 20},
+    ...                            tags={'алгебра': 2})
+"""
+import heapq
+import math
+import random
+from array import array
+from typing import Dict, List, Optional, Sequence
+
+from .question import Question
+
+# Сколько выборов в среднем допускается на один вопрос выборки, прежде
+# чем оставшиеся вопросы выбираются точным способом
+MAX_DRAWS_PER_QUESTION = 8
+
+
+class AliasTable:
+    """Таблица псевдонимов для выбора номера с вероятностью по весу.
+
+    Для n весов хранит n вероятностей и n номеров-псевдонимов: выбирается
+    равновероятно ячейка i, и с вероятностью probability[i] результат - i,
+    иначе alias[i]. Построение - O(n) (вариант Возе), выбор - O(1).
+
+    Attributes:
+        probability (array): Вероятность оставить номер ячейки.
+        alias (array): Номер, выбираемый вместо номера ячейки.
+
+    Example:
+        >>> table = AliasTable([1.0, 3.0])
+        >>> table.draw(random.Random(1))
+        0
+    """
+    __slots__ = ('probability', 'alias')
+
+    def __init__(self, weights: Sequence[float]):
+        """Строит таблицу.
+
+        Args:
+            weights: Положительные веса.
+
+        Raises:
+            ValueError: Если список весов пуст.
+        """
+        count = len(weights)
+        if not count:
+            raise ValueError("Пустой список весов")
+        total = math.fsum(weights)
+        scaled = [weight * count / total for weight in weights]
+        probability = array('d', [1.0]) * count
+        alias = array('I', range(count))
+
+        small = [index for index, value in enumerate(scaled) if value < 1.0]
+        large = [index for index, value in enumerate(scaled) if value >= 1.0]
+        while small and large:
+            less, more = small.pop(), large.pop()
+            probability[less] = scaled[less]
+            alias[less] = more
+            scaled[more] += scaled[less] - 1.0
+            (small if scaled[more] < 1.0 else large).append(more)
+        # Оставшиеся ячейки (из-за погрешности округления) заполнены
+        # полностью: probability 1.0 и alias на себя
+
+        self.probability = probability
+        self.alias = alias
+
+    def __len__(self) -> int:
+        return len(self.probability)
+
+    def draw(self, rng: random.Random) -> int:
+        """Выбирает номер с вероятностью, пропорциональной весу.
+
+        Args:
+            rng: Генератор случайных чисел.
+
+        Returns:
+            Номер от 0 до n - 1.
+        """
+        # Целая часть выбирает ячейку, дробная - сравнивается с вероятностью
+        value = rng.random() * len(self.probability)
+        index = int(value)
+        return index if value - index < self.probability[index] else self.alias[index]
+
+
+class _Stratum:
+    """Номера вопросов одной страты и таблица псевдонимов по их весам."""
+    __slots__ = ('indexes', 'weights', 'table')
+
+    def __init__(self, indexes: array, weights: Optional[array]):
+        self.indexes = indexes
+        # None, если веса вопросов страты одинаковы
+        self.weights = weights
+        self.table = None
+
+    def draw(self, rng: random.Random, weighted: bool) -> int:
+        """Выбирает номер вопроса (с повторами)."""
+        if weighted and self.weights is not None:
+            if self.table is None:
+                self.table = AliasTable(self.weights)
+            return self.indexes[self.table.draw(rng)]
+        return self.indexes[int(rng.random() * len(self.indexes))]
+
+
+class QuestionSampler:
+    """Выборка вопросов без повторов по весам, сложности и темам.
+
+    Attributes:
+        questions (Sequence[Question]): Вопросы набора.
+        difficulties (Dict[str, int]): Количество вопросов каждой сложности.
+        tags (Dict[str, int]): Количество вопросов каждой темы.
+
+    Example:
+        >>> sampler = QuestionSampler(bank.questions)
+        >>> sampler.sample(5, random.Random(7), difficulty={'easy': 1, 'hard': 1})
+    """
+
+    def __init__(self, questions: Sequence[Question]):
+        """Строит страты по сложности и темам.
+
+        Args:
+            questions: Вопросы набора, например QuestionBank.questions или
+                MappedQuestions скомпилированного теста (каждый вопрос
+                читается один раз).
+        """
+        self.questions = questions
+        weights = array('d')
+        uniform = True
+        difficulty_ids = array('I')
+        difficulty_names = {}
+        by_difficulty = {}
+        by_tag = {}
+
+        for index, question in enumerate(questions):
+            weights.append(question.weight)
+            if question.weight != 1.0:
+                uniform = False
+            difficulty = question.difficulty
+            if difficulty is None:
+                difficulty_ids.append(0)
+            else:
+                # Номер 0 означает вопрос без сложности
+                difficulty_ids.append(difficulty_names.setdefault(difficulty, len(difficulty_names) + 1))
+                indexes = by_difficulty.get(difficulty)
+                if indexes is None:
+                    indexes = by_difficulty[difficulty] = array('I')
+                indexes.append(index)
+            if question.tags:
+                for tag in question.tags:
+                    indexes = by_tag.get(tag)
+                    if indexes is None:
+                        indexes = by_tag[tag] = array('I')
+                    indexes.append(index)
+
+        self._weights = None if uniform else weights
+        self._difficulty_ids = difficulty_ids
+        self._difficulty_names = difficulty_names
+        self._all = self._stratum(array('I', range(len(weights))))
+        self._by_difficulty = {name: self._stratum(indexes) for name, indexes in by_difficulty.items()}
+        self._by_tag = {name: self._stratum(indexes) for name, indexes in by_tag.items()}
+        self.difficulties = {name: len(stratum.indexes) for name, stratum in self._by_difficulty.items()}
+        self.tags = {name: len(stratum.indexes) for name, stratum in self._by_tag.items()}
+
+    def _stratum(self, indexes: array) -> _Stratum:
+        """Создает страту; веса сохраняются, только если они различаются."""
+        if self._weights is None:
+            return _Stratum(indexes, None)
+        weights = array('d', (self._weights[index] for index in indexes))
+        if min(weights, default=1.0) == max(weights, default=1.0):
+            return _Stratum(indexes, None)
+        return _Stratum(indexes, weights)
+
+    def sample(self, count: int, rng: Optional[random.Random] = None,
+               difficulty: Optional[Dict[str, float]] = None,
+               tags: Optional[Dict[str, int]] = None,
+               weighted: bool = True) -> List[Question]:
+        """Выбирает вопросы без повторов.
+
+        Args:
+            count: Количество вопросов. Если больше размера набора,
+                выбираются все вопросы.
+            rng: Генератор случайных чисел. Если None, используется новый.
+            difficulty: Доли сложностей в выборке, например
+                {'easy': 30, 'medium': 50, 'hard': 20} (нормируются
+                на сумму). Количества округляются методом наибольших
+                остатков. Если вопросов какой-то сложности не хватает,
+                выборка дополняется вопросами любой сложности.
+            tags: Наименьшее количество вопросов по темам, например
+                {'алгебра': 2, 'геометрия': 1}. Выбираются до распределения
+                по сложности и засчитываются в доли сложностей.
+            weighted: Учитывать веса вопросов (поле weight).
+
+        Returns:
+            Список вопросов в случайном порядке.
+
+        Raises:
+            ValueError: Если в наборе нет вопросов указанной сложности или
+                темы, вопросов темы меньше ее минимума, доли сложностей
+                не положительны или сумма минимумов по темам больше count.
+        """
+        if rng is None:
+            rng = random.Random()
+        count = min(count, len(self._all.indexes))
+        if count <= 0:
+            return []
+        # Словарь сохраняет порядок выбора и проверяет повторы за O(1)
+        chosen = {}
+
+        if tags:
+            if sum(tags.values()) > count:
+                raise ValueError(f"Сумма минимумов по темам ({sum(tags.values())}) "
+                                 f"больше количества вопросов ({count})")
+            strata = {tag: self._find(self._by_tag, tag, 'с темой') for tag in tags}
+            for tag, minimum in tags.items():
+                if minimum > len(strata[tag].indexes):
+                    raise ValueError(f"В тесте {len(strata[tag].indexes)} вопросов с темой {tag}, "
+                                     f"а нужно не менее {minimum}")
+            for tag, minimum in tags.items():
+                self._draw(strata[tag], minimum, rng, weighted, chosen)
+
+        if difficulty:
+            quotas = apportion(difficulty, count)
+            taken = {}
+            for index in chosen:
+                difficulty_id = self._difficulty_ids[index]
+                taken[difficulty_id] = taken.get(difficulty_id, 0) + 1
+            for name, quota in quotas.items():
+                stratum = self._find(self._by_difficulty, name, 'со сложностью')
+                already = taken.get(self._difficulty_names[name], 0)
+                self._draw(stratum, min(quota - already, count - len(chosen)), rng, weighted, chosen)
+
+        self._draw(self._all, count - len(chosen), rng, weighted, chosen)
+        selected = list(chosen)
+        rng.shuffle(selected)
+        return [self.questions[index] for index in selected]
+
+    @staticmethod
+    def _find(strata: Dict[str, _Stratum], name: str, kind: str) -> _Stratum:
+        """Возвращает страту по имени или сообщает об ошибке."""
+        stratum = strata.get(name)
+        if stratum is None:
+            available = ', '.join(sorted(strata)) or 'нет'
+            raise ValueError(f"В тесте нет вопросов {kind} {name} (есть: {available})")
+        return stratum
+
+    def _draw(self, stratum: _Stratum, count: int, rng: random.Random, weighted: bool,
+              chosen: Dict[int, None]) -> None:
+        """Добавляет в chosen до count еще не выбранных вопросов страты."""
+        if count <= 0:
+            return
+        size = len(stratum.indexes)
+        if count * 2 < size:
+            draws = count * MAX_DRAWS_PER_QUESTION
+            while count and draws:
+                index = stratum.draw(rng, weighted)
+                draws -= 1
+                if index not in chosen:
+                    chosen[index] = None
+                    count -= 1
+            if not count:
+                return
+
+        candidates = [index for index in stratum.indexes if index not in chosen]
+        if weighted and stratum.weights is not None:
+            weights = self._weights
+            picked = heapq.nlargest(count, candidates,
+                                    key=lambda index: rng.random() ** (1.0 / weights[index]))
+        else:
+            picked = rng.sample(candidates, min(count, len(candidates)))
+        chosen.update(dict.fromkeys(picked))
+
+
+def apportion(shares: Dict[str, float], count: int) -> Dict[str, int]:
+    """Распределяет count вопросов по долям методом наибольших остатков.
+
+    Args:
+        shares: Доли, например {'easy': 30, 'medium': 50, 'hard': 20}.
+        count: Распределяемое количество.
+
+    Returns:
+        Количества с суммой count.
+
+    Raises:
+        ValueError: Если есть отрицательная доля или сумма долей
+            не положительна.
+
+    Example:
+        >>> apportion({'easy': 30, 'medium': 50, 'hard': 20}, 7)
+        {'easy': 2, 'medium': 4, 'hard': 1}
+    """
+    if any(share < 0 for share in shares.values()):
+        raise ValueError("Доли не могут быть отрицательными")
+    total = math.fsum(shares.values())
+    if not total > 0:
+        raise ValueError("Сумма долей должна быть положительной")
+    exact = {name: count * share / total for name, share in shares.items()}
+    quotas = {name: int(value) for name, value in exact.items()}
+    rest = count - sum(quotas.values())
+    for name in sorted(exact, key=lambda name: quotas[name] - exact[name])[:rest]:
+        quotas[name] += 1
+    return quotas
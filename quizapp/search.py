@@ -0,0 +1,397 @@
+"""
+Модуль полнотекстового поиска по тестам.
+
+Строит инвертированный индекс по тексту вопросов, вариантам, правильным
+ответам и темам всех тестов, найденных list_available_tests, и отвечает на
+запросы вида «квадратный корень» или «list comprehension» списком
+вопросов, упорядоченных по релевантности (BM25).
+
+Индекс хранится в базе SQLite в служебной папке (.quizcache/search.db)
+и обновляется инкрементально, как каталог тестов: повторно разбираются
+только файлы, у которых изменились время изменения или размер, а записи
+об удаленных файлах удаляются. Файлы читаются потоком (TestStream),
+поэтому индексировать можно и очень большие тесты.
+
+Токенизация: Unicode NFKC, без учета регистра, ё заменяется на е, слова -
+последовательности букв и цифр. Для русских и английских слов
+отбрасываются окончания (упрощенный стемминг), а у русских основ - беглая
+гласная последнего слога (корень - корня, отец - отца), поэтому
+«квадратного корня» находит «квадратный корень», а «lists» - «list».
+Частые служебные слова не индексируются.
+"""
+import functools
+import heapq
+import math
+import os
+import re
+import sqlite3
+import unicodedata
+from array import array
+from typing import Dict, List, Any, Iterable, Optional
+
+from .catalog import CACHE_DIR
+from .loader import TestStream, list_available_tests
+
+SEARCH_INDEX_FILE = os.path.join(CACHE_DIR, 'search.db')
+SEARCH_INDEX_VERSION = 3
+
+# Параметры ранжирования BM25
+BM25_K1 = 1.2
+BM25_B = 0.75
+# Вес вхождения слова в зависимости от поля вопроса
+FIELD_WEIGHTS = {'question': 2, 'options': 1, 'answer': 1, 'aliases': 1, 'tags': 1}
+# Наименьшая длина основы слова после отбрасывания окончания
+MIN_STEM_LENGTH = 3
+
+_WORD = re.compile(r'[^\W_]+')
+_CYRILLIC = re.compile(r'[а-я]')
+# Последний слог основы с беглой гласной: корен(ь) - корн(я), отец - отц(а)
+_FLEETING_VOWEL = re.compile(r'[ео]([нкцл])$')
+
+STOP_WORDS = frozenset((
+    'и', 'в', 'во', 'на', 'с', 'со', 'по', 'к', 'ко', 'о', 'об', 'от', 'до', 'из', 'за',
+    'у', 'не', 'ли', 'же', 'а', 'но', 'что', 'как', 'это', 'для', 'или',
+    'a', 'an', 'the', 'of', 'to', 'in', 'on', 'at', 'is', 'are', 'and', 'or', 'for', 'by', 'with'
+))
+# Отбрасывается одно окончание, самое длинное из подходящих
+RUSSIAN_ENDINGS = frozenset((
+    'иями', 'ями', 'ами', 'ого', 'его', 'ому', 'ему', 'ыми', 'ими', 'ией',
+    'ать', 'ять', 'ить', 'еть', 'ует', 'ает', 'яет', 'ешь', 'ишь', 'ете', 'ите',
+    'ов', 'ев', 'ей', 'ий', 'ый', 'ой', 'ая', 'яя', 'ое', 'ее', 'ые', 'ие', 'ую', 'юю',
+    'ых', 'их', 'ым', 'им', 'ом', 'ем', 'ам', 'ям', 'ах', 'ях', 'ия', 'ию', 'ии',
+    'ье', 'ья', 'ью', 'ть', 'ет', 'ит', 'ут', 'ют', 'ат', 'ят', 'ла', 'ло', 'ли',
+    'а', 'я', 'о', 'е', 'ы', 'и', 'у', 'ю', 'ь', 'й'
+))
+ENGLISH_ENDINGS = ('ations', 'ation', 'ings', 'ing', 'ies', 'ied', 'es', 'ed', 'ly', 's')
+
+
+@functools.lru_cache(maxsize=65536)
+def stem(word: str) -> str:
+    """Отбрасывает окончание русского или английского слова.
+
+    Args:
+        word: Слово в нижнем регистре.
+
+    Returns:
+        Основа слова. Числа и слова других языков не изменяются.
+            У русских основ беглая гласная последнего слога (-ен, -ок,
+            -ек, -ец, -ел) отбрасывается, поэтому корень и корня дают
+            одну основу.
+
+    Note:
+        Словарь тестов невелик, а слова повторяются, поэтому результаты
+        кэшируются: индексирование большого теста почти не тратит время
+        на стемминг.
+    """
+    if _CYRILLIC.search(word):
+        if word.endswith(('ся', 'сь')) and len(word) - 2 >= MIN_STEM_LENGTH:
+            word = word[:-2]
+        for length in range(min(4, len(word) - MIN_STEM_LENGTH), 0, -1):
+            if word[-length:] in RUSSIAN_ENDINGS:
+                word = word[:-length]
+                break
+        # Гласная убирается из всех основ, а не только из форм с беглой
+        # гласной, поэтому урок и урока тоже дают одну основу
+        if len(word) > MIN_STEM_LENGTH:
+            word = _FLEETING_VOWEL.sub(r'\1', word)
+        return word
+    if word.isascii() and word.isalpha():
+        for ending in ENGLISH_ENDINGS:
+            if word.endswith(ending) and len(word) - len(ending) >= MIN_STEM_LENGTH:
+                if ending in ('ies', 'ied'):
+                    return word[:-3] + 'y'
+                # Окончание 's' не отбрасывается после 's' (class, process)
+                if ending == 's' and word.endswith('ss'):
+                    return word
+                return word[:-len(ending)]
+    return word
+
+
+def tokenize(text: str) -> List[str]:
+    """Разбивает текст на нормализованные основы слов.
+
+    Args:
+        text: Исходный текст.
+
+    Returns:
+        Список основ слов без служебных слов.
+
+    Example:
+        >>> tokenize('Чему равен квадратный корень из 16?')
+        ['чем', 'равн', 'квадратн', 'корн', '16']
+    """
+    text = unicodedata.normalize('NFKC', text).casefold().replace('ё', 'е')
+    return [stem(word) for word in _WORD.findall(text) if word not in STOP_WORDS]
+
+
+def _question_terms(data: Dict[str, Any]) -> Dict[str, int]:
+    """Возвращает взвешенные частоты основ слов вопроса."""
+    frequencies = {}
+    for field, weight in FIELD_WEIGHTS.items():
+        value = data.get(field)
+        if value is None:
+            continue
+        values = value if isinstance(value, list) else [value]
+        for item in values:
+            for term in tokenize(str(item)):
+                frequencies[term] = frequencies.get(term, 0) + weight
+    return frequencies
+
+
+class SearchIndex:
+    """Инвертированный индекс по вопросам тестов.
+
+    Документ индекса - один вопрос теста. Для каждой основы слова и файла
+    хранится одна запись - упакованный список пар (номер вопроса,
+    взвешенная частота), поэтому индексирование большого теста - это
+    несколько тысяч вставок, а не миллион, а запрос читает по одной
+    записи на файл.
+
+    Attributes:
+        index_path (str): Путь к файлу базы индекса.
+
+    Example:
+        >>> index = SearchIndex()
+        >>> index.update()
+        >>> for hit in index.search('квадратный корень'):
+        ...     print(hit['test'], hit['question'])
+    """
+
+    def __init__(self, index_path: str = SEARCH_INDEX_FILE):
+        """Открывает индекс, при необходимости создавая базу.
+
+        Args:
+            index_path: Путь к файлу базы индекса.
+        """
+        self.index_path = index_path
+        os.makedirs(os.path.dirname(index_path) or '.', exist_ok=True)
+        self._connection = sqlite3.connect(index_path)
+        self._lengths = {}
+        self._create_schema()
+
+    def _create_schema(self) -> None:
+        """Создает таблицы индекса; индекс другой версии строится заново."""
+        connection = self._connection
+        version = connection.execute('PRAGMA user_version').fetchone()[0]
+        if version != SEARCH_INDEX_VERSION:
+            with connection:
+                for table in ('postings', 'docs', 'terms', 'files'):
+                    connection.execute(f'DROP TABLE IF EXISTS {table}')
+        with connection:
+            connection.executescript(f"""
+                CREATE TABLE IF NOT EXISTS files (
+                    id INTEGER PRIMARY KEY, path TEXT UNIQUE NOT NULL,
+                    mtime_ns INTEGER, size INTEGER, title TEXT, error TEXT,
+                    questions INTEGER DEFAULT 0, length INTEGER DEFAULT 0, lengths BLOB);
+                CREATE TABLE IF NOT EXISTS docs (
+                    file_id INTEGER, question INTEGER, text TEXT,
+                    PRIMARY KEY (file_id, question)) WITHOUT ROWID;
+                CREATE TABLE IF NOT EXISTS terms (
+                    id INTEGER PRIMARY KEY, term TEXT UNIQUE NOT NULL);
+                CREATE TABLE IF NOT EXISTS postings (
+                    term_id INTEGER, file_id INTEGER, data BLOB,
+                    PRIMARY KEY (term_id, file_id)) WITHOUT ROWID;
+                CREATE INDEX IF NOT EXISTS postings_file ON postings (file_id);
+                PRAGMA user_version = {SEARCH_INDEX_VERSION};
+            """)
+
+    def close(self) -> None:
+        """Закрывает базу индекса."""
+        self._connection.close()
+
+    def __enter__(self) -> 'SearchIndex':
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def update(self, test_paths: Optional[List[str]] = None) -> Dict[str, int]:
+        """Обновляет индекс для изменившихся файлов.
+
+        Args:
+            test_paths: Пути к файлам тестов. Если None, используются все
+                тесты, найденные list_available_tests, а записи
+                об отсутствующих файлах удаляются.
+
+        Returns:
+            Словарь с количествами files (всего), indexed (переиндексировано),
+            removed (удалено из индекса) и errors (не удалось прочитать).
+        """
+        prune = test_paths is None
+        if test_paths is None:
+            test_paths = list_available_tests()
+
+        connection = self._connection
+        known = {path: (file_id, mtime_ns, size) for file_id, path, mtime_ns, size
+                 in connection.execute('SELECT id, path, mtime_ns, size FROM files')}
+        stats = {'files': 0, 'indexed': 0, 'removed': 0, 'errors': 0}
+        seen = set()
+
+        with connection:
+            for test_path in test_paths:
+                key = os.path.abspath(test_path)
+                try:
+                    stat = os.stat(test_path)
+                except OSError:
+                    continue
+                seen.add(key)
+                stats['files'] += 1
+                entry = known.get(key)
+                if entry is not None and entry[1:] == (stat.st_mtime_ns, stat.st_size):
+                    continue
+
+                if entry is not None:
+                    self._remove_file(entry[0])
+                if not self._index_file(test_path, key, stat):
+                    stats['errors'] += 1
+                stats['indexed'] += 1
+
+            if prune:
+                for key, entry in known.items():
+                    if key not in seen:
+                        self._remove_file(entry[0])
+                        connection.execute('DELETE FROM files WHERE id = ?', (entry[0],))
+                        stats['removed'] += 1
+
+        if stats['indexed'] or stats['removed']:
+            self._lengths.clear()
+        return stats
+
+    def _remove_file(self, file_id: int) -> None:
+        """Удаляет вопросы файла из индекса (запись о файле остается)."""
+        self._connection.execute('DELETE FROM postings WHERE file_id = ?', (file_id,))
+        self._connection.execute('DELETE FROM docs WHERE file_id = ?', (file_id,))
+
+    def _index_file(self, test_path: str, key: str, stat: os.stat_result) -> bool:
+        """Индексирует вопросы файла.
+
+        Returns:
+            True, если файл прочитан без ошибок.
+        """
+        connection = self._connection
+        connection.execute(
+            'INSERT INTO files (path, mtime_ns, size) VALUES (?, ?, ?) '
+            'ON CONFLICT (path) DO UPDATE SET mtime_ns = excluded.mtime_ns, size = excluded.size',
+            (key, stat.st_mtime_ns, stat.st_size))
+        file_id = connection.execute('SELECT id FROM files WHERE path = ?', (key,)).fetchone()[0]
+
+        docs, lengths, postings = [], array('I'), {}
+        try:
+            stream = TestStream(test_path)
+            for index, data in enumerate(stream.iter_dicts()):
+                frequencies = _question_terms(data)
+                docs.append((file_id, index, str(data.get('question', ''))))
+                lengths.append(sum(frequencies.values()))
+                for term, frequency in frequencies.items():
+                    entries = postings.get(term)
+                    if entries is None:
+                        entries = postings[term] = array('I')
+                    entries.append(index)
+                    entries.append(frequency)
+            title, error = stream.title, None
+        except (OSError, ValueError) as e:
+            title, error = None, str(e)
+
+        connection.executemany('INSERT INTO docs VALUES (?, ?, ?)', docs)
+        connection.executemany('INSERT INTO postings VALUES (?, ?, ?)', (
+            (self._term_id(term), file_id, entries.tobytes()) for term, entries in postings.items()))
+        connection.execute(
+            'UPDATE files SET title = ?, error = ?, questions = ?, length = ?, lengths = ? WHERE id = ?',
+            (title, error, len(lengths), sum(lengths), lengths.tobytes(), file_id))
+        return error is None
+
+    def _term_id(self, term: str) -> int:
+        """Возвращает номер основы слова, добавляя ее в словарь индекса."""
+        row = self._connection.execute('SELECT id FROM terms WHERE term = ?', (term,)).fetchone()
+        if row is not None:
+            return row[0]
+        return self._connection.execute('INSERT INTO terms (term) VALUES (?)', (term,)).lastrowid
+
+    def _file_lengths(self, file_id: int) -> array:
+        """Возвращает длины вопросов файла (с кэшированием)."""
+        lengths = self._lengths.get(file_id)
+        if lengths is None:
+            lengths = array('I')
+            lengths.frombytes(self._connection.execute(
+                'SELECT lengths FROM files WHERE id = ?', (file_id,)).fetchone()[0] or b'')
+            self._lengths[file_id] = lengths
+        return lengths
+
+    def search(self, query: str, limit: int = 10) -> List[Dict[str, Any]]:
+        """Ищет вопросы по запросу.
+
+        Args:
+            query: Текст запроса (слова в любой форме).
+            limit: Наибольшее количество результатов.
+
+        Returns:
+            Список результатов по убыванию релевантности: сначала вопросы,
+            содержащие больше слов запроса, при равенстве - по оценке BM25.
+            Результат - словарь с полями test, title, index (номер вопроса
+            с нуля), question, score и matched (сколько слов запроса найдено).
+        """
+        terms = list(dict.fromkeys(tokenize(query)))
+        connection = self._connection
+        documents, total_length = connection.execute(
+            'SELECT COALESCE(SUM(questions), 0), COALESCE(SUM(length), 0) FROM files').fetchone()
+        if not terms or not documents:
+            return []
+        average_length = total_length / documents
+
+        scores, matched = {}, {}
+        for term in terms:
+            rows = connection.execute(
+                'SELECT p.file_id, p.data FROM postings p JOIN terms t ON t.id = p.term_id '
+                'WHERE t.term = ?', (term,)).fetchall()
+            if not rows:
+                continue
+            lists = []
+            for file_id, data in rows:
+                entries = array('I')
+                entries.frombytes(data)
+                lists.append((file_id, entries))
+            frequency_in_documents = sum(len(entries) for _, entries in lists) // 2
+            idf = math.log(1 + (documents - frequency_in_documents + 0.5) / (frequency_in_documents + 0.5))
+
+            for file_id, entries in lists:
+                lengths = self._file_lengths(file_id)
+                for position in range(0, len(entries), 2):
+                    question, frequency = entries[position], entries[position + 1]
+                    norm = BM25_K1 * (1 - BM25_B + BM25_B * lengths[question] / average_length)
+                    key = (file_id, question)
+                    scores[key] = scores.get(key, 0.0) + idf * frequency * (BM25_K1 + 1) / (frequency + norm)
+                    matched[key] = matched.get(key, 0) + 1
+
+        best = heapq.nlargest(limit, scores.items(), key=lambda item: (matched[item[0]], item[1]))
+        results = []
+        for (file_id, question), score in best:
+            path, title = connection.execute('SELECT path, title FROM files WHERE id = ?',
+                                             (file_id,)).fetchone()
+            text = connection.execute('SELECT text FROM docs WHERE file_id = ? AND question = ?',
+                                      (file_id, question)).fetchone()[0]
+            results.append({
+                'test': os.path.relpath(path),
+                'title': title,
+                'index': question,
+                'question': text,
+                'score': score,
+                'matched': matched[(file_id, question)]
+            })
+        return results
+
+
+def search_questions(query: str, limit: int = 10,
+                     test_paths: Optional[Iterable[str]] = None) -> List[Dict[str, Any]]:
+    """Обновляет индекс и ищет вопросы по запросу.
+
+    Args:
+        query: Текст запроса.
+        limit: Наибольшее количество результатов.
+        test_paths: Пути к файлам тестов (по умолчанию все тесты).
+
+    Returns:
+        Результаты SearchIndex.search.
+    """
+    with SearchIndex() as index:
+        index.update(list(test_paths) if test_paths is not None else None)
+        return index.search(query, limit)
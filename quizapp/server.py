@@ -0,0 +1,405 @@
+"""
+Модуль HTTP сервера для проведения тестирования.
+
+Сервер построен только на asyncio из стандартной библиотеки и отдает
+JSON. Каталог тестов читается один раз при запуске, а загруженные тесты
+хранятся в памяти, поэтому запросы не разбирают файлы тестов повторно.
+Тест загружается в пуле потоков, чтобы разбор большого файла не
+останавливал обслуживание других соединений.
+Каждое прохождение теста - это QuizSession над общим QuestionBank.
+
+Точки доступа:
+    GET    /tests                      Список доступных тестов
+    POST   /sessions                   Начать прохождение: {"test": путь, "count": N,
+                                       "user": имя}
+    GET    /sessions/<id>/question     Текущий вопрос
+    POST   /sessions/<id>/answer       Ответить: {"answer": "2"}
+    GET    /sessions/<id>/result       Результат прохождения
+    DELETE /sessions/<id>              Завершить сессию
+    GET    /stats                      Текущая статистика ответов по тестам
+
+Количество одновременных соединений и сессий ограничено: при превышении
+сервер отвечает 503, а запись ответа ожидает освобождения буфера сокета
+(writer.drain), чтобы медленные клиенты не накапливали данные в памяти.
+
+Ответы записываются в журнал попыток (quizapp.attempts), буфер которого
+сбрасывается на диск раз в секунду. Статистика по каждому тесту
+обновляется при каждом ответе (StatisticsAccumulator), поэтому /stats
+не перечитывает историю.
+"""
+import asyncio
+import json
+import random
+import secrets
+import signal
+import time
+from collections import OrderedDict
+from typing import Dict, Any, Optional, Tuple
+
+from .catalog import TestCatalog
+from .loader import load_bank
+from .question import QuestionBank
+from .session import QuizSession
+from .results import StatisticsAccumulator
+from .attempts import AttemptLog, get_attempt_log, new_attempt_id
+
+# Ограничения сервера по умолчанию
+MAX_CONNECTIONS = 1024
+MAX_SESSIONS = 100000
+SESSION_TTL = 3600
+LOG_FLUSH_INTERVAL = 1.0
+MAX_HEADER_SIZE = 8 * 1024
+MAX_BODY_SIZE = 64 * 1024
+
+_REASONS = {
+    200: 'OK', 201: 'Created', 400: 'Bad Request', 404: 'Not Found',
+    405: 'Method Not Allowed', 413: 'Payload Too Large', 500: 'Internal Server Error',
+    503: 'Service Unavailable'
+}
+
+
+class HTTPError(Exception):
+    """Ошибка обработки запроса с HTTP статусом."""
+
+    def __init__(self, status: int, message: str):
+        super().__init__(message)
+        self.status = status
+
+
+class QuizServer:
+    """Асинхронный HTTP сервер тестирования.
+
+    Attributes:
+        host (str): Адрес для прослушивания.
+        port (int): Порт для прослушивания.
+        tests (Dict[str, Dict]): Сведения о доступных тестах из каталога.
+        sessions (OrderedDict): Активные сессии по идентификатору
+            (в порядке последнего обращения).
+
+    Example:
+        >>> server = QuizServer(port=8080)
+        >>> asyncio.run(server.serve_forever())
+    """
+
+    def __init__(self, host: str = '127.0.0.1', port: int = 8080,
+                 max_connections: int = MAX_CONNECTIONS,
+                 max_sessions: int = MAX_SESSIONS,
+                 session_ttl: float = SESSION_TTL,
+                 attempt_log: Optional[AttemptLog] = None):
+        """Инициализирует сервер и читает каталог тестов.
+
+        Args:
+            host: Адрес для прослушивания.
+            port: Порт для прослушивания.
+            max_connections: Максимальное число одновременных соединений.
+            max_sessions: Максимальное число активных сессий.
+            session_ttl: Время в секундах, после которого неактивная
+                сессия удаляется.
+            attempt_log: Журнал попыток. Если None, ответы не журналируются.
+        """
+        self.host = host
+        self.port = port
+        self.max_connections = max_connections
+        self.max_sessions = max_sessions
+        self.session_ttl = session_ttl
+        self.attempt_log = attempt_log
+        self.sessions = OrderedDict()
+        self.tests = {}
+        self.statistics = {}
+        self._banks = {}
+        # Загрузки тестов, которые еще выполняются в пуле потоков
+        self._loading = {}
+        self._connections = 0
+
+        for test_path, info in TestCatalog().refresh():
+            if not isinstance(info, Exception):
+                self.tests[test_path] = info
+
+    async def get_bank(self, test_path: str) -> QuestionBank:
+        """Возвращает загруженный тест, загружая его при первом обращении.
+
+        Тест загружается в пуле потоков; одновременные запросы к еще
+        не загруженному тесту ожидают одну и ту же загрузку.
+
+        Args:
+            test_path: Путь к тесту из каталога.
+
+        Raises:
+            HTTPError: Если тест не найден в каталоге.
+        """
+        if test_path not in self.tests:
+            raise HTTPError(404, f"Тест не найден: {test_path}")
+        bank = self._banks.get(test_path)
+        if bank is None:
+            future = self._loading.get(test_path)
+            if future is None:
+                future = self._loading[test_path] = asyncio.get_running_loop().run_in_executor(
+                    None, load_bank, test_path)
+            try:
+                bank = await future
+            finally:
+                self._loading.pop(test_path, None)
+            self._banks[test_path] = bank
+        return bank
+
+    def _get_session(self, session_id: str) -> list:
+        """Возвращает запись сессии и отмечает обращение к ней.
+
+        Returns:
+            Список [сессия, время обращения, путь к тесту, пользователь,
+            идентификатор попытки].
+        """
+        entry = self.sessions.get(session_id)
+        if entry is None:
+            raise HTTPError(404, "Сессия не найдена")
+        self.sessions.move_to_end(session_id)
+        entry[1] = time.monotonic()
+        return entry
+
+    def _expire_sessions(self) -> None:
+        """Удаляет сессии, к которым давно не обращались."""
+        deadline = time.monotonic() - self.session_ttl
+        while self.sessions:
+            session_id, entry = next(iter(self.sessions.items()))
+            if entry[1] >= deadline:
+                break
+            del self.sessions[session_id]
+
+    async def dispatch(self, method: str, path: str, body: Optional[Dict[str, Any]]) -> Tuple[int, Any]:
+        """Выполняет запрос к API.
+
+        Args:
+            method: HTTP метод.
+            path: Путь запроса без строки параметров.
+            body: Разобранное JSON тело запроса или None.
+
+        Returns:
+            Кортеж (HTTP статус, данные ответа).
+
+        Raises:
+            HTTPError: При некорректном запросе.
+        """
+        parts = [part for part in path.split('/') if part]
+
+        if parts == ['tests'] and method == 'GET':
+            return 200, [{'test': test_path, 'title': info['title'],
+                          'questions_count': info['questions_count']}
+                         for test_path, info in self.tests.items()]
+
+        if parts == ['stats'] and method == 'GET':
+            return 200, {test_path: accumulator.to_dict()
+                         for test_path, accumulator in self.statistics.items()}
+
+        if parts == ['sessions'] and method == 'POST':
+            return await self._start_session(body or {})
+
+        if len(parts) >= 2 and parts[0] == 'sessions':
+            session_id = parts[1]
+            action = parts[2] if len(parts) == 3 else None
+
+            if action is None and method == 'DELETE':
+                if self.sessions.pop(session_id, None) is None:
+                    raise HTTPError(404, "Сессия не найдена")
+                return 200, {'deleted': session_id}
+
+            entry = self._get_session(session_id)
+            session = entry[0]
+            if action == 'question' and method == 'GET':
+                question = session.next_question()
+                if question is None:
+                    return 200, {'finished': True}
+                return 200, {
+                    'finished': False,
+                    'number': session.position,
+                    'total': session.total,
+                    'question': question.text,
+                    'options': question.options
+                }
+            if action == 'answer' and method == 'POST':
+                answer = (body or {}).get('answer')
+                if not isinstance(answer, str) or not answer.strip():
+                    raise HTTPError(400, "Поле answer должно быть непустой строкой")
+                question = session.next_question()
+                if question is None:
+                    raise HTTPError(400, "Тест уже завершен")
+                is_correct = session.submit(answer.strip())
+                if self.attempt_log is not None:
+                    self.attempt_log.record(entry[2], entry[3], entry[4],
+                                            question, answer.strip(), is_correct)
+                self._update_statistics(entry[2], session, question, is_correct)
+                return 200, {'correct': is_correct, 'correct_answer': question.answer}
+            if action == 'result' and method == 'GET':
+                score, total, user_answers = session.result()
+                return 200, {
+                    'score': score,
+                    'total': total,
+                    'percentage': (score / total) * 100 if total > 0 else 0,
+                    'answers': user_answers
+                }
+            raise HTTPError(405, "Метод не поддерживается")
+
+        raise HTTPError(404, "Неизвестный путь")
+
+    def _update_statistics(self, test_path: str, session: QuizSession,
+                           question: Any, is_correct: bool) -> None:
+        """Учитывает ответ (и завершение прохождения) в статистике теста."""
+        accumulator = self.statistics.get(test_path)
+        if accumulator is None:
+            accumulator = self.statistics[test_path] = StatisticsAccumulator()
+        accumulator.add_answer({
+            'is_correct': is_correct,
+            'type': 'multiple_choice' if question.options is not None else 'text'
+        })
+        if session.finished:
+            accumulator.add_attempt(session.score, session.total)
+
+    async def _start_session(self, body: Dict[str, Any]) -> Tuple[int, Any]:
+        """Создает сессию прохождения теста."""
+        self._expire_sessions()
+        if len(self.sessions) >= self.max_sessions:
+            raise HTTPError(503, "Достигнуто максимальное количество сессий")
+
+        test_path = str(body.get('test', ''))
+        bank = await self.get_bank(test_path)
+        count = body.get('count')
+        if count is None:
+            session = QuizSession.from_bank(bank)
+        elif isinstance(count, int) and count > 0:
+            indices = random.sample(range(len(bank)), min(count, len(bank)))
+            session = QuizSession.from_bank(bank, indices)
+        else:
+            raise HTTPError(400, "Поле count должно быть положительным числом")
+
+        session_id = secrets.token_urlsafe(12)
+        user = str(body.get('user') or 'anonymous')
+        self.sessions[session_id] = [session, time.monotonic(), test_path, user, new_attempt_id()]
+        return 201, {'session': session_id, 'title': session.title, 'total': session.total}
+
+    async def handle_connection(self, reader: asyncio.StreamReader,
+                                writer: asyncio.StreamWriter) -> None:
+        """Обслуживает одно соединение (HTTP/1.1 с keep-alive)."""
+        if self._connections >= self.max_connections:
+            await self._write_response(writer, 503, {'error': "Сервер перегружен"}, False)
+            writer.close()
+            return
+
+        self._connections += 1
+        try:
+            keep_alive = True
+            while keep_alive:
+                try:
+                    head = await reader.readuntil(b'\r\n\r\n')
+                except asyncio.IncompleteReadError:
+                    break
+                except asyncio.LimitOverrunError:
+                    await self._write_response(writer, 413, {'error': "Слишком большой заголовок"}, False)
+                    break
+
+                lines = head.decode('latin-1').split('\r\n')
+                try:
+                    method, target, version = lines[0].split(' ', 2)
+                except ValueError:
+                    await self._write_response(writer, 400, {'error': "Некорректный запрос"}, False)
+                    break
+
+                headers = {}
+                for line in lines[1:]:
+                    name, _, value = line.partition(':')
+                    if name:
+                        headers[name.strip().lower()] = value.strip()
+
+                connection = headers.get('connection', '').lower()
+                keep_alive = connection != 'close' and (version == 'HTTP/1.1' or connection == 'keep-alive')
+
+                # int() принимает знак, пробелы и подчеркивания, поэтому
+                # значение проверяется как строка из цифр
+                length = headers.get('content-length', '0')
+                if not (length.isascii() and length.isdigit()):
+                    await self._write_response(
+                        writer, 400, {'error': "Некорректный заголовок Content-Length"}, False)
+                    break
+                length = int(length)
+
+                try:
+                    if length > MAX_BODY_SIZE:
+                        raise HTTPError(413, "Слишком большое тело запроса")
+                    raw_body = await reader.readexactly(length) if length else b''
+                    try:
+                        body = json.loads(raw_body) if raw_body else None
+                    except ValueError:
+                        raise HTTPError(400, "Некорректный JSON")
+                    if body is not None and not isinstance(body, dict):
+                        raise HTTPError(400, "Тело запроса должно быть JSON объектом")
+                    status, data = await self.dispatch(method, target.split('?', 1)[0], body)
+                except HTTPError as e:
+                    status, data = e.status, {'error': str(e)}
+                    if e.status == 413:
+                        keep_alive = False
+                except asyncio.IncompleteReadError:
+                    break
+                except Exception as e:
+                    status, data = 500, {'error': f"Внутренняя ошибка: {e}"}
+
+                await self._write_response(writer, status, data, keep_alive)
+        except (ConnectionError, asyncio.CancelledError):
+            pass
+        finally:
+            self._connections -= 1
+            writer.close()
+
+    @staticmethod
+    async def _write_response(writer: asyncio.StreamWriter, status: int,
+                              data: Any, keep_alive: bool) -> None:
+        """Отправляет JSON ответ и ожидает освобождения буфера сокета."""
+        payload = json.dumps(data, ensure_ascii=False).encode('utf-8')
+        head = (f"HTTP/1.1 {status} {_REASONS.get(status, 'Error')}\r\n"
+                f"Content-Type: application/json; charset=utf-8\r\n"
+                f"Content-Length: {len(payload)}\r\n"
+                f"Connection: {'keep-alive' if keep_alive else 'close'}\r\n\r\n")
+        writer.write(head.encode('latin-1') + payload)
+        await writer.drain()
+
+    async def serve_forever(self) -> None:
+        """Запускает сервер и обслуживает соединения до остановки."""
+        server = await asyncio.start_server(self.handle_connection, self.host, self.port,
+                                            limit=MAX_HEADER_SIZE,
+                                            backlog=self.max_connections)
+        flush_task = asyncio.ensure_future(self._flush_log_periodically())
+        try:
+            # При SIGTERM сервер останавливается штатно и сбрасывает журнал
+            asyncio.get_running_loop().add_signal_handler(
+                signal.SIGTERM, asyncio.current_task().cancel)
+        except (NotImplementedError, RuntimeError):
+            pass
+        try:
+            async with server:
+                await server.serve_forever()
+        finally:
+            flush_task.cancel()
+            if self.attempt_log is not None:
+                self.attempt_log.flush()
+
+    async def _flush_log_periodically(self) -> None:
+        """Периодически сбрасывает буфер журнала попыток на диск."""
+        while self.attempt_log is not None:
+            await asyncio.sleep(LOG_FLUSH_INTERVAL)
+            self.attempt_log.flush()
+
+
+def serve(host: str = '127.0.0.1', port: int = 8080, **options: Any) -> None:
+    """Запускает HTTP сервер тестирования.
+
+    Args:
+        host: Адрес для прослушивания.
+        port: Порт для прослушивания.
+        **options: Дополнительные параметры QuizServer
+            (max_connections, max_sessions, session_ttl, attempt_log).
+    """
+    options.setdefault('attempt_log', get_attempt_log())
+    server = QuizServer(host, port, **options)
+    print(f"Сервер тестирования запущен: http://{host}:{port} "
+          f"(тестов: {len(server.tests)})")
+    try:
+        asyncio.run(server.serve_forever())
+    except (KeyboardInterrupt, asyncio.CancelledError):
+        print("\nСервер остановлен.")
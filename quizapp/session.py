@@ -0,0 +1,146 @@
+"""
+Модуль сессии прохождения теста.
+
+QuizSession хранит состояние одного прохождения теста (текущий вопрос,
+счет, историю ответов) и не выполняет никакого ввода-вывода. Консольный
+интерфейс, пакетная проверка или веб-сервер лишь запрашивают очередной
+вопрос и передают ответ пользователя.
+
+Сессия ссылается на общий неизменяемый список вопросов и хранит только
+итератор по нему, поэтому один процесс может держать десятки тысяч
+одновременных сессий над одним загруженным тестом.
+"""
+from typing import Dict, List, Any, Iterable, Optional, Tuple
+
+from .question import Question, QuestionBank, as_question
+
+# Значение _peeked, когда вопросы закончились
+_END = object()
+
+
+class QuizSession:
+    """Состояние одного прохождения теста без ввода-вывода.
+
+    Attributes:
+        title (str): Название теста.
+        total (Optional[int]): Количество вопросов (None, если вопросы
+            поступают из итератора и количество заранее неизвестно).
+        position (int): Номер текущего (последнего выданного) вопроса.
+        score (int): Количество правильных ответов.
+
+    Example:
+        >>> session = QuizSession.from_bank(bank)
+        >>> question = session.next_question()
+        >>> session.submit('2')
+        True
+        >>> score, total, user_answers = session.result()
+    """
+    __slots__ = ('title', 'total', 'position', 'score', '_questions', '_current', '_peeked', '_answers')
+
+    def __init__(self, questions: Iterable[Question], title: str = 'Без названия'):
+        """Создает сессию.
+
+        Args:
+            questions: Вопросы теста: список (общий для всех сессий) или
+                итератор, например TestStream.
+            title: Название теста.
+        """
+        self.title = title
+        self.total = len(questions) if hasattr(questions, '__len__') else None
+        self.position = 0
+        self.score = 0
+        self._questions = iter(questions)
+        self._current = None
+        # Вопрос, прочитанный из итератора заранее (см. finished)
+        self._peeked = None
+        self._answers = []
+
+    @classmethod
+    def from_bank(cls, bank: QuestionBank, indices: Optional[Iterable[int]] = None) -> 'QuizSession':
+        """Создает сессию над загруженным тестом.
+
+        Args:
+            bank: Загруженный тест.
+            indices: Номера вопросов (с нуля) для этой сессии. Если None,
+                используются все вопросы теста по порядку.
+
+        Returns:
+            Новая сессия.
+        """
+        if indices is None:
+            return cls(bank.questions, bank.title)
+        return cls([bank.questions[i] for i in indices], bank.title)
+
+    @property
+    def finished(self) -> bool:
+        """True, если вопросов больше нет.
+
+        Не выдает следующий вопрос: position и текущий вопрос не меняются,
+        следующий вопрос лишь читается из итератора заранее.
+        """
+        if self._current is not None:
+            return False
+        if self._peeked is None:
+            self._peeked = next(self._questions, _END)
+        return self._peeked is _END
+
+    def next_question(self) -> Optional[Question]:
+        """Возвращает текущий вопрос.
+
+        Returns:
+            Вопрос, ожидающий ответа, или None, если вопросы закончились.
+
+        Note:
+            Повторный вызов до submit возвращает тот же вопрос.
+        """
+        if self._current is None:
+            if self._peeked is None:
+                question = next(self._questions, None)
+            else:
+                question = None if self._peeked is _END else self._peeked
+                self._peeked = None if question is not None else _END
+            if question is not None:
+                self._current = as_question(question)
+                self.position += 1
+        return self._current
+
+    def submit(self, answer: str) -> bool:
+        """Принимает ответ на текущий вопрос.
+
+        Args:
+            answer: Ответ пользователя.
+
+        Returns:
+            True если ответ правильный, иначе False.
+
+        Raises:
+            RuntimeError: Если нет вопроса, ожидающего ответа.
+        """
+        question = self.next_question()
+        if question is None:
+            raise RuntimeError("Нет вопроса, ожидающего ответа")
+
+        is_correct = question.check(answer)
+        if is_correct:
+            self.score += 1
+        self._answers.append((question, answer, is_correct))
+        self._current = None
+        return is_correct
+
+    def result(self) -> Tuple[int, int, List[Dict[str, Any]]]:
+        """Возвращает результат прохождения.
+
+        Returns:
+            Кортеж (количество правильных ответов, общее количество вопросов,
+            история ответов) в том же формате, что и QuizEngine.take_quiz.
+        """
+        user_answers = [{
+            'question': question.text,
+            'user_answer': answer,
+            'correct_answer': question.answer,
+            'is_correct': is_correct,
+            'type': 'multiple_choice' if question.options is not None else 'text'
+        } for question, answer, is_correct in self._answers]
+
+        total = self.total if self.total is not None else len(user_answers)
+        return self.score, total, user_answers
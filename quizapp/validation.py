@@ -0,0 +1,214 @@
+"""
+Модуль проверки файлов тестов.
+
+TestLoader проверяет только наличие полей title и questions, поэтому
+ошибки в отдельных вопросах обнаруживаются во время прохождения теста.
+Этот модуль проверяет тест целиком по полной схеме:
+
+    Тест:     объект с непустой строкой title, необязательной строкой
+              description и непустым списком questions
+    Вопрос:   объект с непустой строкой question и ответом answer
+              (строка или число); необязательные поля options - список
+              не менее чем из двух различных непустых строк, среди которых
+              ровно один совпадает с ответом, aliases - список строк,
+              tags - список непустых строк, difficulty - непустая строка
+              и weight - положительное число
+
+Ошибки делают тест непригодным для прохождения, предупреждения
+(неизвестные поля, пустое описание и т.п.) - нет. Файлы проверяются
+параллельно в пуле процессов, результат - отчет в формате JSON,
+пригодный для автоматической проверки при развертывании.
+"""
+import json
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List, Any, Optional, Tuple
+
+from .loader import list_available_tests
+from .question import Question
+
+TEST_FIELDS = {'title', 'description', 'questions'}
+QUESTION_FIELDS = {'question', 'options', 'answer', 'aliases', 'tags', 'difficulty', 'weight'}
+
+# Меньше файлов проверяется в текущем процессе без запуска пула
+MIN_FILES_FOR_POOL = 16
+
+
+def validate_test_data(test_data: Any) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]]]:
+    """Проверяет данные теста по схеме.
+
+    Args:
+        test_data: Данные теста, загруженные из JSON файла.
+
+    Returns:
+        Кортеж (ошибки, предупреждения). Каждая запись - словарь с полями
+        question (номер вопроса с единицы или None для теста целиком)
+        и message.
+    """
+    errors, warnings = [], []
+
+    def error(number, message):
+        errors.append({'question': number, 'message': message})
+
+    def warning(number, message):
+        warnings.append({'question': number, 'message': message})
+
+    if not isinstance(test_data, dict):
+        error(None, "Тест должен быть объектом JSON")
+        return errors, warnings
+
+    title = test_data.get('title')
+    if not isinstance(title, str) or not title.strip():
+        error(None, "Отсутствует или пусто поле title")
+    description = test_data.get('description')
+    if description is not None and not isinstance(description, str):
+        error(None, "Поле description должно быть строкой")
+    for field in sorted(set(test_data) - TEST_FIELDS):
+        warning(None, f"Неизвестное поле теста: {field}")
+
+    questions = test_data.get('questions')
+    if not isinstance(questions, list):
+        error(None, "Отсутствует поле questions или оно не является списком")
+        return errors, warnings
+    if not questions:
+        error(None, "Тест не содержит вопросов")
+
+    for number, data in enumerate(questions, 1):
+        if not isinstance(data, dict):
+            error(number, "Вопрос должен быть объектом JSON")
+            continue
+
+        text = data.get('question')
+        if not isinstance(text, str) or not text.strip():
+            error(number, "Отсутствует или пусто поле question")
+        for field in sorted(set(data) - QUESTION_FIELDS):
+            warning(number, f"Неизвестное поле вопроса: {field}")
+
+        answer = data.get('answer')
+        if isinstance(answer, bool) or not isinstance(answer, (str, int, float)):
+            error(number, "Отсутствует поле answer или оно не является строкой или числом")
+            continue
+        if not str(answer).strip():
+            error(number, "Пустой правильный ответ")
+            continue
+
+        aliases = data.get('aliases')
+        if aliases is not None and (not isinstance(aliases, list)
+                                    or not all(isinstance(alias, str) for alias in aliases)):
+            error(number, "Поле aliases должно быть списком строк")
+            continue
+
+        tags = data.get('tags')
+        if tags is not None and (not isinstance(tags, list)
+                                 or not all(isinstance(tag, str) and tag.strip() for tag in tags)):
+            error(number, "Поле tags должно быть списком непустых строк")
+            continue
+        difficulty = data.get('difficulty')
+        if difficulty is not None and (not isinstance(difficulty, str) or not difficulty.strip()):
+            error(number, "Поле difficulty должно быть непустой строкой")
+            continue
+        weight = data.get('weight')
+        if weight is not None and (isinstance(weight, bool) or not isinstance(weight, (int, float))
+                                   or not 0 < weight < float('inf')):
+            error(number, "Поле weight должно быть положительным числом")
+            continue
+
+        options = data.get('options')
+        if options is not None:
+            if not isinstance(options, list) or not all(isinstance(option, (str, int, float))
+                                                        and not isinstance(option, bool)
+                                                        for option in options):
+                error(number, "Поле options должно быть списком строк")
+                continue
+            if len(options) < 2:
+                error(number, "У вопроса с вариантами должно быть не менее двух вариантов")
+            if any(not str(option).strip() for option in options):
+                error(number, "Пустой вариант ответа")
+            normalized = [str(option).lower().strip() for option in options]
+            if len(set(normalized)) < len(normalized):
+                error(number, "Варианты ответа повторяются")
+
+        # Сопоставление ответа с вариантами выполняется так же, как при загрузке
+        if isinstance(text, str):
+            try:
+                question = Question.from_dict(data)
+            except ValueError as e:
+                error(number, str(e))
+            else:
+                if question.warning is not None:
+                    error(number, question.warning)
+
+    return errors, warnings
+
+
+def validate_file(file_path: str) -> Dict[str, Any]:
+    """Проверяет файл теста.
+
+    Args:
+        file_path: Путь к файлу теста.
+
+    Returns:
+        Словарь с полями test, valid, questions (количество вопросов или
+        None), errors и warnings.
+    """
+    result = {'test': file_path, 'valid': False, 'questions': None, 'errors': [], 'warnings': []}
+    try:
+        with open(file_path, 'r', encoding='utf-8') as file:
+            test_data = json.load(file)
+    except OSError as e:
+        result['errors'].append({'question': None, 'message': f"Ошибка чтения файла: {e}"})
+        return result
+    except (ValueError, UnicodeDecodeError) as e:
+        result['errors'].append({'question': None, 'message': f"Ошибка чтения JSON файла: {e}"})
+        return result
+
+    result['errors'], result['warnings'] = validate_test_data(test_data)
+    if isinstance(test_data, dict) and isinstance(test_data.get('questions'), list):
+        result['questions'] = len(test_data['questions'])
+    result['valid'] = not result['errors']
+    return result
+
+
+def validate_files(file_paths: Optional[List[str]] = None,
+                   workers: Optional[int] = None) -> Dict[str, Any]:
+    """Проверяет файлы тестов, распределяя работу по процессам.
+
+    Args:
+        file_paths: Пути к файлам тестов. По умолчанию все тесты,
+            найденные list_available_tests.
+        workers: Количество процессов. None - по числу ядер процессора,
+            1 - проверка в текущем процессе без пула.
+
+    Returns:
+        Отчет: словарь с полями files, valid, invalid, errors, warnings
+        (общие количества) и results - списком результатов validate_file
+        в порядке file_paths.
+
+    Example:
+        >>> report = validate_files()
+        >>> if report['invalid']:
+        ...     print(json.dumps(report, ensure_ascii=False))
+    """
+    if file_paths is None:
+        file_paths = list_available_tests()
+    if workers is None:
+        workers = os.cpu_count() or 1
+
+    if workers <= 1 or len(file_paths) < MIN_FILES_FOR_POOL:
+        results = [validate_file(file_path) for file_path in file_paths]
+    else:
+        # Файлы отправляются пачками, чтобы накладные расходы на передачу
+        # задач не превышали время проверки небольших файлов
+        chunk_size = max(1, len(file_paths) // (workers * 4))
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            results = list(executor.map(validate_file, file_paths, chunksize=chunk_size))
+
+    valid = sum(1 for result in results if result['valid'])
+    return {
+        'files': len(results),
+        'valid': valid,
+        'invalid': len(results) - valid,
+        'errors': sum(len(result['errors']) for result in results),
+        'warnings': sum(len(result['warnings']) for result in results),
+        'results': results
+    }
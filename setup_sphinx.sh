@@ -115,10 +115,25 @@ quizapp
    quizapp.engine
    quizapp.results
    quizapp.commands
+   quizapp.catalog
+   quizapp.question
+   quizapp.grading
+   quizapp.session
+   quizapp.server
+   quizapp.compiled
+   quizapp.attempts
+   quizapp.analysis
+   quizapp.dedup
+   quizapp.matching
+   quizapp.validation
+   quizapp.instrument
+   quizapp.render
+   quizapp.search
+   quizapp.sampling
 EOF
 
 # Создаем документацию для подмодулей
-for module in loader engine results commands; do
+for module in loader engine results commands catalog question grading session server compiled attempts analysis dedup matching validation instrument render search sampling; do
     cat > quizapp.$module.rst << EOF
 quizapp.$module
 ===============
@@ -0,0 +1,83 @@
+"""
+Тесты анализа вопросов по журналу попыток (quizapp.analysis).
+"""
+import statistics
+
+import pytest
+
+pytest.importorskip('numpy')
+
+from quizapp.analysis import ResponseMatrix, analyze_items, problem_items  # noqa: E402
+from quizapp.question import QuestionBank  # noqa: E402
+
+BANK = QuestionBank.from_dict({'title': 'Тест', 'questions': [
+    {'question': 'Первая буква?', 'options': ['a', 'b', 'c'], 'answer': 'a'},
+    {'question': 'Столица Франции?', 'answer': 'Париж'},
+    {'question': '2 + 2?', 'answer': '4'},
+]})
+
+# Правильность ответов на три вопроса и выбранный вариант первого вопроса
+ATTEMPTS = {
+    'a1': ((True, True, True), 0),
+    'a2': ((True, True, False), 0),
+    'a3': ((False, False, True), 1),
+    'a4': ((False, False, False), 2),
+}
+
+
+def make_records():
+    records = []
+    for attempt, (answers, choice) in ATTEMPTS.items():
+        for index, is_correct in enumerate(answers):
+            records.append({'attempt': attempt, 'question': BANK[index].text, 'is_correct': is_correct,
+                            'choice': choice if index == 0 else None})
+    records.append({'attempt': 'a1', 'question': 'Удаленный вопрос?', 'is_correct': True})
+    return records
+
+
+def rest_correlation(index):
+    """Корреляция ответа на вопрос с долей правильных ответов на остальные."""
+    x = [float(answers[index]) for answers, _ in ATTEMPTS.values()]
+    y = [sum(answers[:index] + answers[index + 1:]) / (len(answers) - 1) for answers, _ in ATTEMPTS.values()]
+    return statistics.correlation(x, y)
+
+
+def test_response_matrix():
+    matrix = ResponseMatrix.from_attempts(BANK, make_records())
+    assert (matrix.attempts_count, matrix.questions_count, matrix.skipped) == (4, 3, 1)
+    assert len(matrix.rows) == 12
+    assert matrix.correct.sum() == 6
+
+
+def test_analyze_items():
+    analysis = analyze_items(BANK, ResponseMatrix.from_attempts(BANK, make_records()))
+    assert (analysis['attempts'], analysis['responses'], analysis['skipped']) == (4, 12, 1)
+
+    items = analysis['items']
+    assert [item['p_value'] for item in items] == [0.5, 0.5, 0.5]
+    for index, item in enumerate(items):
+        assert item['discrimination'] == pytest.approx(rest_correlation(index), abs=1e-9)
+    assert items[0]['discrimination'] == pytest.approx(2 ** -0.5)
+    assert items[2]['discrimination'] == pytest.approx(0.0, abs=1e-9)
+
+    assert [(option['option'], option['count'], option['share'], option['is_correct'])
+            for option in items[0]['options']] == [('a', 2, 0.5, True), ('b', 1, 0.25, False),
+                                                   ('c', 1, 0.25, False)]
+    assert 'options' not in items[1]
+
+
+def test_problem_items():
+    analysis = analyze_items(BANK, ResponseMatrix.from_attempts(BANK, make_records()))
+    assert [item['question'] for item in problem_items(analysis)] == ['2 + 2?']
+
+    # Неправильный вариант выбирают чаще правильного
+    records = make_records() + [{'attempt': 'a5', 'question': BANK[0].text, 'is_correct': False, 'choice': 1},
+                                {'attempt': 'a6', 'question': BANK[0].text, 'is_correct': False, 'choice': 1}]
+    analysis = analyze_items(BANK, ResponseMatrix.from_attempts(BANK, records))
+    assert 'Первая буква?' in [item['question'] for item in problem_items(analysis)]
+
+
+def test_empty_log():
+    analysis = analyze_items(BANK, ResponseMatrix.from_attempts(BANK, []))
+    assert analysis['responses'] == 0
+    assert all(item['p_value'] is None and item['discrimination'] is None for item in analysis['items'])
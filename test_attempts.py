@@ -0,0 +1,74 @@
+"""
+Тесты журнала попыток (quizapp.attempts).
+"""
+import json
+
+import pytest
+
+from quizapp.attempts import AttemptLog, iter_attempts, list_segments
+from quizapp.question import Question
+
+TEXT_QUESTION = Question.from_dict({'question': 'Сколько будет 2 + 2?', 'answer': '4'})
+CHOICE_QUESTION = Question.from_dict({'question': 'Выберите 3', 'options': ['1', '2', '3'], 'correct': 2})
+
+
+def read_lines(directory):
+    return [json.loads(line) for segment in list_segments(str(directory))
+            for line in open(segment, encoding='utf-8')]
+
+
+def test_records_are_buffered_until_batch_is_full(tmp_path):
+    log = AttemptLog(str(tmp_path / 'log'), batch_size=3)
+    log.record('a.json', 'ivan', 'a1', TEXT_QUESTION, '4', True)
+    log.record('a.json', 'ivan', 'a1', CHOICE_QUESTION, '3', True)
+    assert read_lines(tmp_path / 'log') == []
+
+    log.record('a.json', 'ivan', 'a1', CHOICE_QUESTION, '7', False)
+    records = read_lines(tmp_path / 'log')
+    assert [record['user_answer'] for record in records] == ['4', '3', '7']
+    assert [record['choice'] for record in records] == [None, 2, None]
+    assert [record['type'] for record in records] == ['text', 'multiple_choice', 'multiple_choice']
+
+    log.record('a.json', 'ivan', 'a1', TEXT_QUESTION, '5', False)
+    with log:
+        pass
+    assert len(read_lines(tmp_path / 'log')) == 4
+
+
+def test_segments_rotate_by_size(tmp_path):
+    with AttemptLog(str(tmp_path), batch_size=1, max_segment_bytes=1) as log:
+        for _ in range(3):
+            log.record('a.json', 'ivan', 'a1', TEXT_QUESTION, '4', True)
+    assert len(list_segments(str(tmp_path))) == 3
+    assert len(list(iter_attempts(str(tmp_path)))) == 3
+
+
+@pytest.fixture
+def journal(tmp_path, monkeypatch):
+    times = iter([100.0, 200.0, 300.0, 400.0])
+    monkeypatch.setattr('quizapp.attempts.time.time', lambda: next(times))
+    with AttemptLog(str(tmp_path)) as log:
+        log.record('a.json', 'ivan', 'a1', TEXT_QUESTION, '4', True)
+        log.record('b.json', 'ivan', 'a2', TEXT_QUESTION, '5', False)
+        log.record('a.json', 'anna', 'a3', TEXT_QUESTION, '4', True)
+        log.record('a.json', 'anna', 'a3', CHOICE_QUESTION, '1', False)
+    # Недописанная при сбое строка пропускается
+    with open(list_segments(str(tmp_path))[0], 'a', encoding='utf-8') as file:
+        file.write('{"ts": 500.0, "test"')
+    return str(tmp_path)
+
+
+@pytest.mark.parametrize('filters, expected', [
+    ({}, [100.0, 200.0, 300.0, 400.0]),
+    ({'test': 'a.json'}, [100.0, 300.0, 400.0]),
+    ({'user': 'anna'}, [300.0, 400.0]),
+    ({'test': 'a.json', 'user': 'ivan'}, [100.0]),
+    ({'since': 200.0, 'until': 400.0}, [200.0, 300.0]),
+])
+def test_iter_attempts_filters(journal, filters, expected):
+    assert [record['ts'] for record in iter_attempts(journal, **filters)] == expected
+
+
+def test_iter_attempts_uses_environment_directory(journal, monkeypatch):
+    monkeypatch.setenv('QUIZ_ATTEMPT_LOG', journal)
+    assert len(list(iter_attempts())) == 4
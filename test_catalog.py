@@ -0,0 +1,87 @@
+"""
+Тесты каталога тестов (quizapp.catalog).
+"""
+import json
+import os
+
+import pytest
+
+from quizapp import catalog
+from quizapp.loader import TestLoader
+
+
+def write_test(path, title, questions_count):
+    path.write_text(json.dumps({'title': title, 'questions': [
+        {'question': f'{index}?', 'answer': str(index)} for index in range(questions_count)
+    ]}, ensure_ascii=False), encoding='utf-8')
+    return str(path)
+
+
+@pytest.fixture
+def loads(monkeypatch):
+    """Считает загрузки файлов тестов каталогом."""
+    calls = []
+    load_test = TestLoader.load_test
+    monkeypatch.setattr(TestLoader, 'load_test',
+                        staticmethod(lambda file_path: calls.append(file_path) or load_test(file_path)))
+    return calls
+
+
+def test_refresh_reuses_saved_entries(tmp_path, loads):
+    path = write_test(tmp_path / 'test.json', 'Тест', 3)
+    catalog_path = str(tmp_path / 'cache' / 'catalog.json')
+
+    [(_, info)] = catalog.TestCatalog(catalog_path).refresh([path])
+    assert (info['title'], info['questions_count']) == ('Тест', 3)
+    assert os.path.exists(catalog_path)
+
+    # Новый каталог читает записи из файла и не загружает тест повторно
+    [(_, info)] = catalog.TestCatalog(catalog_path).refresh([path])
+    assert info['questions_count'] == 3
+    assert loads == [path]
+
+
+def test_changed_file_is_reloaded(tmp_path, loads):
+    path = write_test(tmp_path / 'test.json', 'Тест', 3)
+    test_catalog = catalog.TestCatalog(str(tmp_path / 'catalog.json'))
+    assert test_catalog.get(path)['questions_count'] == 3
+
+    stat = os.stat(path)
+    write_test(tmp_path / 'test.json', 'Тест', 4)
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+    assert test_catalog.get(path)['questions_count'] == 4
+    assert len(loads) == 2
+
+
+def test_errors_are_remembered(tmp_path, loads):
+    path = tmp_path / 'broken.json'
+    path.write_text('{"title": ', encoding='utf-8')
+    test_catalog = catalog.TestCatalog(str(tmp_path / 'catalog.json'))
+    [(_, error)] = test_catalog.refresh([str(path)])
+    assert isinstance(error, ValueError)
+    with pytest.raises(ValueError):
+        test_catalog.get(str(path))
+    assert len(loads) == 1
+    with pytest.raises(FileNotFoundError):
+        test_catalog.get(str(tmp_path / 'missing.json'))
+
+
+def test_refresh_prunes_removed_files(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / 'tests').mkdir()
+    first = write_test(tmp_path / 'tests' / 'first.json', 'Первый', 1)
+    write_test(tmp_path / 'tests' / 'second.json', 'Второй', 2)
+
+    test_catalog = catalog.TestCatalog(os.path.join('.quizcache', 'catalog.json'))
+    assert sorted(info['title'] for _, info in test_catalog.refresh()) == ['Второй', 'Первый']
+    assert len(test_catalog.entries) == 2
+
+    os.remove(first)
+    assert [info['title'] for _, info in test_catalog.refresh()] == ['Второй']
+    assert list(catalog.TestCatalog(os.path.join('.quizcache', 'catalog.json')).entries) == [str(tmp_path / 'tests' / 'second.json')]
+
+
+def test_corrupted_catalog_is_ignored(tmp_path):
+    catalog_path = tmp_path / 'catalog.json'
+    catalog_path.write_text('not json', encoding='utf-8')
+    assert catalog.TestCatalog(str(catalog_path)).entries == {}
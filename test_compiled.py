@@ -0,0 +1,74 @@
+"""
+Тесты скомпилированного формата тестов (quizapp.compiled).
+"""
+import json
+import os
+import pickle
+
+import pytest
+
+from quizapp.compiled import (MappedQuestions, compile_test, compiled_path, find_compiled,
+                              open_compiled)
+from quizapp.question import QuestionBank
+
+TEST = {
+    'title': 'Тест',
+    'description': 'Описание',
+    'questions': [
+        {'question': '2 + 2?', 'options': ['3', '4'], 'answer': '4'},
+        {'question': 'Столица Франции?', 'answer': 'Париж', 'aliases': ['Paris'],
+         'tags': ['география'], 'difficulty': 'easy', 'weight': 2.5},
+        {'question': 'Пустой ответ?', 'answer': ''},
+    ]
+}
+
+
+@pytest.fixture
+def test_file(tmp_path):
+    path = tmp_path / 'test.json'
+    path.write_text(json.dumps(TEST, ensure_ascii=False), encoding='utf-8')
+    return str(path)
+
+
+def test_round_trip(test_file):
+    result = compile_test(test_file)
+    assert result == {'output_path': compiled_path(test_file), 'questions_count': 3}
+
+    bank = open_compiled(result['output_path'])
+    assert (bank.title, bank.description) == ('Тест', 'Описание')
+    assert [question.to_dict() for question in bank.questions] == TEST['questions']
+    assert bank.to_dict() == QuestionBank.from_dict(TEST).to_dict()
+    assert bank.questions[-1].text == 'Пустой ответ?'
+    assert [question.text for question in bank.questions[1:]] == ['Столица Франции?', 'Пустой ответ?']
+    with pytest.raises(IndexError):
+        bank.questions[3]
+    bank.questions.close()
+
+
+def test_mapped_questions_pickle_by_path(test_file):
+    questions = MappedQuestions(compile_test(test_file)['output_path'])
+    copy = pickle.loads(pickle.dumps(questions))
+    assert copy.file_path == questions.file_path
+    assert copy[1].check('paris')
+    questions.close()
+    copy.close()
+
+
+def test_find_compiled_checks_source(test_file):
+    assert find_compiled(test_file) is None
+    output_path = compile_test(test_file)['output_path']
+    assert find_compiled(test_file) == output_path
+
+    stat = os.stat(test_file)
+    os.utime(test_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+    assert find_compiled(test_file) is None
+
+
+def test_corrupted_file_rejected(tmp_path):
+    path = tmp_path / 'broken.qbin'
+    path.write_bytes(b'QZB1')
+    with pytest.raises(ValueError):
+        MappedQuestions(str(path))
+    path.write_bytes(b'XXXX' + bytes(30))
+    with pytest.raises(ValueError):
+        MappedQuestions(str(path))
@@ -0,0 +1,51 @@
+"""
+Тесты поиска повторяющихся вопросов (quizapp.dedup).
+"""
+import json
+import os
+import subprocess
+import sys
+
+from quizapp.dedup import estimate_similarity, find_duplicates, minhash_signature, normalize_text
+
+QUESTIONS = [
+    {'question': 'Чему равен квадратный корень из 16?', 'answer': '4'},
+    {'question': 'чему равен  квадратный корень из 16', 'answer': '4'},
+    {'question': 'Чему равен квадратный корень из числа 16?', 'answer': '4'},
+    {'question': 'Столица Франции?', 'options': ['Париж', 'париж', 'Лондон'], 'answer': 'Париж'},
+]
+
+
+def write_test(path, questions):
+    path.write_text(json.dumps({'title': 'Тест', 'questions': questions}, ensure_ascii=False),
+                    encoding='utf-8')
+    return str(path)
+
+
+def test_find_duplicates(tmp_path):
+    report = find_duplicates([write_test(tmp_path / 'test.json', QUESTIONS)])
+    assert report['questions'] == 4
+    assert [[item['index'] for item in group] for group in report['exact']] == [[0, 1]]
+    assert [[item['index'] for item in group] for group in report['near']] == [[0, 2]]
+    assert report['duplicate_options'][0]['options'] == ['париж']
+    assert report['evicted'] == 0
+
+
+def test_signature_does_not_depend_on_hash_seed():
+    code = ("from quizapp.dedup import minhash_signature, normalize_text;"
+            "print(list(minhash_signature(normalize_text('Чему равен квадратный корень из 16?'))))")
+    outputs = set()
+    for seed in ('1', '2', '3'):
+        env = dict(os.environ, PYTHONHASHSEED=seed)
+        outputs.add(subprocess.run([sys.executable, '-c', code], env=env, capture_output=True,
+                                   text=True, check=True).stdout)
+    assert len(outputs) == 1
+    assert outputs.pop().strip() == str(list(minhash_signature(
+        normalize_text('Чему равен квадратный корень из 16?'))))
+
+
+def test_similarity_estimate():
+    first = minhash_signature(normalize_text(QUESTIONS[0]['question']))
+    assert estimate_similarity(first, first) == 1.0
+    other = minhash_signature(normalize_text('Сколько будет 2 + 2?'))
+    assert estimate_similarity(first, other) < 0.3
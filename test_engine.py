@@ -0,0 +1,83 @@
+"""
+Тесты выбора случайных вопросов (quizapp.engine).
+"""
+import json
+import random
+
+import pytest
+
+from quizapp.compiled import compile_test, open_compiled
+from quizapp.engine import QuizEngine, sample_stream, select_mixed_questions
+from quizapp import loader
+from quizapp.loader import load_bank, load_banks
+from quizapp.question import Question, QuestionBank
+
+
+@pytest.fixture
+def test_file(tmp_path):
+    path = tmp_path / 'test.json'
+    path.write_text(json.dumps({'title': 'Тест', 'questions': [
+        {'question': f'Вопрос {index}?', 'answer': str(index)} for index in range(50)
+    ]}, ensure_ascii=False), encoding='utf-8')
+    return str(path)
+
+
+@pytest.mark.parametrize('seed, count', [(7, 3), (1, 10), (2, 50), (3, 80), (4, 0)])
+def test_seed_selects_same_questions_on_every_path(test_file, seed, count):
+    streamed = [question.text for question in sample_stream(loader.TestStream(test_file), count, random.Random(seed))]
+    loaded = [question.text for question in QuizEngine(load_bank(test_file)).get_random_questions(count, seed)]
+    compiled_bank = open_compiled(compile_test(test_file)['output_path'])
+    compiled = [question.text for question in QuizEngine(compiled_bank).get_random_questions(count, seed)]
+    compiled_bank.questions.close()
+
+    assert streamed == loaded == compiled
+    assert len(streamed) == min(count, 50)
+    assert len(set(streamed)) == len(streamed)
+
+
+def make_bank(name, size):
+    return QuestionBank(name, '', [Question.from_dict({'question': f'{name} {index}?', 'answer': str(index)})
+                                   for index in range(size)])
+
+
+BANKS = [make_bank('A', 5), make_bank('B', 3), make_bank('C', 4)]
+
+
+@pytest.mark.parametrize('quotas, expected', [
+    ([2, 1, 3], [2, 1, 3]),
+    # Квота больше набора - берется весь набор, отрицательная - ничего
+    ([10, 0, -1], [5, 0, 0]),
+])
+def test_mixed_questions_follow_quotas(quotas, expected):
+    questions, origins = select_mixed_questions(BANKS, quotas=quotas, rng=random.Random(1))
+    assert [origins.count(index) for index in range(len(BANKS))] == expected
+    for question, origin in zip(questions, origins):
+        assert question in BANKS[origin].questions
+    assert len({question.text for question in questions}) == len(questions)
+
+
+def test_mixed_questions_quota_count_mismatch():
+    with pytest.raises(ValueError, match='квот'):
+        select_mixed_questions(BANKS, quotas=[1, 2])
+
+
+@pytest.mark.parametrize('count, expected', [(None, 12), (4, 4), (100, 12), (0, 0)])
+def test_mixed_questions_from_combined_bank(count, expected):
+    questions, origins = select_mixed_questions(BANKS, count, rng=random.Random(2))
+    assert len(questions) == expected
+    assert [question.text for question in questions] == \
+        [f'{BANKS[origin].title} {question.answer}?' for question, origin in zip(questions, origins)]
+    if count is None:
+        assert [question.text for question in questions] == \
+            [question.text for bank in BANKS for question in bank.questions]
+
+
+def test_mixed_questions_are_reproducible():
+    first = select_mixed_questions(BANKS, quotas=[2, 2, 2], rng=random.Random(5))
+    second = select_mixed_questions(BANKS, quotas=[2, 2, 2], rng=random.Random(5))
+    assert first == second
+
+
+def test_load_banks_reports_missing_file(test_file, tmp_path):
+    with pytest.raises(FileNotFoundError):
+        load_banks([test_file, str(tmp_path / 'missing.json')])
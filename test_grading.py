@@ -0,0 +1,65 @@
+"""
+Тесты пакетной проверки листов ответов (quizapp.grading, quizapp.commands).
+"""
+import json
+
+import pytest
+
+from quizapp.commands import _read_submissions, grade_submissions
+from quizapp.grading import grade_batch, grade_submission
+from quizapp.question import QuestionBank
+from quizapp.render import flush_output
+
+BANK = QuestionBank.from_dict({
+    'title': 'Тест',
+    'questions': [
+        {'question': '2 + 2?', 'options': ['3', '4'], 'answer': '4'},
+        {'question': 'Столица Франции?', 'answer': 'Париж'},
+    ]
+})
+
+
+@pytest.fixture(autouse=True)
+def flush_messages():
+    # Сообщения команд буферизуются рендерером; вывод попадает в перехват pytest
+    yield
+    flush_output()
+
+
+def test_grade_submission_missing_answers_are_wrong():
+    result = grade_submission(BANK, {'id': 's1', 'answers': ['2']})
+    assert result == {'id': 's1', 'score': 1, 'total': 2, 'percentage': 50.0, 'correct': [True, False]}
+
+
+def test_grade_batch_keeps_order():
+    submissions = [{'id': i, 'answers': ['2', 'париж' if i % 2 else 'Лондон']} for i in range(10)]
+    results = list(grade_batch(BANK, submissions, workers=1))
+    assert [result['id'] for result in results] == list(range(10))
+    assert [result['score'] for result in results] == [1, 2] * 5
+
+
+def test_read_submissions_skips_invalid_lines(tmp_path):
+    path = tmp_path / 'answers.jsonl'
+    path.write_text('\n'.join([
+        '{"id": "a", "answers": ["2"]}',
+        '[1, 2]',
+        '{"id": "b"}',
+        '{"id": "c", "answers": "2"}',
+        'not json',
+        '',
+        '{"id": "d", "answers": []}',
+    ]), encoding='utf-8')
+    assert [submission['id'] for submission in _read_submissions(str(path))] == ['a', 'd']
+
+
+def test_grade_submissions_reports_failure(tmp_path):
+    assert not grade_submissions(str(tmp_path / 'missing.json'), str(tmp_path / 'missing.jsonl'))
+
+    test_path = tmp_path / 'test.json'
+    test_path.write_text(json.dumps(BANK.to_dict(), ensure_ascii=False), encoding='utf-8')
+    submissions_path = tmp_path / 'answers.jsonl'
+    submissions_path.write_text('[1, 2]\n{"id": "a", "answers": ["2", "Париж"]}\n', encoding='utf-8')
+    output_path = tmp_path / 'results.jsonl'
+    assert grade_submissions(str(test_path), str(submissions_path), str(output_path), workers=1)
+    results = [json.loads(line) for line in output_path.read_text(encoding='utf-8').splitlines()]
+    assert [(result['id'], result['score']) for result in results] == [('a', 2)]
@@ -0,0 +1,108 @@
+"""
+Тесты измерения производительности (quizapp.instrument).
+"""
+import io
+
+import pytest
+
+from quizapp import instrument
+
+
+@pytest.fixture(autouse=True)
+def measurements():
+    """Восстанавливает состояние измерений после теста."""
+    instrument.reset()
+    yield
+    instrument.disable()
+    instrument.reset()
+
+
+def test_disabled_measurements_record_nothing():
+    @instrument.timed('test.call')
+    def call(value):
+        return value * 2
+
+    assert call(3) == 6
+    with instrument.span('test.span'):
+        pass
+    instrument.count('test.counter')
+    instrument.observe('test.size', 10)
+    assert instrument.snapshot() == {'spans': {}, 'counters': {}, 'histograms': {}}
+    assert instrument.span('test.span') is instrument.span('test.other')
+
+
+def test_spans_and_timed_functions(monkeypatch):
+    ticks = iter([1.0, 1.002, 2.0, 2.004, 3.0, 3.001])
+    monkeypatch.setattr(instrument.time, 'perf_counter', lambda: next(ticks))
+    instrument.enable(report_at_exit=False)
+
+    @instrument.timed('test.call')
+    def call():
+        return 'ok'
+
+    assert call() == 'ok'
+    assert call.__name__ == 'call'
+    assert call() == 'ok'
+    with instrument.span('test.span'):
+        pass
+
+    spans = instrument.snapshot()['spans']
+    assert spans['test.call']['count'] == 2
+    assert spans['test.call']['total'] == pytest.approx(6000)
+    assert spans['test.call']['max'] == pytest.approx(4000)
+    assert spans['test.span']['count'] == 1
+    assert spans['test.span']['mean'] == pytest.approx(1000)
+
+
+def test_timed_function_errors_are_measured():
+    instrument.enable(report_at_exit=False)
+
+    @instrument.timed('test.fail')
+    def fail():
+        raise ValueError('ошибка')
+
+    with pytest.raises(ValueError):
+        fail()
+    assert instrument.snapshot()['spans']['test.fail']['count'] == 1
+
+
+def test_counters_and_histograms():
+    instrument.enable(report_at_exit=False)
+    instrument.count('test.counter')
+    instrument.count('test.counter', 4)
+    for value in range(1, 101):
+        instrument.observe('test.size', value)
+
+    data = instrument.snapshot()
+    assert data['counters'] == {'test.counter': 5}
+    histogram = data['histograms']['test.size']
+    assert (histogram['count'], histogram['min'], histogram['max']) == (100, 1, 100)
+    assert histogram['mean'] == pytest.approx(50.5)
+    # Погрешность перцентилей не больше размера корзины
+    assert 50 <= histogram['p50'] <= 50 * instrument.HISTOGRAM_RATIO
+    assert 95 <= histogram['p95'] <= 100
+
+
+def test_report_and_reset():
+    instrument.enable(report_at_exit=False)
+    with instrument.span('test.span'):
+        pass
+    instrument.count('test.counter', 2)
+    instrument.observe('test.size', 3)
+
+    output = io.StringIO()
+    instrument.report(output)
+    text = output.getvalue()
+    assert 'test.span' in text
+    assert 'test.counter: 2' in text
+    assert 'test.size: количество 1' in text
+
+    instrument.reset()
+    output = io.StringIO()
+    instrument.report(output)
+    assert output.getvalue() == ''
+
+
+def test_empty_histogram():
+    assert instrument.Histogram().to_dict() == {'count': 0}
+    assert instrument.Histogram().quantile(0.5) == 0.0
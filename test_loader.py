@@ -0,0 +1,145 @@
+"""
+Тесты загрузки и сохранения тестов (quizapp.loader).
+"""
+import json
+
+import pytest
+
+from quizapp import loader
+from quizapp.loader import TestLoader, append_question, load_test, save_test
+
+QUESTION = {'question': 'Сколько будет 3 + 3?', 'answer': '6'}
+
+
+def write_json(path, data, **kwargs):
+    path.write_text(json.dumps(data, ensure_ascii=False, **kwargs), encoding='utf-8')
+    return str(path)
+
+
+def read_json(path):
+    return json.loads(path.read_text(encoding='utf-8'))
+
+
+@pytest.mark.parametrize('compact', [False, True])
+def test_append_question_in_place(tmp_path, compact):
+    path = tmp_path / 'test.json'
+    save_test({'title': 'Тест', 'questions': [{'question': '1?', 'answer': '1'}]}, str(path), compact)
+    append_question(str(path), QUESTION)
+    append_question(str(path), QUESTION)
+
+    data = read_json(path)
+    assert data['questions'][1:] == [QUESTION, QUESTION]
+    assert ('\n' in path.read_text(encoding='utf-8')) != compact
+
+
+def test_append_question_to_empty_array(tmp_path):
+    path = write_json(tmp_path / 'test.json', {'title': 'Тест', 'questions': []})
+    append_question(path, QUESTION)
+    assert load_test(path)['questions'] == [QUESTION]
+
+
+def test_append_question_when_questions_is_not_last(tmp_path):
+    path = tmp_path / 'test.json'
+    write_json(path, {'title': 'Тест', 'questions': [{'question': '1?', 'answer': '1'}],
+                      'meta': [{'author': 'x'}]})
+    append_question(str(path), QUESTION)
+
+    data = read_json(path)
+    assert data['meta'] == [{'author': 'x'}]
+    assert data['questions'] == [{'question': '1?', 'answer': '1'}, QUESTION]
+    # После пересохранения questions последнее поле
+    assert list(data)[-1] == 'questions'
+
+
+def test_append_question_without_questions(tmp_path):
+    path = write_json(tmp_path / 'test.json', {'title': 'Тест', 'meta': [1]})
+    with pytest.raises(ValueError):
+        append_question(path, QUESTION)
+    assert read_json(tmp_path / 'test.json') == {'title': 'Тест', 'meta': [1]}
+
+
+def test_append_question_missing_file(tmp_path):
+    with pytest.raises(FileNotFoundError):
+        append_question(str(tmp_path / 'missing.json'), QUESTION)
+
+
+def test_load_test_returns_independent_copies(tmp_path):
+    path = write_json(tmp_path / 'test.json', {'title': 'Тест', 'questions': [QUESTION]})
+    first = load_test(path)
+    first['title'] = 'Изменено'
+    first['questions'][0]['answer'] = '7'
+    first['questions'].append(QUESTION)
+
+    second = load_test(path)
+    assert second == {'title': 'Тест', 'questions': [QUESTION]}
+    assert second is not first
+
+
+def test_append_question_reads_only_the_tail(tmp_path, monkeypatch):
+    path = tmp_path / 'test.json'
+    questions = [{'question': f'Вопрос {index}?', 'answer': str(index)} for index in range(3000)]
+    save_test({'title': 'Тест', 'questions': questions}, str(path))
+
+    def rewrite(*args):
+        raise AssertionError("тест не должен перезаписываться целиком")
+
+    monkeypatch.setattr(TestLoader, '_append_by_rewrite', staticmethod(rewrite))
+    append_question(str(path), QUESTION)
+    data = read_json(path)
+    assert len(data['questions']) == 3001
+    assert data['questions'][-1] == QUESTION
+
+
+@pytest.mark.parametrize('data', [
+    {'title': 'Тест', 'questions': [], 'meta': []},
+    {'title': 'Тест', 'questions': [{'question': '1?', 'answer': '1'}], 'meta': [{'author': 'x'}]},
+    {'title': 'Тест', 'questions': [{'question': '1?', 'answer': '1'}], 'extra': {'a': 1}},
+])
+def test_append_question_falls_back_to_rewrite(tmp_path, monkeypatch, data):
+    path = write_json(tmp_path / 'test.json', data, indent=2)
+    calls = []
+    rewrite = TestLoader._append_by_rewrite
+    monkeypatch.setattr(TestLoader, '_append_by_rewrite',
+                        staticmethod(lambda *args: calls.append(args) or rewrite(*args)))
+    append_question(path, QUESTION)
+
+    assert len(calls) == 1
+    saved = read_json(tmp_path / 'test.json')
+    assert saved['questions'] == data['questions'] + [QUESTION]
+    assert {key: value for key, value in saved.items() if key != 'questions'} == \
+        {key: value for key, value in data.items() if key != 'questions'}
+
+
+QUESTIONS = [
+    {'question': 'Вопрос номер один с длинным текстом?', 'answer': '1'},
+    {'question': 'Выберите число', 'options': ['12345', '67890', '0.25'], 'correct': 2},
+    {'question': 'Вопрос со \\"спецсимволами\\" и юникодом ёжик?', 'answer': '-3.5e2'},
+]
+
+
+@pytest.mark.parametrize('chunk_size', [1, 2, 3, 7, 64 * 1024])
+@pytest.mark.parametrize('title_last', [False, True])
+def test_stream_reads_values_across_chunks(tmp_path, monkeypatch, chunk_size, title_last):
+    monkeypatch.setattr(loader, 'STREAM_CHUNK_SIZE', chunk_size)
+    data = {'questions': QUESTIONS, 'title': 'Тест', 'description': 'Описание', 'version': 1250}
+    if not title_last:
+        data = {'title': 'Тест', 'version': 1250, 'questions': QUESTIONS, 'description': 'Описание'}
+    path = write_json(tmp_path / 'test.json', data, indent=2)
+
+    stream = loader.TestStream(path)
+    assert stream.title == 'Тест'
+    assert stream.header['version'] == 1250
+    assert 'questions' not in stream.header
+    assert list(stream.iter_dicts()) == QUESTIONS
+    assert [question.text for question in stream] == [question['question'] for question in QUESTIONS]
+
+
+def test_stream_requires_title_and_questions(tmp_path):
+    with pytest.raises(ValueError, match='title'):
+        loader.TestStream(write_json(tmp_path / 'a.json', {'questions': QUESTIONS}))
+    with pytest.raises(ValueError, match='questions'):
+        loader.TestStream(write_json(tmp_path / 'b.json', {'title': 'Тест'}))
+    path = tmp_path / 'c.json'
+    path.write_text('{"title": "Тест", "questions": [{"question": "1?"', encoding='utf-8')
+    with pytest.raises(ValueError):
+        list(loader.TestStream(str(path)).iter_dicts())
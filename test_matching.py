@@ -0,0 +1,93 @@
+"""
+Тесты сравнения текстовых ответов (quizapp.matching).
+"""
+import pytest
+
+from quizapp.matching import AnswerMatcher, bounded_levenshtein, normalize_answer
+from quizapp.question import Question
+
+
+@pytest.mark.parametrize('text, expected', [
+    (' Python 3! ', 'python3'),
+    ('Ёлка', 'елка'),
+    ('3,14', '3.14'),
+    ('-5', '-5'),
+    ('1-2', '1-2'),
+    ('x-ray', 'xray'),
+    ('list(range(10))', 'list(range(10))'),
+    ('C++', 'c++'),
+    ('?', '?'),
+    (' ?! ', '?!'),
+])
+def test_normalize_answer(text, expected):
+    assert normalize_answer(text) == expected
+
+
+@pytest.mark.parametrize('answer, user_answer', [
+    ('5', '-5'),
+    ('-273', '273'),
+    ('12', '1-2'),
+    ('list(range(10))', 'listrange10'),
+    ('1945', '1946'),
+    ('температура -273.15', 'температура 273.15'),
+    ('температура -273.15', 'температура -273.16'),
+])
+def test_sign_and_value_mismatch_rejected(answer, user_answer):
+    assert not Question('Вопрос?', None, answer).check(user_answer)
+
+
+@pytest.mark.parametrize('answer, user_answer', [
+    ('5', ' 5 '),
+    ('-273', '-273'),
+    ('list(range(10))', 'List(range(10))'),
+    ('температура -273.15', 'температура -273,15'),
+    ('?', ' ? '),
+])
+def test_equivalent_answers_accepted(answer, user_answer):
+    assert Question('Вопрос?', None, answer).check(user_answer)
+
+
+@pytest.mark.parametrize('answer, user_answer', [
+    ('Париж', 'Парит'),
+    ('программирование', 'програмирование'),
+    ('?', '!!!'),
+    ('?', ''),
+])
+def test_no_typos_or_punctuation_wildcards_by_default(answer, user_answer):
+    assert not Question('Вопрос?', None, answer).check(user_answer)
+
+
+@pytest.mark.parametrize('answer, user_answer', [
+    ('программирование', 'програмирование'),
+    ('температура -273.15', 'темпиратура -273,15'),
+    ('Париж', 'Парит'),
+])
+def test_typos_allowed_when_enabled(answer, user_answer):
+    assert Question('Вопрос?', None, answer).check(user_answer, AnswerMatcher(max_typos=1))
+
+
+def test_shipped_equation_answer():
+    question = Question('Решите уравнение: 3x - 7 = 8. Чему равен x?', None, '5')
+    assert question.check('5')
+    assert not question.check('-5')
+
+
+def test_typo_limit_depends_on_length():
+    matcher = AnswerMatcher(max_typos=2)
+    assert matcher.allowed_typos('кот') == 0
+    assert matcher.allowed_typos('python') == 1
+    assert matcher.allowed_typos('программирование') == 2
+    assert not matcher.matches(('кот',), 'кит')
+    assert not AnswerMatcher(max_typos=0).matches(('python',), 'pyhton')
+
+
+@pytest.mark.parametrize('first, second, limit, expected', [
+    ('kitten', 'sitting', 3, 3),
+    ('kitten', 'sitting', 2, 3),
+    ('abc', 'abc', 1, 0),
+    ('', 'abcd', 2, 3),
+    ('flaw', 'lawn', 2, 2),
+    ('ab', 'ba', 1, 2),
+])
+def test_bounded_levenshtein(first, second, limit, expected):
+    assert bounded_levenshtein(first, second, limit) == expected
@@ -0,0 +1,21 @@
+"""
+Тесты консольного меню (pycharm_interface).
+"""
+import pycharm_interface
+
+
+def test_command_output_precedes_prompt(monkeypatch, capsys):
+    seen = []
+
+    def fake_input(prompt=''):
+        # Что было выведено к моменту приглашения
+        seen.append(capsys.readouterr().out)
+        return ''
+
+    monkeypatch.setattr(pycharm_interface, 'clear_screen', lambda: None)
+    monkeypatch.setattr('builtins.input', fake_input)
+    pycharm_interface.handle_list_tests()
+
+    assert len(seen) == 1
+    assert 'СПИСОК ДОСТУПНЫХ ТЕСТОВ' in seen[0]
+    assert 'Математический тест' in seen[0]
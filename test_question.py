@@ -0,0 +1,45 @@
+"""
+Тесты компактного представления вопросов (quizapp.question).
+"""
+import pytest
+
+from quizapp.question import Question, QuestionBank
+from quizapp.validation import validate_test_data
+
+
+def test_option_answer_compiles_to_index():
+    question = Question('2 + 2?', ('3', '4'), '4')
+    assert question.correct_index == 1
+    assert question.warning is None
+    assert question.check('2')
+    assert not question.check('1')
+
+
+def test_unmatched_answer_is_flagged_not_rejected():
+    bank = QuestionBank.from_dict({'title': 'Тест', 'questions': [
+        {'question': 'Столица Франции?', 'options': ['Лондон', 'Париж, Франция'], 'answer': 'Париж'},
+        {'question': 'Повтор?', 'options': ['да', 'Да', 'нет'], 'answer': 'да'},
+        {'question': '2 + 2?', 'options': ['3', '4'], 'answer': '4'},
+    ]})
+    unmatched, duplicated, good = bank.questions
+    assert unmatched.correct_index is None and 'ни с одним' in unmatched.warning
+    assert duplicated.correct_index is None and '(1, 2)' in duplicated.warning
+    assert good.warning is None
+
+    # Прежнее правило: вариант начинается с правильного ответа
+    assert unmatched.check('2') and not unmatched.check('1')
+    assert duplicated.check('1') and duplicated.check('2') and not duplicated.check('3')
+    assert good.check('2')
+
+
+def test_validation_reports_flagged_question():
+    errors, _ = validate_test_data({'title': 'Тест', 'questions': [
+        {'question': 'Вопрос?', 'options': ['a', 'b'], 'answer': 'c'}]})
+    assert any('ни с одним' in error['message'] for error in errors)
+
+
+def test_tags_must_be_a_list():
+    with pytest.raises(ValueError):
+        Question.from_dict({'question': 'Вопрос?', 'answer': '1', 'tags': 'алгебра'})
+    question = Question.from_dict({'question': 'Вопрос?', 'answer': '1', 'tags': ['алгебра']})
+    assert question.tags == ('алгебра',)
@@ -0,0 +1,93 @@
+"""
+Тесты накопителей статистики (quizapp.results).
+"""
+import random
+import statistics
+
+import pytest
+
+from quizapp.results import (ScoreSketch, StatisticsAccumulator, accumulate_attempts,
+                             calculate_statistics)
+
+
+def make_attempts(seed, count):
+    rng = random.Random(seed)
+    return [(rng.randint(0, 20), 20) for _ in range(count)]
+
+
+def accumulate(attempts):
+    accumulator = StatisticsAccumulator()
+    for score, total in attempts:
+        accumulator.add_attempt(score, total)
+    return accumulator
+
+
+def test_welford_matches_statistics():
+    attempts = make_attempts(1, 500)
+    percentages = [score / total * 100 for score, total in attempts]
+    accumulator = accumulate(attempts)
+    assert accumulator.attempts == 500
+    assert accumulator.score_mean == pytest.approx(statistics.fmean(percentages))
+    assert accumulator.score_variance == pytest.approx(statistics.variance(percentages))
+
+
+@pytest.mark.parametrize('split', [0, 1, 137, 499, 500])
+def test_chan_merge_matches_single_pass(split):
+    attempts = make_attempts(2, 500)
+    merged = accumulate(attempts[:split]).merge(accumulate(attempts[split:]))
+    single = accumulate(attempts)
+    assert merged.attempts == single.attempts
+    assert merged.score_mean == pytest.approx(single.score_mean)
+    assert merged.score_variance == pytest.approx(single.score_variance)
+    assert merged.to_dict()['score_percentiles'] == single.to_dict()['score_percentiles']
+
+
+def test_answers_merge_by_type():
+    answers = [{'is_correct': index % 3 == 0, 'type': 'text' if index % 2 else 'multiple_choice'}
+               for index in range(30)]
+    first, second = StatisticsAccumulator(), StatisticsAccumulator()
+    for answer in answers[:12]:
+        first.add_answer(answer)
+    for answer in answers[12:]:
+        second.add_answer(answer)
+    assert first.merge(second).to_dict() == calculate_statistics(answers)
+    assert calculate_statistics(answers)['correct_answers'] == 10
+
+
+def test_empty_accumulator():
+    assert StatisticsAccumulator().to_dict() == {}
+    assert calculate_statistics([]) == {}
+
+
+def test_score_sketch_quantiles():
+    sketch = ScoreSketch()
+    for percentage in range(1, 101):
+        sketch.add(percentage)
+    assert sketch.count == 100
+    assert sketch.quantile(0.5) == pytest.approx(50.0)
+    assert sketch.quantile(0.95) == pytest.approx(95.0)
+    assert sketch.quantile(1.0) == pytest.approx(100.0)
+    assert ScoreSketch().quantile(0.5) is None
+
+
+def test_score_sketch_clamps_and_merges():
+    first, second = ScoreSketch(), ScoreSketch()
+    first.add(-5)
+    second.add(150)
+    first.merge(second)
+    assert first.count == 2
+    assert first.quantile(0.5) == 0.0
+    assert first.quantile(1.0) == pytest.approx(100.0)
+    with pytest.raises(ValueError):
+        first.merge(ScoreSketch(resolution=1.0))
+
+
+def test_accumulate_interleaved_attempts():
+    # Сервер записывает ответы параллельных попыток вперемешку
+    records = [{'attempt': attempt, 'is_correct': correct, 'type': 'text'}
+               for attempt, correct in [('a', True), ('b', False), ('a', True), ('b', True),
+                                        ('a', False), ('c', True)]]
+    accumulator = accumulate_attempts(records)
+    assert accumulator.attempts == 3
+    assert accumulator.correct == 4
+    assert accumulator.score_mean == pytest.approx((200 / 3 + 50 + 100) / 3)
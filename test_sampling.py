@@ -0,0 +1,119 @@
+"""
+Тесты выборки вопросов (quizapp.sampling).
+"""
+import random
+
+import pytest
+
+from quizapp.question import Question
+from quizapp.sampling import AliasTable, QuestionSampler, apportion
+
+
+def test_unreachable_tag_minimum_rejected():
+    sampler = QuestionSampler([Question('1?', None, '1', tags=('x',)),
+                               Question('2?', None, '2', tags=('y',)),
+                               Question('3?', None, '3', tags=('x',))])
+    with pytest.raises(ValueError):
+        sampler.sample(3, tags={'y': 3})
+    with pytest.raises(ValueError):
+        sampler.sample(3, tags={'z': 1})
+    assert len(sampler.sample(3, tags={'x': 2})) == 3
+
+
+def make_questions():
+    questions = []
+    for index in range(60):
+        difficulty = ('easy', 'medium', 'hard')[index % 3]
+        tags = ('алгебра',) if index % 10 == 0 else ('геометрия',)
+        questions.append(Question(f'{index}?', None, str(index), tags=tags, difficulty=difficulty))
+    return questions
+
+
+def test_alias_table_matches_weights():
+    weights = [1.0, 2.0, 3.0, 4.0]
+    table = AliasTable(weights)
+    rng = random.Random(1)
+    draws = 40000
+    counts = [0] * len(weights)
+    for _ in range(draws):
+        counts[table.draw(rng)] += 1
+    for count, weight in zip(counts, weights):
+        assert count / draws == pytest.approx(weight / sum(weights), abs=0.01)
+
+
+def test_alias_table_rejects_empty_weights():
+    with pytest.raises(ValueError):
+        AliasTable([])
+
+
+def test_weighted_sample_prefers_heavy_questions():
+    questions = [Question(f'{index}?', None, '1', weight=9.0 if index == 0 else 1.0)
+                 for index in range(10)]
+    sampler = QuestionSampler(questions)
+    rng = random.Random(2)
+    trials = 4000
+    hits = sum(questions[0] in sampler.sample(1, rng) for _ in range(trials))
+    # Вероятность выбрать тяжелый вопрос 9 / 18
+    assert hits / trials == pytest.approx(0.5, abs=0.03)
+    unweighted = sum(questions[0] in sampler.sample(1, rng, weighted=False) for _ in range(trials))
+    assert unweighted / trials == pytest.approx(0.1, abs=0.02)
+
+
+@pytest.mark.parametrize('count', [1, 10, 30, 59, 60, 100])
+def test_sample_has_no_repeats(count):
+    questions = make_questions()
+    selected = QuestionSampler(questions).sample(count, random.Random(count))
+    assert len(selected) == min(count, len(questions))
+    assert len({id(question) for question in selected}) == len(selected)
+
+
+def test_sample_meets_difficulty_quotas_and_tag_minimums():
+    sampler = QuestionSampler(make_questions())
+    assert sampler.difficulties == {'easy': 20, 'medium': 20, 'hard': 20}
+    assert sampler.tags == {'алгебра': 6, 'геометрия': 54}
+    rng = random.Random(3)
+    for _ in range(50):
+        selected = sampler.sample(10, rng, difficulty={'easy': 30, 'medium': 50, 'hard': 20},
+                                  tags={'алгебра': 2})
+        assert sum('алгебра' in question.tags for question in selected) >= 2
+        # Вопросы по темам засчитываются в доли сложностей: два вопроса темы
+        # не больше ни одной квоты, поэтому квоты выдерживаются точно
+        difficulties = [question.difficulty for question in selected]
+        assert (difficulties.count('easy'), difficulties.count('medium'),
+                difficulties.count('hard')) == (3, 5, 2)
+
+
+def test_difficulty_shortage_is_filled_from_other_questions():
+    questions = make_questions()[:9] + [Question('?', None, '1') for _ in range(20)]
+    selected = QuestionSampler(questions).sample(20, random.Random(4), difficulty={'hard': 1})
+    assert len(selected) == 20
+    assert sum(question.difficulty == 'hard' for question in selected) == 3
+
+
+def test_sample_errors():
+    sampler = QuestionSampler(make_questions())
+    with pytest.raises(ValueError):
+        sampler.sample(5, difficulty={'expert': 1})
+    with pytest.raises(ValueError):
+        sampler.sample(5, tags={'алгебра': 3, 'геометрия': 3})
+    with pytest.raises(ValueError):
+        sampler.sample(5, difficulty={'easy': 0})
+
+
+@pytest.mark.parametrize('shares, count, expected', [
+    ({'easy': 30, 'medium': 50, 'hard': 20}, 7, {'easy': 2, 'medium': 4, 'hard': 1}),
+    ({'easy': 30, 'medium': 50, 'hard': 20}, 10, {'easy': 3, 'medium': 5, 'hard': 2}),
+    ({'a': 1, 'b': 1, 'c': 1}, 2, {'a': 1, 'b': 1, 'c': 0}),
+    ({'a': 0.5, 'b': 0}, 3, {'a': 3, 'b': 0}),
+])
+def test_apportion(shares, count, expected):
+    quotas = apportion(shares, count)
+    assert quotas == expected
+    assert sum(quotas.values()) == count
+
+
+def test_apportion_errors():
+    with pytest.raises(ValueError):
+        apportion({'a': -1, 'b': 2}, 3)
+    with pytest.raises(ValueError):
+        apportion({'a': 0}, 3)
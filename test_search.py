@@ -0,0 +1,46 @@
+"""
+Тесты полнотекстового поиска (quizapp.search).
+"""
+import json
+
+import pytest
+
+from quizapp.search import SearchIndex, stem, tokenize
+
+
+@pytest.mark.parametrize('first, second', [
+    ('корень', 'корня'),
+    ('квадратный', 'квадратного'),
+    ('отец', 'отца'),
+    ('ребенок', 'ребенка'),
+    ('список', 'списка'),
+    ('равен', 'равна'),
+    ('переменная', 'переменных'),
+    ('lists', 'list'),
+    ('queries', 'query'),
+])
+def test_inflected_forms_share_stem(first, second):
+    assert stem(first) == stem(second)
+
+
+def test_stem_keeps_short_words_and_numbers():
+    assert stem('тест') == 'тест'
+    assert stem('class') == 'class'
+    assert stem('16') == '16'
+
+
+def test_tokenize():
+    assert tokenize('Чему равен квадратный корень из 16?') == ['чем', 'равн', 'квадратн', 'корн', '16']
+
+
+def test_search_finds_inflected_query(tmp_path):
+    test_path = tmp_path / 'math.json'
+    test_path.write_text(json.dumps({'title': 'Математика', 'questions': [
+        {'question': 'Чему равен квадратный корень из 16?', 'answer': '4'},
+        {'question': 'Сколько будет 2 + 2?', 'answer': '4'},
+    ]}, ensure_ascii=False), encoding='utf-8')
+
+    with SearchIndex(str(tmp_path / 'search.db')) as index:
+        index.update([str(test_path)])
+        hits = index.search('квадратного корня')
+    assert [hit['question'] for hit in hits] == ['Чему равен квадратный корень из 16?']
@@ -0,0 +1,48 @@
+"""
+Тесты HTTP сервера тестирования (quizapp.server).
+"""
+import asyncio
+import json
+
+import pytest
+
+from quizapp.server import QuizServer
+
+TEST_PATH = 'tests/math_test.json'
+
+
+async def exchange(server, request):
+    """Отправляет запрос серверу и читает все данные до закрытия соединения."""
+    listener = await asyncio.start_server(server.handle_connection, '127.0.0.1', 0)
+    port = listener.sockets[0].getsockname()[1]
+    async with listener:
+        reader, writer = await asyncio.open_connection('127.0.0.1', port)
+        writer.write(request)
+        await writer.drain()
+        response = await asyncio.wait_for(reader.read(), 5)
+        writer.close()
+    head, _, body = response.partition(b'\r\n\r\n')
+    return head.decode('latin-1'), body
+
+
+def post(path, body, connection='close', length=None):
+    payload = json.dumps(body).encode('utf-8')
+    return (f"POST {path} HTTP/1.1\r\nContent-Length: {len(payload) if length is None else length}\r\n"
+            f"Connection: {connection}\r\n\r\n").encode('latin-1') + payload
+
+
+@pytest.mark.parametrize('length', ['-5', 'abc', '1_0', '+3'])
+def test_invalid_content_length_closes_connection(length):
+    # Соединение keep-alive, но сервер закрывает его после ответа 400
+    head, body = asyncio.run(exchange(QuizServer(), post('/sessions', {}, 'keep-alive', length)))
+    assert head.startswith('HTTP/1.1 400')
+    assert 'Connection: close' in head
+    assert 'Content-Length' in json.loads(body)['error']
+
+
+def test_start_session_loads_test():
+    server = QuizServer()
+    head, body = asyncio.run(exchange(server, post('/sessions', {'test': TEST_PATH})))
+    assert head.startswith('HTTP/1.1 201')
+    assert json.loads(body)['total'] == len(server._banks[TEST_PATH])
+    assert not server._loading
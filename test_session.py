@@ -0,0 +1,41 @@
+"""
+Тесты сессии прохождения теста (quizapp.session).
+"""
+import pytest
+
+from quizapp.question import Question
+from quizapp.session import QuizSession
+
+QUESTIONS = [Question('2 + 2?', ('3', '4'), '4'), Question('Столица Франции?', None, 'Париж')]
+
+
+@pytest.mark.parametrize('questions', [QUESTIONS, iter(QUESTIONS)])
+def test_finished_has_no_side_effects(questions):
+    session = QuizSession(questions)
+    assert not session.finished
+    assert not session.finished
+    assert session.position == 0
+
+    assert session.next_question() is QUESTIONS[0]
+    assert not session.finished
+    assert session.position == 1
+    assert session.submit('2')
+
+    assert not session.finished
+    assert session.position == 1
+    assert session.next_question() is QUESTIONS[1]
+    assert session.position == 2
+    assert not session.submit('Лондон')
+
+    assert session.finished
+    assert session.finished
+    assert session.next_question() is None
+    assert session.position == 2
+    assert session.result()[:2] == (1, 2)
+
+
+def test_submit_after_finish_raises():
+    session = QuizSession([])
+    assert session.finished
+    with pytest.raises(RuntimeError):
+        session.submit('1')
@@ -0,0 +1,82 @@
+"""
+Тесты проверки файлов тестов (quizapp.validation).
+"""
+import json
+import os
+
+import pytest
+
+from quizapp import validation
+from quizapp.validation import validate_file, validate_files, validate_test_data
+
+TESTS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'tests')
+
+
+def write_json(path, data):
+    path.write_text(json.dumps(data, ensure_ascii=False), encoding='utf-8')
+    return str(path)
+
+
+def messages(entries):
+    return [(entry['question'], entry['message']) for entry in entries]
+
+
+def test_shipped_banks():
+    report = validate_files([os.path.join(TESTS_DIR, name)
+                             for name in ('math_test.json', 'programming_test.json', 'df.json')], workers=1)
+    assert (report['files'], report['valid'], report['invalid'], report['errors']) == (3, 2, 1, 1)
+    math, programming, df = report['results']
+    assert math['valid'] and programming['valid']
+    assert messages(df['errors']) == [(1, "Варианты ответа повторяются")]
+    assert df['questions'] == 2
+
+
+@pytest.mark.parametrize('question, message', [
+    ({'question': '', 'answer': '1'}, "Отсутствует или пусто поле question"),
+    ({'question': '1?'}, "Отсутствует поле answer или оно не является строкой или числом"),
+    ({'question': '1?', 'answer': True}, "Отсутствует поле answer или оно не является строкой или числом"),
+    ({'question': '1?', 'answer': ' '}, "Пустой правильный ответ"),
+    ({'question': '1?', 'answer': '1', 'options': ['1']}, "У вопроса с вариантами должно быть не менее двух вариантов"),
+    ({'question': '1?', 'answer': '1', 'options': ['1', ' ']}, "Пустой вариант ответа"),
+    # Повтор с точностью до регистра и пробелов, как в tests/df.json
+    ({'question': '1?', 'answer': '1', 'options': ['1', 'Да', ' да ']}, "Варианты ответа повторяются"),
+    ({'question': '1?', 'answer': '1', 'tags': ['']}, "Поле tags должно быть списком непустых строк"),
+    ({'question': '1?', 'answer': '1', 'weight': 0}, "Поле weight должно быть положительным числом"),
+])
+def test_question_errors(question, message):
+    errors, _ = validate_test_data({'title': 'Тест', 'questions': [question]})
+    assert (1, message) in messages(errors)
+
+
+def test_answer_must_match_an_option():
+    errors, _ = validate_test_data({'title': 'Тест', 'questions': [
+        {'question': '1?', 'answer': '3', 'options': ['1', '2']}]})
+    assert [entry['question'] for entry in errors] == [1]
+
+
+def test_warnings_do_not_invalidate(tmp_path):
+    path = write_json(tmp_path / 'test.json', {'title': 'Тест', 'author': 'x', 'questions': [
+        {'question': '1?', 'answer': 1, 'hint': 'подсказка'}]})
+    result = validate_file(path)
+    assert result['valid']
+    assert messages(result['warnings']) == [(None, "Неизвестное поле теста: author"),
+                                            (1, "Неизвестное поле вопроса: hint")]
+
+
+def test_unreadable_files(tmp_path):
+    broken = tmp_path / 'broken.json'
+    broken.write_text('{"title": ', encoding='utf-8')
+    report = validate_files([str(broken), str(tmp_path / 'missing.json'),
+                             write_json(tmp_path / 'empty.json', {'title': 'Тест', 'questions': []})], workers=1)
+    assert report['invalid'] == 3
+    assert [result['questions'] for result in report['results']] == [None, None, 0]
+    assert report['results'][2]['errors'][0]['message'] == "Тест не содержит вопросов"
+
+
+def test_process_pool_keeps_order(tmp_path, monkeypatch):
+    monkeypatch.setattr(validation, 'MIN_FILES_FOR_POOL', 2)
+    paths = [write_json(tmp_path / f'{index}.json', {'title': 'Тест', 'questions': [
+        {'question': '1?', 'answer': '1'}] * (index % 2)}) for index in range(4)]
+    report = validate_files(paths, workers=2)
+    assert [result['test'] for result in report['results']] == paths
+    assert [result['valid'] for result in report['results']] == [False, True, False, True]